@@ -0,0 +1,312 @@
+"""
+Módulo de Fatoração de Inteiros construído sobre as ferramentas de primos.
+
+A fatoração escolhe o algoritmo pelo tamanho do número:
+
+1.  **Números pequenos** (abaixo de `SPF_TABLE_MAX_LIMIT`): uma tabela de
+    menor fator primo (SPF, *smallest prime factor*) é construída uma única
+    vez por crivo; fatorar um número se reduz a seguir a cadeia
+    `n → n / spf[n]`, em O(log n) consultas.
+2.  **Números grandes**: os fatores pequenos são extraídos por um `gcd`
+    com o produto dos primos até `TRIAL_DIVISION_LIMIT`; o que resta é
+    testado por Miller–Rabin e, se composto, quebrado pelo rho de Pollard
+    (variante de Brent), recursivamente.
+
+`factorize_many` fatora lotes de valores, opcionalmente distribuídos por um
+pool de processos, e `benchmark_factorization` mede a vazão para entradas
+de 32 e 64 bits.
+"""
+
+from __future__ import annotations
+import random
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from math import gcd, isqrt, prod
+from typing import Dict, Iterable, List, Optional, Sequence
+from python_sessions.concepts.algorithms.prime_number_utilities import (
+    miller_rabin,
+    sieve_of_eratosthenes
+)
+
+__author__ = 'Enock Silos'
+__email__ = 'init.caucasian722@passfwd.com'
+__status__ = 'Development'
+
+# Maior limite da tabela de menor fator primo (4 bytes por número: 16 MiB).
+SPF_TABLE_MAX_LIMIT = 1 << 22
+# Fatores primos abaixo deste valor são extraídos dos números grandes antes
+# do rho de Pollard.
+TRIAL_DIVISION_LIMIT = 1 << 12
+# Valores por tarefa do pool em `factorize_many`.
+DEFAULT_VALUES_PER_TASK = 1_000
+
+_TRIAL_DIVISION_PRIMES = tuple(sieve_of_eratosthenes(TRIAL_DIVISION_LIMIT))
+_TRIAL_DIVISION_PRODUCT = prod(_TRIAL_DIVISION_PRIMES)
+
+# Tabela de menor fator primo compartilhada pelo processo (0 indica primo).
+_SPF_TABLE: array = array('I')
+
+def smallest_prime_factor_table(limit: int) -> array:
+    """
+    Constrói a tabela de menor fator primo de todos os números abaixo de `limit`.
+
+    Os primos até a raiz quadrada de `limit` são percorridos em ordem
+    decrescente, e cada um marca os seus múltiplos (a partir do quadrado)
+    por atribuição de fatia. Como os primos menores escrevem por último, cada
+    posição termina com o menor fator primo do seu número — sem nenhum laço
+    Python por número.
+
+    Args:
+        limit (int): O limite superior (exclusivo).
+
+    Returns:
+        array: Um `array('I')` em que a posição `n` guarda o menor fator primo
+            de `n`, ou 0 se `n` for primo (ou menor que 2).
+    """
+    table = array('I', bytes(4 * max(limit, 0)))
+    for p in reversed(sieve_of_eratosthenes(isqrt(max(limit - 1, 0)) + 1)):
+        start = p * p
+        table[start::p] = array('I', [p]) * len(range(start, limit, p))
+    return table
+
+def _ensure_spf_table(limit: int) -> array:
+    """
+    Garante que a tabela compartilhada cubra todos os números abaixo de `limit`.
+
+    A tabela é reconstruída dobrando de tamanho, até `SPF_TABLE_MAX_LIMIT`.
+    """
+    global _SPF_TABLE
+    if len(_SPF_TABLE) < limit:
+        new_limit = min(max(limit, 2 * len(_SPF_TABLE), 1 << 16), SPF_TABLE_MAX_LIMIT)
+        _SPF_TABLE = smallest_prime_factor_table(new_limit)
+    return _SPF_TABLE
+
+def pollard_rho(number: int, rng: Optional[random.Random] = None) -> int:
+    """
+    Encontra um fator não trivial de um número composto (rho de Pollard-Brent).
+
+    A sequência `x → x² + c (mod n)` entra em um ciclo módulo cada fator
+    primo `p` após cerca de `sqrt(p)` passos. A variante de Brent detecta o
+    ciclo dobrando o comprimento da busca e acumula os produtos das
+    diferenças, calculando um único `gcd` a cada `128` passos. Se o lote
+    ultrapassar o fator, ele é refeito passo a passo; se a sequência falhar,
+    uma nova constante `c` é sorteada.
+
+    Args:
+        number (int): Um número composto maior que 3.
+        rng (Optional[random.Random], Optional): O gerador das sementes. Se
+            None, usa o gerador global do módulo `random`.
+
+    Returns:
+        int: Um fator de `number` estritamente entre 1 e `number`.
+    """
+    if number % 2 == 0:
+        return 2
+    generator = rng or random
+    batch = 128
+    while True:
+        y = generator.randrange(1, number)
+        c = generator.randrange(1, number)
+        g = r = q = 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % number
+            k = 0
+            while k < r and g == 1:
+                saved_y = y
+                for _ in range(min(batch, r - k)):
+                    y = (y * y + c) % number
+                    q = q * abs(x - y) % number
+                g = gcd(q, number)
+                k += batch
+            r *= 2
+
+        if g == number:
+            g = 1
+            while g == 1:
+                saved_y = (saved_y * saved_y + c) % number
+                g = gcd(abs(x - saved_y), number)
+        if g != number:
+            return g
+
+def factorize(number: int, rng: Optional[random.Random] = None) -> Dict[int, int]:
+    """
+    Decompõe um inteiro positivo em fatores primos.
+
+    Args:
+        number (int): O inteiro a ser fatorado.
+        rng (Optional[random.Random], Optional): O gerador usado pelo rho de
+            Pollard (o resultado não depende dele, apenas o tempo).
+
+    Returns:
+        Dict[int, int]: O expoente de cada fator primo, em ordem crescente
+            dos primos (`factorize(360)` é `{2: 3, 3: 2, 5: 1}`).
+
+    Raises:
+        ValueError: Se `number` não for positivo.
+    """
+    if number < 1:
+        raise ValueError('Apenas inteiros positivos podem ser fatorados.')
+    factors: Dict[int, int] = {}
+    if number < SPF_TABLE_MAX_LIMIT:
+        _factor_with_table(number, _ensure_spf_table(number + 1), factors)
+    else:
+        _factor_large(number, factors, rng)
+    return dict(sorted(factors.items()))
+
+def prime_factors(number: int) -> List[int]:
+    """
+    Retorna os fatores primos de um inteiro, repetidos conforme a multiplicidade.
+
+    Args:
+        number (int): O inteiro a ser fatorado.
+
+    Returns:
+        List[int]: Os fatores em ordem crescente (`prime_factors(360)` é
+            `[2, 2, 2, 3, 3, 5]`).
+
+    Raises:
+        ValueError: Se `number` não for positivo.
+    """
+    return [p for p, exponent in factorize(number).items() for _ in range(exponent)]
+
+def _factor_with_table(number: int, table: array, factors: Dict[int, int]) -> None:
+    """
+    Fatora um número coberto pela tabela de menor fator primo.
+    """
+    while number > 1:
+        p = table[number] or number
+        factors[p] = factors.get(p, 0) + 1
+        number //= p
+
+def _factor_large(number: int, factors: Dict[int, int], rng: Optional[random.Random]) -> None:
+    """
+    Fatora um número grande: fatores pequenos por `gcd`, o resto por Pollard.
+    """
+    small = gcd(number, _TRIAL_DIVISION_PRODUCT)
+    if small > 1:
+        for p in _TRIAL_DIVISION_PRIMES:
+            if small % p == 0:
+                while number % p == 0:
+                    factors[p] = factors.get(p, 0) + 1
+                    number //= p
+
+    pending = [number]
+    while pending:
+        value = pending.pop()
+        if value == 1:
+            continue
+        if value < SPF_TABLE_MAX_LIMIT and len(_SPF_TABLE) > value:
+            _factor_with_table(value, _SPF_TABLE, factors)
+        elif miller_rabin(value):
+            factors[value] = factors.get(value, 0) + 1
+        else:
+            root = isqrt(value)
+            divisor = root if root * root == value else pollard_rho(value, rng)
+            pending.extend((divisor, value // divisor))
+
+def _initialize_factorization_worker(table_limit: int) -> None:
+    """
+    Constrói a tabela de menor fator primo no processo trabalhador.
+    """
+    if table_limit:
+        _ensure_spf_table(table_limit)
+
+def _factorize_batch(values: Sequence[int]) -> List[Dict[int, int]]:
+    """
+    Fatora um lote de valores.
+    """
+    return [factorize(value) for value in values]
+
+def factorize_many(
+    values: Iterable[int],
+    *,
+    workers: int = 1,
+    values_per_task: int = DEFAULT_VALUES_PER_TASK
+) -> List[Dict[int, int]]:
+    """
+    Fatora muitos valores, opcionalmente em paralelo.
+
+    A tabela de menor fator primo é construída uma única vez (por processo)
+    até o maior valor pequeno do lote, de modo que os valores pequenos custam
+    apenas algumas consultas cada. Com `workers > 1`, os valores são
+    divididos em tarefas de `values_per_task` e distribuídos por um
+    `ProcessPoolExecutor`; os resultados retornam na ordem de entrada.
+
+    Args:
+        values (Iterable[int]): Os inteiros positivos a serem fatorados.
+        workers (int, Optional): O número de processos. Padrão é 1.
+        values_per_task (int, Optional): Os valores por tarefa do pool.
+
+    Returns:
+        List[Dict[int, int]]: A fatoração de cada valor, na ordem de entrada.
+
+    Raises:
+        ValueError: Se algum valor não for positivo.
+    """
+    values = list(values)
+    if any(value < 1 for value in values):
+        raise ValueError('Apenas inteiros positivos podem ser fatorados.')
+    small_values = [value for value in values if value < SPF_TABLE_MAX_LIMIT]
+    table_limit = max(small_values) + 1 if small_values else 0
+
+    tasks = [values[i:i + values_per_task] for i in range(0, len(values), values_per_task)]
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_initialize_factorization_worker,
+            initargs=(table_limit,)
+        ) as executor:
+            batches = list(executor.map(_factorize_batch, tasks))
+    else:
+        _initialize_factorization_worker(table_limit)
+        batches = [_factorize_batch(task) for task in tasks]
+    return [factors for batch in batches for factors in batch]
+
+def benchmark_factorization(count: int = 1_000, seed: int = 42) -> Dict[str, float]:
+    """
+    Mede a vazão da fatoração, em valores por segundo.
+
+    Quatro distribuições são medidas: valores cobertos pela tabela de menor
+    fator primo, valores aleatórios de 32 e de 64 bits, e semiprimos de 64
+    bits (produtos de dois primos de 32 bits, o pior caso do rho de Pollard,
+    medido com um décimo dos valores).
+
+    Args:
+        count (int, Optional): A quantidade de valores por distribuição.
+        seed (int, Optional): A semente do gerador dos valores.
+
+    Returns:
+        Dict[str, float]: A vazão de cada distribuição.
+    """
+    rng = random.Random(seed)
+
+    def random_prime(bits: int) -> int:
+        while True:
+            candidate = rng.getrandbits(bits) | (1 << (bits - 1)) | 1
+            if miller_rabin(candidate):
+                return candidate
+
+    distributions = {
+        'table': [rng.randrange(2, SPF_TABLE_MAX_LIMIT) for _ in range(count)],
+        '32_bit': [rng.randrange(2, 1 << 32) for _ in range(count)],
+        '64_bit': [rng.randrange(2, 1 << 64) for _ in range(count)],
+        'semiprime_64_bit': [random_prime(32) * random_prime(32) for _ in range(max(count // 10, 1))],
+    }
+    _ensure_spf_table(SPF_TABLE_MAX_LIMIT)
+
+    results: Dict[str, float] = {}
+    for name, values in distributions.items():
+        start = time.perf_counter()
+        for value in values:
+            factorize(value, rng)
+        results[name] = len(values) / (time.perf_counter() - start)
+    return results
+
+if __name__ == '__main__':
+    for example in (360, 600_851_475_143, 2 ** 64 - 1, (2 ** 31 - 1) * (2 ** 61 - 1)):
+        print(f'{example} = {factorize(example)}')
+    for name, rate in benchmark_factorization().items():
+        print(f'  {name:<18} {rate:12.0f} valores/s')
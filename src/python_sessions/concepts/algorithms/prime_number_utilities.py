@@ -9,6 +9,19 @@ de apresentação e controle.
 
 Funcionalidades Principais:
 -   `is_prime`: Uma função pura e otimizada para a verificação de primalidade.
+-   `miller_rabin`: O teste de Miller–Rabin, determinístico abaixo de 2^64 e
+     probabilístico (com rodadas configuráveis) acima, usado automaticamente
+     por `is_prime` para números grandes.
+-   `sieve_of_eratosthenes`: O crivo clássico sobre um `bytearray` de ímpares.
+-   `is_prime_many`: A verificação em lote de milhões de valores, por crivo
+     (valores densos) ou Miller–Rabin vetorizado com NumPy (valores esparsos).
+-   `iter_primes`: Um crivo segmentado que entrega os primos de um intervalo
+     (ou de uma sequência infinita) em segmentos do tamanho do cache.
+-   `primes_in_range`, `count_primes` e `prime_pi`: A geração e a contagem
+     de primos em intervalos, com as fatias distribuídas por um pool de
+     processos.
+-   `PrimeTable`: Uma tabela de primos compartilhada, ampliada sob demanda e
+     persistível em disco (aberta por `mmap` nas execuções seguintes).
 -   `generate_primes`: Um gerador de avaliação preguiçosa para a produção
      eficiente de uma sequência infinita de primos.
 -   `main`: Orquestra uma interface de menu (REPL) que permite ao usuário
@@ -20,20 +33,86 @@ a clareza arquitetônica e a experiência do usuário.
 """
 
 from __future__ import annotations
-from math import sqrt
-from typing import Iterator, Optional
-from itertools import islice
+import mmap
+import os
+import random
+import struct
+import sys
+import time
+from array import array
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from math import gcd, isqrt, prod
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+from itertools import compress, islice
+from pathlib import Path
 from python_sessions.utils.input_handlers import (
     get_valid_integer_from_user,
     cli_pause
 )
 
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: sem ele, usa-se o caminho em Python puro.
+    np = None
+
 __author__ = 'Enock Silos'
 __email__ = 'init.caucasian722@passfwd.com'
 __status__ = 'Production'
 
 PADDING_WIDTH = 4
 COLUMNS_PER_LINE = 15
+# Números cobertos por segmento do crivo. Como apenas os ímpares são
+# representados, cada segmento ocupa um `bytearray` de 128 KiB, que cabe
+# no cache L2 da maioria dos processadores. Para limites grandes, o
+# segmento é ampliado proporcionalmente à raiz quadrada do limite (ver
+# `_minimum_segment_size`).
+DEFAULT_SEGMENT_SIZE = 1 << 18
+# Números cobertos por tarefa do pool em `primes_in_range` e `count_primes`.
+DEFAULT_CHUNK_SIZE = 1 << 24
+# Limites da tabela de primos compartilhada: o primeiro limite ao ser
+# ampliada, o limite a partir do qual `generate_primes` deixa de ampliá-la
+# (~7,3 milhões de primos, ~56 MiB) e o limite da tabela persistida.
+PRIME_TABLE_INITIAL_LIMIT = 1 << 16
+PRIME_TABLE_MAX_LIMIT = 1 << 27
+PERSISTED_PRIME_TABLE_LIMIT = 1 << 27
+# Caminho padrão, assinatura e versão do arquivo da tabela de primos.
+DEFAULT_PRIME_TABLE_PATH = Path('primes.bin')
+PRIME_TABLE_MAGIC: bytes = b'PSPRIM01'
+# A partir deste valor, `is_prime` troca a divisão por tentativa pelo
+# teste de Miller–Rabin, que já é mais rápido a partir de ~10^3.
+MILLER_RABIN_THRESHOLD = 1 << 10
+# Rodadas padrão do Miller–Rabin probabilístico (erro < 4 ** -rounds).
+DEFAULT_MILLER_RABIN_ROUNDS = 40
+# Primos pequenos do pré-filtro: um único `gcd` com o seu produto descarta
+# a maioria dos compostos antes de qualquer exponenciação modular.
+SMALL_PRIMES: Tuple[int, ...] = (
+    2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67,
+    71, 73, 79, 83, 89, 97, 101, 103, 107, 109, 113, 127, 131, 137, 139, 149,
+    151, 157, 163, 167, 173, 179, 181, 191, 193, 197, 199
+)
+_SMALL_PRIMES_PRODUCT = prod(SMALL_PRIMES)
+# `is_prime_many` crivar até o maior valor quando ele não excede este
+# múltiplo da quantidade de valores (nem `DENSE_SIEVE_LIMIT`): crivar custa
+# dezenas de nanossegundos por número, e um Miller–Rabin, microssegundos.
+DENSITY_FACTOR = 64
+DENSE_SIEVE_LIMIT = 1 << 28
+# Bases que tornam o Miller–Rabin determinístico abaixo de 4.759.123.141
+# (portanto, para todo inteiro de 32 bits).
+_WITNESSES_32_BIT: Tuple[int, ...] = (2, 7, 61)
+# Limites abaixo dos quais as primeiras k bases primas tornam o
+# Miller–Rabin determinístico (Jaeschke; Zhang e Tang; Sorenson e Webster).
+_DETERMINISTIC_BOUNDS: Tuple[Tuple[int, int], ...] = (
+    (2_047, 1),
+    (1_373_653, 2),
+    (25_326_001, 3),
+    (3_215_031_751, 4),
+    (2_152_302_898_747, 5),
+    (3_474_749_660_383, 6),
+    (341_550_071_728_321, 7),
+    (3_825_123_056_546_413_051, 9),
+    (318_665_857_834_031_151_167_461, 12),
+)
 
 def is_prime(number: int) -> bool:
     """
@@ -58,7 +137,8 @@ def is_prime(number: int) -> bool:
     A iteração prossegue sob duas otimizações cruciais:
 
     a) Limite do Espaço de Busca: A iteração de `divisor` ocorre apenas até
-       a raiz qudrada de `number`. Este limite baseia-se no teorema 
+       a raiz quadrada inteira de `number` (`math.isqrt`), calculada uma
+       única vez antes do laço. Este limite baseia-se no teorema 
        fundamental de que, se um número `n` é composto (i.e., n = a * b),
        então pelo menos um de seus fatores (`a` ou `b`) deve ser menor ou
        igual a `sqrt`. Testar divisores além deste ponto é computacionalmente
@@ -74,6 +154,13 @@ def is_prime(number: int) -> bool:
     Se nenhum divisor for encontrado até o limite da raiz quadrada, o número
     é conclusivamente determinado como primo.
 
+    Números já cobertos pela tabela de primos compartilhada (`PrimeTable`)
+    são respondidos por busca binária, sem nenhuma divisão. Como a divisão
+    por tentativa é O(sqrt n), números a partir de
+    `MILLER_RABIN_THRESHOLD` são delegados a `miller_rabin`, que é exato
+    para todo inteiro de 64 bits e custa apenas algumas exponenciações
+    modulares.
+
     Args:
         number (int): O inteiro a ser avaliado para primalidade.
 
@@ -87,14 +174,765 @@ def is_prime(number: int) -> bool:
         return True
     if number % 2 == 0:
         return False
+    if number < _PRIME_TABLE.limit:
+        return number in _PRIME_TABLE
+    if number >= MILLER_RABIN_THRESHOLD:
+        return miller_rabin(number)
 
     divisor = 3
-    while divisor <= int(sqrt(number)):
+    limit = isqrt(number)
+    while divisor <= limit:
         if number % divisor == 0:
             return False
         divisor += 2
     return True
 
+def miller_rabin(
+    number: int,
+    rounds: int = DEFAULT_MILLER_RABIN_ROUNDS,
+    rng: Optional[random.Random] = None
+) -> bool:
+    """
+    Testa a primalidade de um inteiro pelo algoritmo de Miller–Rabin.
+
+    Escrevendo `number - 1 = d * 2^s` com `d` ímpar, cada base `a` é uma
+    testemunha de que `number` é composto se `a^d ≢ 1` e `a^(d * 2^r) ≢ -1`
+    (mod `number`) para todo `0 <= r < s`. Um primo nunca tem testemunhas;
+    um composto tem testemunhas em pelo menos 3/4 das bases.
+
+    1.  Pré-filtro: um `gcd` com o produto de `SMALL_PRIMES` descarta os
+        compostos com fatores pequenos (e decide os próprios primos pequenos).
+    2.  Abaixo de ~3,19 * 10^23 (o que inclui todo inteiro de 64 bits), um
+        conjunto fixo das primeiras bases primas é comprovadamente
+        suficiente: o resultado é exato.
+    3.  Acima disso, `rounds` bases aleatórias são sorteadas, e a
+        probabilidade de aceitar um composto é menor que `4 ** -rounds`.
+
+    Args:
+        number (int): O inteiro a ser avaliado.
+        rounds (int, Optional): As rodadas do teste probabilístico.
+        rng (Optional[random.Random], Optional): O gerador das bases
+            aleatórias. Se None, usa o gerador global do módulo `random`.
+
+    Returns:
+        bool: `True` se `number` for primo (com certeza abaixo de ~3,19 * 10^23),
+              e `False` caso contrário.
+
+    Raises:
+        ValueError: Se `rounds` for menor que 1.
+    """
+    if rounds < 1:
+        raise ValueError('O número de rodadas deve ser positivo.')
+    if number < 2:
+        return False
+    if gcd(number, _SMALL_PRIMES_PRODUCT) != 1:
+        return number in SMALL_PRIMES
+    if number < SMALL_PRIMES[-1] ** 2:
+        return True
+
+    d = number - 1
+    s = (d & -d).bit_length() - 1
+    d >>= s
+
+    for bound, count in _DETERMINISTIC_BOUNDS:
+        if number < bound:
+            witnesses = SMALL_PRIMES[:count]
+            break
+    else:
+        generator = rng or random
+        witnesses = tuple(generator.randrange(2, number - 1) for _ in range(rounds))
+
+    for witness in witnesses:
+        x = pow(witness, d, number)
+        if x == 1 or x == number - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % number
+            if x == number - 1:
+                break
+        else:
+            return False
+    return True
+
+def sieve_of_eratosthenes(limit: int) -> List[int]:
+    """
+    Retorna todos os primos menores que `limit` pelo Crivo de Eratóstenes.
+
+    Apenas os ímpares são representados: a posição `i` do `bytearray`
+    corresponde ao número `2 * i + 1`, o que reduz a memória e o trabalho
+    pela metade. Os múltiplos de cada primo `p` são eliminados a partir de
+    `p * p`, com passo `2 * p`, por uma única atribuição de fatia — executada
+    em C, sem laço Python por múltiplo.
+
+    Args:
+        limit (int): O limite superior (exclusivo).
+
+    Returns:
+        List[int]: Os primos em `[2, limit)`, em ordem crescente.
+    """
+    if limit <= 2:
+        return []
+    return [2, *compress(range(1, limit, 2), _odd_sieve_flags(limit))]
+
+def _odd_sieve_flags(limit: int) -> bytearray:
+    """
+    Crivo de Eratóstenes sobre os ímpares menores que `limit`.
+
+    Args:
+        limit (int): O limite superior (exclusivo), maior que 2.
+
+    Returns:
+        bytearray: A posição `i` vale 1 se `2 * i + 1` for primo.
+    """
+    size = limit // 2
+    flags = bytearray([1]) * size
+    flags[0] = 0
+    for i in range(1, (isqrt(limit - 1) - 1) // 2 + 1):
+        if flags[i]:
+            p = 2 * i + 1
+            start = p * p // 2
+            flags[start::p] = bytes(len(range(start, size, p)))
+    return flags
+
+def is_prime_many(values: Iterable[int]) -> List[bool]:
+    """
+    Verifica a primalidade de muitos valores de uma só vez.
+
+    A estratégia é escolhida pela distribuição dos valores:
+
+    1.  **Densos** (maior valor até `DENSITY_FACTOR` vezes a quantidade de
+        valores, e até `DENSE_SIEVE_LIMIT`): um único crivo até o maior
+        valor é construído, e cada verificação vira uma consulta a um
+        `bytearray` — vetorizada por indexação com NumPy, se disponível.
+    2.  **Esparsos**: com NumPy, os valores de 64 bits passam por um
+        pré-filtro de primos pequenos executado sobre o vetor inteiro, e os
+        sobreviventes de 32 bits, por um Miller–Rabin determinístico (bases
+        2, 7 e 61) também vetorizado, com exponenciação modular em `uint64`.
+        Os demais valores, e todos eles quando NumPy não está instalado,
+        usam `is_prime`.
+
+    Args:
+        values (Iterable[int]): Os inteiros a serem avaliados.
+
+    Returns:
+        List[bool]: A primalidade de cada valor, na ordem de entrada.
+    """
+    values = values if isinstance(values, Sequence) else list(values)
+    if not values:
+        return []
+    largest = max(values)
+    if largest < 2:
+        return [False] * len(values)
+
+    if largest <= DENSE_SIEVE_LIMIT and largest <= DENSITY_FACTOR * len(values):
+        return _is_prime_many_dense(values, largest)
+    if np is not None:
+        return _is_prime_many_vectorized(values)
+    return [is_prime(value) for value in values]
+
+def _is_prime_many_dense(values: Sequence[int], largest: int) -> List[bool]:
+    """
+    Responde por consulta a um crivo até o maior valor.
+    """
+    flags = _odd_sieve_flags(max(largest + 1, 3))
+    if np is not None:
+        array = np.asarray(values, dtype=np.int64)
+        table = np.frombuffer(flags, dtype=np.uint8).view(np.bool_)
+        odd = (array & 1).astype(np.bool_) & (array > 0)
+        result = array == 2
+        result[odd] = table[array[odd] >> 1]
+        return result.tolist()
+    return [
+        value == 2 or (value > 2 and value & 1 == 1 and flags[value >> 1] == 1)
+        for value in values
+    ]
+
+def _is_prime_many_vectorized(values: Sequence[int]) -> List[bool]:
+    """
+    Pré-filtro e Miller–Rabin vetorizados com NumPy.
+
+    Os valores de 64 bits passam pelo pré-filtro de primos pequenos sobre o
+    vetor inteiro; dos sobreviventes, os de 32 bits são decididos por
+    `_miller_rabin_vector`, e os demais, por `miller_rabin`. Valores fora de
+    `[0, 2^64)` são verificados individualmente.
+    """
+    result = [False] * len(values)
+    word_positions: List[int] = []
+    for position, value in enumerate(values):
+        if 0 <= value < 1 << 64:
+            word_positions.append(position)
+        elif value > 0:
+            result[position] = is_prime(value)
+    if not word_positions:
+        return result
+
+    numbers = np.fromiter((values[i] for i in word_positions), dtype=np.uint64, count=len(word_positions))
+    prime = np.isin(numbers, np.array(SMALL_PRIMES, dtype=np.uint64))
+    pending = numbers > SMALL_PRIMES[-1]
+    for p in SMALL_PRIMES:
+        pending &= numbers % np.uint64(p) != 0
+    prime |= pending & (numbers < SMALL_PRIMES[-1] ** 2)
+    pending &= numbers >= SMALL_PRIMES[-1] ** 2
+
+    narrow = pending & (numbers < np.uint64(1 << 32))
+    if narrow.any():
+        prime[narrow] = _miller_rabin_vector(numbers[narrow])
+    for index in np.flatnonzero(pending & ~narrow).tolist():
+        prime[index] = miller_rabin(values[word_positions[index]])
+
+    for position, is_prime_value in zip(word_positions, prime.tolist()):
+        result[position] = is_prime_value
+    return result
+
+def _miller_rabin_vector(numbers: np.ndarray) -> np.ndarray:
+    """
+    Miller–Rabin determinístico sobre um vetor de ímpares de 32 bits.
+
+    Como os módulos são menores que 2^32, todo produto de dois resíduos cabe
+    em `uint64`, e a exponenciação modular pode ser feita elemento a
+    elemento, para o vetor inteiro, a cada passo do laço binário.
+
+    Args:
+        numbers (np.ndarray): Ímpares maiores que 199², em `uint64`.
+
+    Returns:
+        np.ndarray: Um vetor booleano com a primalidade de cada número.
+    """
+    one = np.uint64(1)
+    minus_one = numbers - one
+    d = minus_one.copy()
+    s = np.zeros_like(numbers)
+    even = (d & one) == 0
+    while even.any():
+        d[even] >>= one
+        s[even] += one
+        even = (d & one) == 0
+
+    prime = np.ones(numbers.shape, dtype=np.bool_)
+    for witness in _WITNESSES_32_BIT:
+        x = np.ones_like(numbers)
+        base = np.full_like(numbers, witness) % numbers
+        exponent = d.copy()
+        while exponent.any():
+            odd = (exponent & one) == one
+            x[odd] = x[odd] * base[odd] % numbers[odd]
+            base = base * base % numbers
+            exponent >>= one
+
+        passed = (x == one) | (x == minus_one)
+        for round_number in range(1, int(s.max())):
+            x = x * x % numbers
+            passed |= (x == minus_one) & (s > round_number)
+        prime &= passed
+    return prime
+
+def iter_primes(
+    start: int = 2,
+    stop: Optional[int] = None,
+    *,
+    segment_size: int = DEFAULT_SEGMENT_SIZE
+) -> Iterator[int]:
+    """
+    Gera os primos em `[start, stop)` por um crivo segmentado.
+
+    Em vez de crivar o intervalo inteiro de uma vez, o crivo processa
+    segmentos consecutivos de `segment_size` números. Cada segmento é
+    crivado apenas pelos primos-base (até a raiz quadrada do seu limite
+    superior), que são obtidos por `sieve_of_eratosthenes` e ampliados sob
+    demanda. A memória permanece limitada ao tamanho do segmento, o que
+    permite percorrer intervalos arbitrariamente longos — ou infinitos,
+    quando `stop` é None. O segmento é ampliado conforme os primos-base
+    crescem (ver `_minimum_segment_size`): do contrário, percorrer todos os
+    primos-base a cada segmento dominaria o custo do crivo.
+
+    Args:
+        start (int, Optional): O início do intervalo (inclusivo). Padrão é 2.
+        stop (Optional[int], Optional): O fim do intervalo (exclusivo). Se
+            None, a sequência é infinita.
+        segment_size (int, Optional): O mínimo de números cobertos por
+            segmento.
+
+    Yields:
+        Iterator[int]: Os primos do intervalo, em ordem crescente.
+
+    Raises:
+        ValueError: Se `segment_size` for menor que 2.
+    """
+    if segment_size < 2:
+        raise ValueError('O tamanho do segmento deve ser de pelo menos 2.')
+    segment_size += segment_size % 2
+    if start <= 2 and (stop is None or stop > 2):
+        yield 2
+    low = max(start, 3) | 1
+    base_primes: List[int] = []
+    base_limit = 0
+
+    while stop is None or low < stop:
+        high = low + segment_size if stop is None else min(low + segment_size, stop)
+        root = isqrt(high - 1)
+        if root > base_limit:
+            base_limit = max(root, 2 * base_limit)
+            base_primes = sieve_of_eratosthenes(base_limit + 1)[1:]
+            segment_size = _minimum_segment_size(segment_size, base_limit * base_limit)
+
+        flags = _sieve_segment(low, high, base_primes)
+        yield from compress(range(low, high, 2), flags)
+        low += 2 * len(flags)
+
+def _minimum_segment_size(segment_size: int, stop: int) -> int:
+    """
+    Amplia o segmento proporcionalmente à raiz quadrada de `stop`.
+
+    Cada segmento percorre todos os primos-base até a raiz quadrada do seu
+    limite superior (~27 mil perto de 10^11); com segmentos da ordem dessa
+    raiz ou menores, a maior parte dos primos-base marca poucos múltiplos e
+    o laço sobre eles passa a dominar o custo. Por isso, o segmento cobre
+    pelo menos oito vezes a raiz (2^22 números, ou 2 MiB, perto de 10^11).
+
+    Args:
+        segment_size (int): O tamanho de segmento pedido, par.
+        stop (int): O limite superior do intervalo crivado.
+
+    Returns:
+        int: O maior entre `segment_size` e oito vezes a raiz quadrada de
+            `stop`, arredondada para cima até uma potência de dois.
+    """
+    reach = 8 * isqrt(max(stop - 1, 0))
+    return max(segment_size, 1 << (reach - 1).bit_length()) if reach > 1 else segment_size
+
+def _sieve_segment(low: int, high: int, base_primes: Sequence[int]) -> bytearray:
+    """
+    Crivo dos ímpares de um segmento `[low, high)`.
+
+    Args:
+        low (int): O início do segmento, ímpar e maior que 2.
+        high (int): O fim do segmento (exclusivo).
+        base_primes (Sequence[int]): Os primos ímpares em ordem crescente,
+            cobrindo pelo menos até a raiz quadrada de `high - 1`.
+
+    Returns:
+        bytearray: A posição `i` vale 1 se `low + 2 * i` for primo.
+    """
+    size = (high - low + 1) // 2
+    flags = bytearray([1]) * size
+    for p in base_primes:
+        if p * p >= high:
+            break
+        first = max(p * p, (low + p - 1) // p * p)
+        if first % 2 == 0:
+            first += p
+        index = (first - low) // 2
+        flags[index::p] = bytes(len(range(index, size, p)))
+    return flags
+
+# Primos-base compartilhados por cada processo trabalhador, recebidos uma
+# única vez pelo inicializador do pool. O caminho serial não usa esta
+# variável: chamadas simultâneas em threads sobrescreveriam umas às outras.
+_WORKER_BASE_PRIMES: Sequence[int] = ()
+
+def _initialize_prime_worker(base_primes: array) -> None:
+    """
+    Instala os primos-base no processo trabalhador.
+    """
+    global _WORKER_BASE_PRIMES
+    _WORKER_BASE_PRIMES = base_primes
+
+def _sieve_chunk(
+    task: Tuple[int, int, int, bool],
+    base_primes: Optional[Sequence[int]] = None
+) -> Union[int, List[int]]:
+    """
+    Crivo de uma fatia `[low, high)` em segmentos de `segment_size` números.
+
+    Args:
+        task: Uma tupla `(low, high, segment_size, count_only)`, com `low`
+            ímpar e maior que 2.
+        base_primes (Optional[Sequence[int]], Optional): Os primos-base. Se
+            None, usa os instalados no processo trabalhador do pool.
+
+    Returns:
+        Union[int, List[int]]: A quantidade de primos da fatia, se
+            `count_only`, ou os próprios primos, em ordem crescente.
+    """
+    low, high, segment_size, count_only = task
+    if base_primes is None:
+        base_primes = _WORKER_BASE_PRIMES
+    count = 0
+    primes: List[int] = []
+    while low < high:
+        segment_high = min(low + segment_size, high)
+        flags = _sieve_segment(low, segment_high, base_primes)
+        if count_only:
+            count += flags.count(1)
+        else:
+            primes.extend(compress(range(low, segment_high, 2), flags))
+        low += 2 * len(flags)
+    return count if count_only else primes
+
+def _sieve_range_in_chunks(
+    start: int,
+    stop: int,
+    count_only: bool,
+    workers: int,
+    chunk_size: int,
+    segment_size: int
+) -> List[Union[int, List[int]]]:
+    """
+    Divide `[start, stop)` em fatias e as crivam, em ordem, em um pool.
+
+    Os primos-base (até a raiz quadrada de `stop - 1`) são calculados uma
+    única vez e entregues a cada processo pelo inicializador do pool, como
+    um `array` compacto, em vez de acompanharem cada tarefa; no caminho
+    serial, são passados diretamente a `_sieve_chunk`. O segmento é
+    ampliado por `_minimum_segment_size`.
+
+    Returns:
+        List[Union[int, List[int]]]: O resultado de `_sieve_chunk` para cada
+            fatia, na ordem do intervalo (o primo 2 não é incluído).
+    """
+    if chunk_size < 2 or segment_size < 2:
+        raise ValueError('Os tamanhos da fatia e do segmento devem ser de pelo menos 2.')
+    chunk_size += chunk_size % 2
+    segment_size = _minimum_segment_size(segment_size + segment_size % 2, stop)
+
+    low = max(start, 3) | 1
+    tasks = [
+        (chunk_low, min(chunk_low + chunk_size, stop), segment_size, count_only)
+        for chunk_low in range(low, stop, chunk_size)
+    ]
+    base_primes = array('Q', sieve_of_eratosthenes(isqrt(max(stop - 1, 0)) + 1)[1:])
+
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_initialize_prime_worker,
+            initargs=(base_primes,)
+        ) as executor:
+            return list(executor.map(_sieve_chunk, tasks))
+    return [_sieve_chunk(task, base_primes) for task in tasks]
+
+def primes_in_range(
+    start: int,
+    stop: int,
+    *,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    segment_size: int = DEFAULT_SEGMENT_SIZE
+) -> List[int]:
+    """
+    Retorna os primos em `[start, stop)`, crivando fatias em paralelo.
+
+    Args:
+        start (int): O início do intervalo (inclusivo).
+        stop (int): O fim do intervalo (exclusivo).
+        workers (int, Optional): O número de processos. Padrão é 1.
+        chunk_size (int, Optional): Os números cobertos por tarefa do pool.
+        segment_size (int, Optional): O mínimo de números cobertos por
+            segmento do crivo.
+
+    Returns:
+        List[int]: Os primos do intervalo, em ordem crescente.
+
+    Raises:
+        ValueError: Se `chunk_size` ou `segment_size` for menor que 2.
+    """
+    primes = [2] if start <= 2 < stop else []
+    for chunk_primes in _sieve_range_in_chunks(start, stop, False, workers, chunk_size, segment_size):
+        primes.extend(chunk_primes)
+    return primes
+
+def count_primes(
+    start: int,
+    stop: int,
+    *,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    segment_size: int = DEFAULT_SEGMENT_SIZE
+) -> int:
+    """
+    Conta os primos em `[start, stop)` sem materializá-los.
+
+    Cada segmento é contado com `bytearray.count`, em C, e apenas um inteiro
+    por fatia retorna dos processos trabalhadores — o que torna a contagem
+    limitada pelo crivo e quase linear no número de núcleos.
+
+    Args:
+        start (int): O início do intervalo (inclusivo).
+        stop (int): O fim do intervalo (exclusivo).
+        workers (int, Optional): O número de processos. Padrão é 1.
+        chunk_size (int, Optional): Os números cobertos por tarefa do pool.
+        segment_size (int, Optional): O mínimo de números cobertos por
+            segmento do crivo.
+
+    Returns:
+        int: A quantidade de primos do intervalo.
+
+    Raises:
+        ValueError: Se `chunk_size` ou `segment_size` for menor que 2.
+    """
+    counts = _sieve_range_in_chunks(start, stop, True, workers, chunk_size, segment_size)
+    return int(start <= 2 < stop) + sum(counts)
+
+def prime_pi(number: int, *, workers: int = 1) -> int:
+    """
+    Calcula π(n), a quantidade de primos menores ou iguais a `number`.
+
+    Args:
+        number (int): O limite (inclusivo).
+        workers (int, Optional): O número de processos. Padrão é 1.
+
+    Returns:
+        int: π(number).
+    """
+    return count_primes(0, number + 1, workers=workers)
+
+class PrimeTable:
+    """
+    Tabela crescente e persistente de todos os primos menores que `limit`.
+
+    A tabela é um vetor compacto (`array('Q')`, 8 bytes por primo) ampliado
+    sob demanda por crivo segmentado. Cada ampliação ao menos dobra o
+    limite, de modo que o custo total é amortizado: uma sequência de
+    consultas crescentes crivar cada número uma única vez. Como os primos
+    estão ordenados, a pertença é decidida por busca binária (`bisect`).
+
+    A tabela pode ser salva em disco e reaberta por `mmap`: o sistema
+    operacional carrega as páginas sob demanda, e milhões de primos ficam
+    disponíveis instantaneamente na execução seguinte.
+
+    Atributos:
+        limit (int): Todos os primos menores que este valor estão na tabela.
+    """
+
+    def __init__(self, limit: int = 2) -> None:
+        """
+        Constrói a tabela com os primos menores que `limit`.
+
+        Args:
+            limit (int, Optional): O limite inicial (exclusivo). Padrão é 2
+                (tabela vazia, ampliada na primeira consulta).
+        """
+        self.limit = max(limit, 2)
+        self._primes: Sequence[int] = array('Q', sieve_of_eratosthenes(self.limit))
+        self._mapping: Optional[mmap.mmap] = None
+
+    def __len__(self) -> int:
+        """
+        Retorna a quantidade de primos já tabelados.
+        """
+        return len(self._primes)
+
+    def __getitem__(self, index: int) -> int:
+        """
+        Retorna o primo tabelado na posição `index` (o primeiro é 2).
+        """
+        return self._primes[index]
+
+    def __contains__(self, number: object) -> bool:
+        """
+        Verifica a primalidade por busca binária, ampliando a tabela se preciso.
+
+        A tabela só é ampliada até `PRIME_TABLE_MAX_LIMIT`; números acima
+        desse limite (e do limite atual) são testados por `miller_rabin`,
+        em vez de crivar — e alocar — todos os primos até eles.
+        """
+        if not isinstance(number, int):
+            return False
+        if number >= max(self.limit, PRIME_TABLE_MAX_LIMIT):
+            return miller_rabin(number)
+        self.extend_to(number + 1)
+        position = bisect_left(self._primes, number)
+        return position < len(self._primes) and self._primes[position] == number
+
+    def extend_to(self, limit: int) -> None:
+        """
+        Garante que a tabela contenha todos os primos menores que `limit`.
+
+        Se o limite atual não bastar, a tabela é ampliada para o maior entre
+        `limit`, o dobro do limite atual e `PRIME_TABLE_INITIAL_LIMIT`.
+        Uma tabela aberta por `mmap` é antes copiada para a memória.
+
+        Args:
+            limit (int): O limite desejado (exclusivo).
+        """
+        if limit <= self.limit:
+            return
+        new_limit = max(limit, 2 * self.limit, PRIME_TABLE_INITIAL_LIMIT)
+        if not isinstance(self._primes, array):
+            self._primes = array('Q', self._primes)
+            self._release_mapping()
+        self._primes.extend(primes_in_range(self.limit, new_limit))
+        self.limit = new_limit
+
+    def nth(self, index: int) -> int:
+        """
+        Retorna o primo de posição `index`, ampliando a tabela se preciso.
+
+        Args:
+            index (int): A posição, a partir de 0 (`nth(0)` é 2).
+
+        Returns:
+            int: O primo correspondente.
+        """
+        while len(self._primes) <= index:
+            self.extend_to(2 * self.limit)
+        return self._primes[index]
+
+    def slice(self, start: int, stop: int) -> Sequence[int]:
+        """
+        Retorna os primos tabelados nas posições `[start, stop)`, sem ampliar a tabela.
+
+        Args:
+            start (int): A posição inicial (inclusiva).
+            stop (int): A posição final (exclusiva).
+
+        Returns:
+            Sequence[int]: Uma fatia da tabela.
+        """
+        return self._primes[start:stop]
+
+    def primes_below(self, limit: int) -> Sequence[int]:
+        """
+        Retorna todos os primos menores que `limit`.
+
+        Args:
+            limit (int): O limite (exclusivo).
+
+        Returns:
+            Sequence[int]: Uma fatia da tabela, em ordem crescente.
+        """
+        self.extend_to(limit)
+        return self._primes[:bisect_left(self._primes, limit)]
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """
+        Serializa a tabela em disco.
+
+        O formato é a assinatura `PRIME_TABLE_MAGIC`, o limite e a quantidade
+        de primos (inteiros de 64 bits little-endian) e os primos como
+        inteiros de 64 bits little-endian. A escrita é feita em um arquivo
+        temporário renomeado ao final, para que um leitor concorrente nunca
+        encontre uma tabela pela metade.
+
+        Args:
+            path (str | os.PathLike[str]): O caminho do arquivo.
+        """
+        primes = self._primes if isinstance(self._primes, array) else array('Q', self._primes)
+        if sys.byteorder != 'little':
+            primes = array('Q', primes)
+            primes.byteswap()
+        temporary_path = f'{os.fspath(path)}.tmp'
+        with open(temporary_path, 'wb') as binary_handle:
+            binary_handle.write(PRIME_TABLE_MAGIC)
+            binary_handle.write(struct.pack('<QQ', self.limit, len(primes)))
+            binary_handle.write(primes.tobytes())
+        os.replace(temporary_path, path)
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str], *, use_mmap: bool = True) -> PrimeTable:
+        """
+        Abre uma tabela salva por `save`.
+
+        Args:
+            path (str | os.PathLike[str]): O caminho do arquivo.
+            use_mmap (bool, Optional): Mapeia o arquivo em memória em vez de
+                lê-lo por inteiro. Padrão é True.
+
+        Returns:
+            PrimeTable: A tabela carregada.
+
+        Raises:
+            ValueError: Se o arquivo não estiver no formato esperado.
+        """
+        table = cls()
+        header_size = len(PRIME_TABLE_MAGIC) + 16
+        with open(path, 'rb') as binary_handle:
+            header = binary_handle.read(header_size)
+            if len(header) != header_size or not header.startswith(PRIME_TABLE_MAGIC):
+                raise ValueError(f'Arquivo de tabela de primos inválido: {path}')
+            limit, count = struct.unpack('<QQ', header[len(PRIME_TABLE_MAGIC):])
+            if os.fstat(binary_handle.fileno()).st_size != header_size + 8 * count:
+                raise ValueError(f'Arquivo de tabela de primos corrompido: {path}')
+
+            if use_mmap and count and sys.byteorder == 'little':
+                table._mapping = mmap.mmap(binary_handle.fileno(), 0, access=mmap.ACCESS_READ)
+                table._primes = memoryview(table._mapping)[header_size:].cast('Q')
+            else:
+                primes = array('Q')
+                primes.frombytes(binary_handle.read())
+                if sys.byteorder != 'little':
+                    primes.byteswap()
+                table._primes = primes
+        table.limit = max(limit, 2)
+        return table
+
+    def _release_mapping(self) -> None:
+        """
+        Fecha o mapeamento de memória, se houver.
+
+        Se ainda houver fatias da tabela mapeada em uso fora da tabela, o
+        mapeamento é fechado pelo coletor de lixo quando elas forem liberadas.
+        """
+        if self._mapping is not None:
+            try:
+                self._mapping.close()
+            except BufferError:
+                pass
+            self._mapping = None
+
+# Tabela compartilhada pelo processo, consultada por `is_prime` e
+# reaproveitada por `generate_primes`.
+_PRIME_TABLE = PrimeTable()
+
+def get_prime_table() -> PrimeTable:
+    """
+    Retorna a tabela de primos compartilhada pelo processo.
+
+    Returns:
+        PrimeTable: A tabela compartilhada.
+    """
+    return _PRIME_TABLE
+
+def load_prime_table(
+    path: str | os.PathLike[str] = DEFAULT_PRIME_TABLE_PATH,
+    *,
+    minimum_limit: int = PERSISTED_PRIME_TABLE_LIMIT
+) -> PrimeTable:
+    """
+    Instala como tabela compartilhada uma tabela persistida em disco.
+
+    Se o arquivo existir e cobrir `minimum_limit`, ele é aberto por `mmap`;
+    caso contrário, a tabela é construída (ou ampliada) até `minimum_limit`
+    e salva para as próximas execuções. Falhas de escrita são ignoradas,
+    pois o arquivo é apenas uma otimização.
+
+    Args:
+        path (str | os.PathLike[str], Optional): O caminho do arquivo.
+        minimum_limit (int, Optional): O limite mínimo da tabela.
+
+    Returns:
+        PrimeTable: A tabela instalada.
+    """
+    global _PRIME_TABLE
+    table: Optional[PrimeTable] = None
+    if os.path.exists(path):
+        try:
+            table = PrimeTable.load(path)
+        except ValueError:
+            table = None
+
+    if table is None or table.limit < minimum_limit:
+        table = table or PrimeTable()
+        table.extend_to(minimum_limit)
+        try:
+            table.save(path)
+        except OSError:
+            pass
+
+    if table.limit >= _PRIME_TABLE.limit:
+        _PRIME_TABLE = table
+    return _PRIME_TABLE
+
 def generate_primes() -> Iterator[int]:
     """
     Gera uma sequência infinita de números primos utilizando avaliação preguiçosa.
@@ -104,9 +942,13 @@ def generate_primes() -> Iterator[int]:
     armazená-los em memória. Esta abordagem é conhecida como avaliação 
     preguiçosa (lazy evaluation).
 
-    O mecanismo opera através de um laço infinito (`while True`) que testa 
-    sequencialmente cada inteiro (`candidate_number`), começando pelo 2. A
-    lógica de verificação de primalidade é delegada à `is_prime()`.
+    O mecanismo percorre a tabela compartilhada (`get_prime_table`), que é
+    ampliada por crivo segmentado — dobrando o limite — quando o consumidor
+    alcança o seu fim. Assim, uma nova chamada não recomeça do 2: os primos
+    já calculados por chamadas anteriores (ou carregados do disco por
+    `load_prime_table`) são entregues diretamente. Acima de
+    `PRIME_TABLE_MAX_LIMIT`, a tabela deixa de crescer e os primos seguintes
+    vêm de `iter_primes`, com memória constante.
 
     A palavra-chave `yield` é o coração do gerador: ele pausa o estado da
     função, entrega o número primo encontrado e só retorna a execução a partir
@@ -127,11 +969,98 @@ def generate_primes() -> Iterator[int]:
         Iterator[int]: Um iterador que produz indefinidamente o próximo número
                        primo na sequência como um inteiro
     """
-    candidate_number = 2
+    table = _PRIME_TABLE
+    position = 0
     while True:
-        if is_prime(candidate_number):
+        end = len(table)
+        yield from table.slice(position, end)
+        position = end
+        if table.limit >= PRIME_TABLE_MAX_LIMIT:
+            yield from iter_primes(table.limit)
+        table.extend_to(2 * table.limit)
+
+def _generate_primes_by_trial_division() -> Iterator[int]:
+    """
+    Gera primos testando cada inteiro por divisão por tentativa (o caminho original).
+
+    Não consulta a tabela compartilhada nem o Miller–Rabin: é mantido como
+    referência de correção e de desempenho para `benchmark_prime_generation`.
+    """
+    yield 2
+    candidate_number = 3
+    while True:
+        limit = isqrt(candidate_number)
+        divisor = 3
+        while divisor <= limit and candidate_number % divisor:
+            divisor += 2
+        if divisor > limit:
             yield candidate_number
-        candidate_number += 1
+        candidate_number += 2
+
+def benchmark_prime_generation(count: int) -> Dict[str, float]:
+    """
+    Mede a vazão da geração dos `count` primeiros primos, em primos por segundo.
+
+    A tabela compartilhada é medida duas vezes: na primeira passagem ela é
+    ampliada pelo crivo; na segunda, já está pronta.
+
+    Args:
+        count (int): A quantidade de primos a ser gerada.
+
+    Returns:
+        Dict[str, float]: As vazões de 'trial_division', 'segmented_sieve',
+            'prime_table_cold' e 'prime_table_warm'.
+    """
+    results: Dict[str, float] = {}
+    for name, generator in (
+        ('trial_division', _generate_primes_by_trial_division),
+        ('segmented_sieve', iter_primes),
+        ('prime_table_cold', generate_primes),
+        ('prime_table_warm', generate_primes),
+    ):
+        start = time.perf_counter()
+        for _ in islice(generator(), count):
+            pass
+        results[name] = count / (time.perf_counter() - start)
+    return results
+
+def benchmark_is_prime_many(
+    size: int = 1_000_000,
+    seed: int = 42
+) -> Dict[str, Dict[str, float]]:
+    """
+    Compara `is_prime` valor a valor com `is_prime_many`, em valores por segundo.
+
+    Três distribuições são medidas: valores densos (até 10 vezes a
+    quantidade), esparsos de 32 bits e esparsos de 64 bits.
+
+    Args:
+        size (int, Optional): A quantidade de valores por distribuição.
+        seed (int, Optional): A semente do gerador dos valores.
+
+    Returns:
+        Dict[str, Dict[str, float]]: Para cada distribuição, as vazões de
+            'is_prime' e 'is_prime_many'.
+    """
+    rng = random.Random(seed)
+    distributions = {
+        'dense': [rng.randrange(10 * size) for _ in range(size)],
+        'sparse_32_bit': [rng.randrange(1 << 32) for _ in range(size)],
+        'sparse_64_bit': [rng.randrange(1 << 64) for _ in range(size)],
+    }
+
+    results: Dict[str, Dict[str, float]] = {}
+    for name, values in distributions.items():
+        start = time.perf_counter()
+        for value in values:
+            is_prime(value)
+        single = size / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        is_prime_many(values)
+        batch = size / (time.perf_counter() - start)
+        results[name] = {'is_prime': single, 'is_prime_many': batch}
+    return results
 
 def _display_menu() -> None:
     """
@@ -0,0 +1,405 @@
+"""
+Sketches Combináveis para Quantis e Cardinalidade.
+
+Medianas, percentis e contagens de valores distintos exigiriam ordenar ou
+guardar toda a amostra. Este módulo oferece dois resumos de memória limitada
+que respondem a essas perguntas com erro controlado e que podem ser
+combinados (`merge`) entre blocos processados separadamente:
+
+1.  **KLL (`KLLSketch`):** uma pilha de "compactadores". Cada nível guarda
+    valores com peso 2^nível; quando um nível transborda, é ordenado e
+    metade dos valores (os de posição par ou ímpar, por sorteio) sobe para o
+    nível seguinte. O erro de posto normalizado é de aproximadamente
+    1,65% para `k = 200` e diminui na proporção de 1 / k.
+2.  **HyperLogLog (`HyperLogLog`):** 2^p registradores de um byte guardam o
+    maior número de zeros à esquerda observado nos hashes de cada
+    subconjunto; a média harmônica dos registradores estima a quantidade de
+    valores distintos com erro relativo padrão de 1,04 / √(2^p).
+
+Ambos aceitam blocos de valores (`update_many`) e, com o NumPy (opcional)
+instalado, blocos de vetores (`update_array`) processados com operações
+vetorizadas.
+"""
+
+from __future__ import annotations
+import random
+from array import array
+from bisect import bisect_left
+from itertools import accumulate
+from math import ceil, log, log2
+from typing import Any, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: sem ele, usa-se o caminho em Python puro.
+    np = None
+
+__author__ = 'Enock Silos'
+__email__ = 'init.caucasian722@passfwd.com'
+__status__ = 'Development'
+
+# Capacidade do compactador mais alto do KLL (erro de posto ≈ 1,65%).
+DEFAULT_KLL_K = 200
+# Precisão padrão do HyperLogLog: 2^14 registradores (16 KiB, erro ≈ 0,8%).
+DEFAULT_HLL_PRECISION = 14
+
+# Razão entre as capacidades de níveis consecutivos do KLL.
+_KLL_CAPACITY_RATIO = 2 / 3
+_MASK_64 = (1 << 64) - 1
+
+class KLLSketch:
+    """
+    Sketch KLL para estimar quantis de uma amostra em fluxo.
+
+    O nível `h` guarda valores que representam 2^h observações cada; a
+    capacidade dos níveis decresce geometricamente (razão 2/3) do mais alto,
+    com capacidade `k`, para os mais baixos. O mínimo e o máximo são mantidos
+    exatos.
+
+    Atributos:
+        k (int): A capacidade do nível mais alto.
+        count (int): A quantidade de valores observados.
+        minimum (Optional[Any]): O menor valor observado.
+        maximum (Optional[Any]): O maior valor observado.
+    """
+
+    def __init__(self, k: int = DEFAULT_KLL_K, seed: Optional[int] = None) -> None:
+        """
+        Inicializa um sketch vazio.
+
+        Args:
+            k (int, Optional): A capacidade do nível mais alto. Padrão é 200.
+            seed (Optional[int]): A semente dos sorteios das compactações.
+
+        Raises:
+            ValueError: Se `k` for menor que 8.
+        """
+        if k < 8:
+            raise ValueError('A capacidade do sketch KLL deve ser de pelo menos 8.')
+        self.k = k
+        self.count = 0
+        self.minimum: Optional[Any] = None
+        self.maximum: Optional[Any] = None
+        self._rng = random.Random(seed)
+        self._levels: List[List[Any]] = [[]]
+        self._size = 0
+        self._max_size = self._capacity(0)
+
+    @classmethod
+    def from_error_bound(cls, epsilon: float, seed: Optional[int] = None) -> KLLSketch:
+        """
+        Dimensiona o sketch a partir do erro de posto desejado.
+
+        Args:
+            epsilon (float): O erro de posto normalizado (ex: 0.01).
+            seed (Optional[int]): A semente dos sorteios das compactações.
+
+        Returns:
+            KLLSketch: Um sketch com `k ≈ 3,3 / ε`.
+        """
+        return cls(k=max(8, ceil(3.3 / epsilon)), seed=seed)
+
+    def _capacity(self, level: int) -> int:
+        """
+        A capacidade de um nível, dada a altura atual da pilha.
+        """
+        depth = len(self._levels) - level - 1
+        return max(2, ceil(self.k * _KLL_CAPACITY_RATIO ** depth))
+
+    def _grow(self) -> None:
+        """
+        Acrescenta um nível no topo e recalcula a capacidade total.
+        """
+        self._levels.append([])
+        self._max_size = sum(self._capacity(level) for level in range(len(self._levels)))
+
+    def _compress(self) -> None:
+        """
+        Compacta níveis cheios, de baixo para cima, até caber na capacidade.
+        """
+        for level in range(len(self._levels)):
+            items = self._levels[level]
+            if len(items) < self._capacity(level):
+                continue
+            if level + 1 == len(self._levels):
+                self._grow()
+            items.sort()
+            # Com um número ímpar de valores, o menor permanece no nível.
+            start = len(items) % 2
+            self._levels[level + 1].extend(items[start + self._rng.getrandbits(1)::2])
+            del items[start:]
+            self._size = sum(map(len, self._levels))
+            if self._size < self._max_size:
+                return
+
+    def update(self, value: Any) -> None:
+        """
+        Acrescenta um valor.
+        """
+        self.update_many((value,))
+
+    def update_many(self, values: Sequence[Any]) -> None:
+        """
+        Acrescenta um bloco de valores ao nível mais baixo e compacta.
+
+        Args:
+            values (Sequence[Any]): Os valores (comparáveis entre si).
+        """
+        if not values:
+            return
+        self._observe(min(values), max(values), len(values))
+        self._levels[0].extend(values)
+        self._size += len(values)
+        while self._size >= self._max_size:
+            self._compress()
+
+    def update_array(self, values: Any) -> None:
+        """
+        Acrescenta um bloco de um vetor do NumPy.
+
+        Enquanto o bloco excede a capacidade do nível em que entraria, ele é
+        compactado isoladamente com `np.sort` e fatiamento, subindo de nível;
+        apenas o que resta é convertido em lista.
+
+        Args:
+            values (Any): Um vetor unidimensional do NumPy.
+        """
+        if not values.size:
+            return
+        self._observe(values.min().item(), values.max().item(), values.size)
+        level = 0
+        while values.size > self._capacity(level):
+            values = np.sort(values)
+            start = values.size % 2
+            self._levels[level].extend(values[:start].tolist())
+            values = values[start + self._rng.getrandbits(1)::2]
+            level += 1
+            if level == len(self._levels):
+                self._grow()
+        self._levels[level].extend(values.tolist())
+        self._size = sum(map(len, self._levels))
+        while self._size >= self._max_size:
+            self._compress()
+
+    def _observe(self, low: Any, high: Any, count: int) -> None:
+        """
+        Atualiza a contagem e os extremos exatos com os de um bloco.
+        """
+        if self.count:
+            low, high = min(self.minimum, low), max(self.maximum, high)
+        self.minimum, self.maximum = low, high
+        self.count += count
+
+    def merge(self, other: KLLSketch) -> KLLSketch:
+        """
+        Incorpora outro sketch a este, nível a nível.
+
+        Args:
+            other (KLLSketch): O sketch de outro bloco.
+
+        Returns:
+            KLLSketch: Este sketch, atualizado.
+
+        Raises:
+            ValueError: Se os sketches tiverem capacidades diferentes.
+        """
+        if other.k != self.k:
+            raise ValueError('Apenas sketches KLL de mesma capacidade podem ser combinados.')
+        if not other.count:
+            return self
+        self._observe(other.minimum, other.maximum, other.count)
+
+        while len(self._levels) < len(other._levels):
+            self._grow()
+        for items, others in zip(self._levels, other._levels):
+            items.extend(others)
+        self._size = sum(map(len, self._levels))
+        while self._size >= self._max_size:
+            self._compress()
+        return self
+
+    def _weighted_items(self) -> List[Tuple[Any, int]]:
+        """
+        Os valores guardados com os seus pesos, em ordem crescente.
+        """
+        return sorted((value, 1 << level) for level, items in enumerate(self._levels) for value in items)
+
+    def rank(self, value: Any) -> float:
+        """
+        Estima a fração dos valores observados menores ou iguais a `value`.
+        """
+        if not self.count:
+            return 0.0
+        weight = sum(1 << level for level, items in enumerate(self._levels) for item in items if item <= value)
+        return weight / sum(len(items) << level for level, items in enumerate(self._levels))
+
+    def quantiles(self, fractions: Iterable[float]) -> List[Any]:
+        """
+        Estima vários quantis com uma única ordenação do sketch.
+
+        Args:
+            fractions (Iterable[float]): As frações, entre 0 e 1.
+
+        Returns:
+            List[Any]: Um valor observado para cada fração (0 e 1 devolvem o
+                mínimo e o máximo exatos; o sketch vazio devolve 0).
+
+        Raises:
+            ValueError: Se alguma fração estiver fora de [0, 1].
+        """
+        fractions = list(fractions)
+        if any(not 0 <= fraction <= 1 for fraction in fractions):
+            raise ValueError('As frações dos quantis devem estar entre 0 e 1.')
+        if not self.count:
+            return [0] * len(fractions)
+
+        items = self._weighted_items()
+        cumulative = list(accumulate(weight for _, weight in items))
+        total = cumulative[-1]
+
+        results = []
+        for fraction in fractions:
+            if fraction == 0:
+                results.append(self.minimum)
+            elif fraction == 1:
+                results.append(self.maximum)
+            else:
+                results.append(items[bisect_left(cumulative, fraction * total)][0])
+        return results
+
+    def quantile(self, fraction: float) -> Any:
+        """
+        Estima um quantil (ex: 0.5 para a mediana, 0.99 para o p99).
+        """
+        return self.quantiles((fraction,))[0]
+
+def _mix64(key: int) -> int:
+    """
+    Espalha os bits de uma chave de 64 bits (finalizador do SplitMix64).
+    """
+    key = (key ^ key >> 30) * 0xBF58476D1CE4E5B9 & _MASK_64
+    key = (key ^ key >> 27) * 0x94D049BB133111EB & _MASK_64
+    return key ^ key >> 31
+
+class HyperLogLog:
+    """
+    Sketch HyperLogLog para estimar a quantidade de valores distintos.
+
+    Cada valor numérico é identificado pela sua representação em float64
+    (1 e 1.0 são o mesmo valor), espalhada pelo finalizador do SplitMix64 —
+    um hash estável entre processos, ao contrário do `hash()` nativo de
+    strings. Os `p` bits mais altos escolhem o registrador; os demais
+    fornecem a posição do primeiro bit 1.
+
+    Atributos:
+        precision (int): O número de bits de índice (`p`).
+    """
+
+    def __init__(self, precision: int = DEFAULT_HLL_PRECISION) -> None:
+        """
+        Inicializa um sketch com 2^`precision` registradores zerados.
+
+        Args:
+            precision (int, Optional): Os bits de índice, de 4 a 18. Padrão é 14.
+
+        Raises:
+            ValueError: Se `precision` estiver fora de 4 a 18.
+        """
+        if not 4 <= precision <= 18:
+            raise ValueError('A precisão do HyperLogLog deve estar entre 4 e 18.')
+        self.precision = precision
+        self._registers = bytearray(1 << precision)
+
+    @classmethod
+    def from_error_bound(cls, epsilon: float) -> HyperLogLog:
+        """
+        Dimensiona o sketch a partir do erro relativo padrão desejado.
+
+        Args:
+            epsilon (float): O erro relativo padrão (ex: 0.01).
+
+        Returns:
+            HyperLogLog: Um sketch com `2^p ≥ (1,04 / ε)²` registradores.
+        """
+        return cls(min(18, max(4, ceil(log2((1.04 / epsilon) ** 2)))))
+
+    def update(self, value: Any) -> None:
+        """
+        Acrescenta um valor.
+        """
+        self.update_many((value,))
+
+    def update_many(self, values: Sequence[Any]) -> None:
+        """
+        Acrescenta um bloco de valores numéricos.
+
+        Args:
+            values (Sequence[Any]): Os valores.
+        """
+        # Somar 0.0 unifica -0.0 e 0.0; a reinterpretação dos bytes é feita em C.
+        keys = array('Q', array('d', [value + 0.0 for value in values]).tobytes())
+        registers = self._registers
+        shift = 64 - self.precision
+        low_mask = (1 << shift) - 1
+        for key in keys:
+            hashed = _mix64(key)
+            rank = shift + 1 - (hashed & low_mask).bit_length()
+            index = hashed >> shift
+            if rank > registers[index]:
+                registers[index] = rank
+
+    def update_array(self, values: Any) -> None:
+        """
+        Acrescenta um bloco de um vetor do NumPy com operações vetorizadas.
+        """
+        keys = (np.asarray(values, dtype=np.float64) + 0.0).view(np.uint64)
+        keys = (keys ^ keys >> np.uint64(30)) * np.uint64(0xBF58476D1CE4E5B9)
+        keys = (keys ^ keys >> np.uint64(27)) * np.uint64(0x94D049BB133111EB)
+        keys ^= keys >> np.uint64(31)
+
+        shift = 64 - self.precision
+        low = keys & np.uint64((1 << shift) - 1)
+        # O comprimento em bits é calculado em duas metades de 32 bits, que o
+        # float64 representa exatamente.
+        high_half = (low >> np.uint64(32)).astype(np.float64)
+        low_half = (low & np.uint64(0xFFFFFFFF)).astype(np.float64)
+        bit_length = np.where(high_half > 0, 32 + np.frexp(high_half)[1], np.frexp(low_half)[1])
+        ranks = (shift + 1 - bit_length).astype(np.uint8)
+
+        registers = np.frombuffer(self._registers, dtype=np.uint8)
+        np.maximum.at(registers, (keys >> np.uint64(shift)).astype(np.intp), ranks)
+
+    def merge(self, other: HyperLogLog) -> HyperLogLog:
+        """
+        Incorpora outro sketch a este (máximo registrador a registrador).
+
+        Args:
+            other (HyperLogLog): O sketch de outro bloco.
+
+        Returns:
+            HyperLogLog: Este sketch, atualizado.
+
+        Raises:
+            ValueError: Se os sketches tiverem precisões diferentes.
+        """
+        if other.precision != self.precision:
+            raise ValueError('Apenas sketches HyperLogLog de mesma precisão podem ser combinados.')
+        self._registers = bytearray(map(max, self._registers, other._registers))
+        return self
+
+    def estimate(self) -> int:
+        """
+        Estima a quantidade de valores distintos observados.
+
+        Usa a média harmônica dos registradores com a constante de correção
+        de Flajolet et al., e a contagem linear (pelos registradores zerados)
+        para cardinalidades pequenas.
+        """
+        registers = self._registers
+        size = len(registers)
+        alpha = 0.7213 / (1 + 1.079 / size)
+        raw = alpha * size * size / sum(2.0 ** -register for register in registers)
+        zeros = registers.count(0)
+        if raw <= 2.5 * size and zeros:
+            return round(size * log(size / zeros))
+        return round(raw)
@@ -13,23 +13,461 @@ abordagem, fundamentada em conceitos de programação funcional, resulta em um
 sistema extensível, em que novas métricas de tendência central ou de dispersão
 podem ser incorporadas sem a necessidade de modificar o algoritmo de 
 processamento principal.
+
+As métricas padrão são `StreamingMetric`s: em vez de percorrer os dados uma
+vez por métrica, o motor alimenta um único `StatisticsAccumulator` (contagem,
+soma, mínimo, máximo e variância pelo método de Welford) em uma só passagem
+sobre qualquer iterável, sem exigir que a amostra caiba em memória, e cada
+métrica apenas lê o acumulador. Acumuladores de blocos diferentes podem ser
+combinados (`merge`), o que permite processar os blocos em paralelo.
+
+Vetores do NumPy e objetos com o protocolo de buffer (`array.array`,
+`memoryview`) são resumidos bloco a bloco por operações vetorizadas, quando
+o NumPy (opcional) está instalado; sem ele, são percorridos pelo mesmo
+caminho em Python puro.
+
+Medianas, percentis e contagens de valores distintos, que exigiriam guardar
+toda a amostra, são estimados por sketches combináveis de memória limitada
+(`statistical_sketches`): as métricas de `quantile_metric` e
+`distinct_count_metric` (reunidas em `SKETCH_OPERATIONS`) declaram o sketch
+de que precisam, e o acumulador o alimenta na mesma passagem.
+
+Além da entrada interativa, o módulo analisa arquivos numéricos grandes
+(`generate_file_report`): o arquivo CSV ou binário é mapeado em memória
+(`mmap`), dividido em fatias alinhadas a linhas ou a elementos, e cada fatia
+é acumulada — em um `ProcessPoolExecutor`, se `workers > 1` — antes de os
+acumuladores parciais serem combinados em um único relatório.
 """
 
 from __future__ import annotations
-from typing import Optional, List, Dict, Any, Callable
+import mmap
+import os
+import sys
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from math import sqrt, sumprod
+from typing import Optional, Iterable, List, Dict, Any, Callable, Sequence, Tuple, Union
+from python_sessions.concepts.algorithms.statistical_sketches import (
+    DEFAULT_HLL_PRECISION,
+    DEFAULT_KLL_K,
+    HyperLogLog,
+    KLLSketch
+)
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: sem ele, usa-se o caminho em Python puro.
+    np = None
 
 __author__ = 'Enock Silos'
 __email__ = 'init.caucasian722@passfwd.com'
 __status__ = 'Development'
 
+# Valores consumidos por bloco de `StatisticsAccumulator.update_many`.
+DEFAULT_CHUNK_SIZE: int = 1 << 16
+
+# Elementos por bloco de `StatisticsAccumulator.update_array`: o bloco e o
+# vetor de desvios (512 KiB cada, em float64) permanecem no cache.
+DEFAULT_ARRAY_CHUNK_SIZE: int = 1 << 16
+
+# Tamanho alvo (em bytes) de cada fatia de arquivo entregue a um processo.
+DEFAULT_FILE_CHUNK_BYTES: int = 64 << 20
+# Bytes de texto CSV convertidos em números de cada vez, dentro de uma fatia.
+_CSV_BLOCK_BYTES: int = 1 << 20
+# Extensões lidas como texto quando o formato do arquivo não é informado.
+_CSV_SUFFIXES = ('.csv', '.txt')
+
+Number = Union[int, float]
+# A classe de um sketch seguida dos argumentos do seu construtor, ex:
+# `(KLLSketch, 200)`. Especificações iguais compartilham um único sketch.
+SketchSpec = Tuple[Any, ...]
+
+class StatisticsAccumulator:
+    """
+    Acumula estatísticas descritivas em uma única passagem pelos dados.
+
+    A variância é mantida pela soma dos quadrados dos desvios em relação à
+    média (`M2`), atualizada pelo método de Welford valor a valor, ou bloco a
+    bloco pela fórmula de combinação de Chan et al. — a mesma usada por
+    `merge` para unir acumuladores de blocos processados separadamente. Ambas
+    evitam a subtração de somas grandes (`Σx² - n·x̄²`), numericamente instável.
+
+    O acumulador também alimenta os sketches que as métricas declaram, de
+    modo que momentos e sketches são atualizados e combinados juntos.
+
+    Atributos:
+        count (int): A quantidade de valores acumulados.
+        total (Number): A soma dos valores (exata para inteiros).
+        minimum (Optional[Number]): O menor valor, ou None se vazio.
+        maximum (Optional[Number]): O maior valor, ou None se vazio.
+        sketches (Dict[SketchSpec, Any]): Os sketches, por especificação.
+    """
+
+    def __init__(self, sketches: Iterable[SketchSpec] = ()) -> None:
+        """
+        Inicializa um acumulador vazio.
+
+        Args:
+            sketches (Iterable[SketchSpec], Optional): As especificações dos
+                sketches alimentados junto com os momentos.
+        """
+        self.sketches: Dict[SketchSpec, Any] = {spec: spec[0](*spec[1:]) for spec in sketches}
+        self.count = 0
+        self.total: Number = 0
+        self.minimum: Optional[Number] = None
+        self.maximum: Optional[Number] = None
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    @classmethod
+    def from_iterable(
+        cls,
+        values: Iterable[Number],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        sketches: Iterable[SketchSpec] = ()
+    ) -> StatisticsAccumulator:
+        """
+        Constrói um acumulador a partir de um iterável.
+
+        Args:
+            values (Iterable[Number]): Os valores.
+            chunk_size (int, Optional): Os valores consumidos por bloco.
+            sketches (Iterable[SketchSpec], Optional): Os sketches alimentados.
+
+        Returns:
+            StatisticsAccumulator: O acumulador preenchido.
+        """
+        accumulator = cls(sketches)
+        accumulator.update_many(values, chunk_size)
+        return accumulator
+
+    @property
+    def mean(self) -> float:
+        """
+        A média aritmética (0.0 se vazio).
+        """
+        return self._mean
+
+    @property
+    def variance(self) -> float:
+        """
+        A variância populacional (0.0 se vazio).
+        """
+        return self._m2 / self.count if self.count else 0.0
+
+    @property
+    def sample_variance(self) -> float:
+        """
+        A variância amostral, com correção de Bessel (0.0 com menos de 2 valores).
+        """
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def standard_deviation(self) -> float:
+        """
+        O desvio padrão amostral.
+        """
+        return sqrt(self.sample_variance)
+
+    def update(self, value: Number) -> None:
+        """
+        Acrescenta um valor (método de Welford).
+        """
+        delta = value - self._mean
+        self.count += 1
+        self.total += value
+        self._mean += delta / self.count
+        self._m2 += delta * (value - self._mean)
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+        for sketch in self.sketches.values():
+            sketch.update(value)
+
+    def update_many(self, values: Iterable[Number], chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        """
+        Acrescenta valores em blocos de tamanho limitado.
+
+        Cada bloco é resumido por funções nativas (`sum`, `min`, `max` e
+        `math.sumprod` dos desvios em relação à média do bloco) e combinado
+        ao acumulador, de modo que a memória usada é a de um bloco, qualquer
+        que seja o tamanho do iterável.
+
+        Args:
+            values (Iterable[Number]): Os valores.
+            chunk_size (int, Optional): Os valores consumidos por bloco.
+        """
+        iterator = iter(values)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                return
+            self._merge_moments(self._summarize_chunk(chunk))
+            for sketch in self.sketches.values():
+                sketch.update_many(chunk)
+
+    @classmethod
+    def from_array(
+        cls,
+        values: Any,
+        chunk_size: int = DEFAULT_ARRAY_CHUNK_SIZE,
+        sketches: Iterable[SketchSpec] = ()
+    ) -> StatisticsAccumulator:
+        """
+        Constrói um acumulador a partir de um vetor do NumPy ou de um buffer.
+
+        Args:
+            values (Any): Um `np.ndarray` ou objeto com o protocolo de buffer.
+            chunk_size (int, Optional): Os elementos resumidos por bloco.
+            sketches (Iterable[SketchSpec], Optional): Os sketches alimentados.
+
+        Returns:
+            StatisticsAccumulator: O acumulador preenchido.
+        """
+        accumulator = cls(sketches)
+        accumulator.update_array(values, chunk_size)
+        return accumulator
+
+    def update_array(self, values: Any, chunk_size: int = DEFAULT_ARRAY_CHUNK_SIZE) -> None:
+        """
+        Acrescenta os elementos de um vetor com operações vetorizadas.
+
+        O vetor é achatado (sem cópia, quando contíguo) e percorrido em
+        blocos: cada bloco é resumido por `sum`, `min`, `max` e pelo produto
+        escalar dos desvios em relação à sua média, e combinado como em
+        `update_many`. Somas de inteiros são sempre exatas: cada bloco é
+        somado em 64 bits apenas quando os seus extremos garantem que a soma
+        não transborda, e como `int` do Python caso contrário.
+        Sem o NumPy, os valores são percorridos por `update_many`.
+
+        Args:
+            values (Any): Um `np.ndarray` ou objeto com o protocolo de buffer.
+            chunk_size (int, Optional): Os elementos resumidos por bloco.
+        """
+        if np is None:
+            self.update_many(values)
+            return
+
+        array = np.asarray(values).reshape(-1)
+        for start in range(0, array.size, chunk_size):
+            chunk = array[start:start + chunk_size]
+            self._merge_moments(self._summarize_array(chunk))
+            for sketch in self.sketches.values():
+                sketch.update_array(chunk)
+
+    @classmethod
+    def _summarize_array(cls, chunk: np.ndarray) -> StatisticsAccumulator:
+        """
+        Resume um bloco de um vetor do NumPy em um acumulador.
+        """
+        summary = cls()
+        summary.count = chunk.size
+        summary.minimum = chunk.min().item()
+        summary.maximum = chunk.max().item()
+        if chunk.dtype.kind not in 'iub':
+            summary.total = chunk.sum().item()
+        elif max(-summary.minimum, summary.maximum) * chunk.size < 1 << 63:
+            summary.total = int(chunk.sum(dtype=np.int64))
+        else:
+            summary.total = int(chunk.sum(dtype=object))
+        summary._mean = mean = summary.total / summary.count
+        deviations = chunk - mean
+        summary._m2 = float(np.dot(deviations, deviations))
+        return summary
+
+    @classmethod
+    def _summarize_chunk(cls, chunk: List[Number]) -> StatisticsAccumulator:
+        """
+        Resume um bloco em memória em um acumulador.
+        """
+        summary = cls()
+        summary.count = len(chunk)
+        summary.total = sum(chunk)
+        summary.minimum = min(chunk)
+        summary.maximum = max(chunk)
+        summary._mean = mean = summary.total / summary.count
+        deviations = [value - mean for value in chunk]
+        summary._m2 = float(sumprod(deviations, deviations))
+        return summary
+
+    def merge(self, other: StatisticsAccumulator) -> StatisticsAccumulator:
+        """
+        Incorpora outro acumulador a este (fórmula de Chan et al.).
+
+        Args:
+            other (StatisticsAccumulator): O acumulador de outro bloco.
+
+        Returns:
+            StatisticsAccumulator: Este acumulador, atualizado.
+
+        Raises:
+            ValueError: Se os acumuladores tiverem sketches diferentes.
+        """
+        if self.sketches.keys() != other.sketches.keys():
+            raise ValueError('Apenas acumuladores com os mesmos sketches podem ser combinados.')
+        for spec, sketch in self.sketches.items():
+            sketch.merge(other.sketches[spec])
+        return self._merge_moments(other)
+
+    def _merge_moments(self, other: StatisticsAccumulator) -> StatisticsAccumulator:
+        """
+        Incorpora a contagem, a soma, os extremos e M2 de outro acumulador.
+        """
+        if not other.count:
+            return self
+        if not self.count:
+            self.count, self.total = other.count, other.total
+            self.minimum, self.maximum = other.minimum, other.maximum
+            self._mean, self._m2 = other._mean, other._m2
+            return self
+
+        count = self.count + other.count
+        delta = other._mean - self._mean
+        self._mean += delta * other.count / count
+        self._m2 += other._m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.total += other.total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        return self
+
+class StreamingMetric:
+    """
+    Uma métrica calculada a partir de um `StatisticsAccumulator`.
+
+    A métrica continua sendo uma operação comum — pode ser chamada com uma
+    lista de dados, como qualquer função de `STATISTICAL_OPERATIONS` —, mas
+    `generate_statistical_report` reconhece as métricas desta classe e as
+    calcula todas a partir de um único acumulador, em uma só passagem.
+
+    Uma métrica pode declarar um sketch (`sketch`); nesse caso, `compute`
+    recebe o sketch, alimentado pelo acumulador, em vez do próprio acumulador.
+
+    Atributos:
+        compute (Callable[[Any], Number]): Lê a métrica do acumulador (ou do
+            sketch).
+        sketch (Optional[SketchSpec]): O sketch de que a métrica precisa.
+    """
+
+    def __init__(self, compute: Callable[[Any], Number], sketch: Optional[SketchSpec] = None) -> None:
+        """
+        Inicializa a métrica com a função que a lê do acumulador.
+        """
+        self.compute = compute
+        self.sketch = sketch
+
+    def evaluate(self, accumulator: StatisticsAccumulator) -> Number:
+        """
+        Lê a métrica de um acumulador preenchido.
+
+        Raises:
+            ValueError: Se o acumulador não tiver o sketch da métrica.
+        """
+        if self.sketch is None:
+            return self.compute(accumulator)
+        if self.sketch not in accumulator.sketches:
+            raise ValueError(f'O acumulador não contém o sketch {self.sketch[0].__name__} exigido pela métrica.')
+        return self.compute(accumulator.sketches[self.sketch])
+
+    def __call__(self, data: Iterable[Number]) -> Number:
+        """
+        Calcula a métrica diretamente sobre os dados.
+        """
+        sketches = () if self.sketch is None else (self.sketch,)
+        array = _as_array(data)
+        if array is not None:
+            return self.evaluate(StatisticsAccumulator.from_array(array, sketches=sketches))
+        return self.evaluate(StatisticsAccumulator.from_iterable(data, sketches=sketches))
+
+def quantile_metric(fraction: float, k: int = DEFAULT_KLL_K) -> StreamingMetric:
+    """
+    Cria uma métrica que estima um quantil por um sketch KLL.
+
+    Métricas com o mesmo `k` compartilham o sketch: a mediana e os
+    percentis de um relatório custam uma única atualização por valor.
+
+    Args:
+        fraction (float): A fração do quantil (0.5 para a mediana).
+        k (int, Optional): A capacidade do sketch (erro de posto ≈ 3,3 / k).
+
+    Returns:
+        StreamingMetric: A métrica (0 para amostras vazias).
+
+    Raises:
+        ValueError: Se `fraction` estiver fora de [0, 1].
+    """
+    if not 0 <= fraction <= 1:
+        raise ValueError('A fração do quantil deve estar entre 0 e 1.')
+    return StreamingMetric(lambda sketch: sketch.quantile(fraction), sketch=(KLLSketch, k))
+
+def distinct_count_metric(precision: int = DEFAULT_HLL_PRECISION) -> StreamingMetric:
+    """
+    Cria uma métrica que estima a quantidade de valores distintos.
+
+    Args:
+        precision (int, Optional): Os bits de índice do HyperLogLog (erro
+            relativo padrão de 1,04 / √(2^precision)).
+
+    Returns:
+        StreamingMetric: A métrica.
+    """
+    return StreamingMetric(HyperLogLog.estimate, sketch=(HyperLogLog, precision))
+
 STATISTICAL_OPERATIONS: Dict[str, Any]  = {
-    'Soma': sum,
-    'Média': lambda data: sum(data) / len(data) if data else 0.0 
+    'Contagem': StreamingMetric(lambda acc: acc.count),
+    'Soma': StreamingMetric(lambda acc: acc.total),
+    'Média': StreamingMetric(lambda acc: acc.mean),
+    'Mínimo': StreamingMetric(lambda acc: acc.minimum if acc.count else 0),
+    'Máximo': StreamingMetric(lambda acc: acc.maximum if acc.count else 0),
+    'Variância': StreamingMetric(lambda acc: acc.sample_variance),
+    'Desvio Padrão': StreamingMetric(lambda acc: acc.standard_deviation),
+}
+
+# Métricas aproximadas por sketches, para combinar com as padrão:
+# `{**STATISTICAL_OPERATIONS, **SKETCH_OPERATIONS}`.
+SKETCH_OPERATIONS: Dict[str, StreamingMetric] = {
+    'Mediana': quantile_metric(0.5),
+    'Percentil 95': quantile_metric(0.95),
+    'Percentil 99': quantile_metric(0.99),
+    'Valores Distintos': distinct_count_metric(),
 }
 
+def _as_array(data: Any) -> Optional[np.ndarray]:
+    """
+    Expõe os dados como vetor do NumPy, se forem um vetor ou um buffer.
+
+    Returns:
+        Optional[np.ndarray]: O vetor (sem cópia), ou None se o NumPy não
+            estiver instalado, se os dados forem um iterável comum ou se o
+            vetor não for numérico (por exemplo, `dtype=object`, usado para
+            inteiros além de 64 bits), casos percorridos em Python puro.
+    """
+    if np is None or isinstance(data, (list, tuple)):
+        return None
+    if isinstance(data, np.ndarray):
+        vector = data
+    else:
+        try:
+            vector = np.asarray(memoryview(data))
+        except TypeError:
+            return None
+    return vector if vector.dtype.kind in 'iubf' else None
+
+def _required_sketches(operations: Dict[str, Any]) -> List[SketchSpec]:
+    """
+    As especificações distintas dos sketches declarados pelas métricas.
+    """
+    return list(dict.fromkeys(
+        operation.sketch for operation in operations.values()
+        if isinstance(operation, StreamingMetric) and operation.sketch is not None
+    ))
+
 def generate_statistical_report(
-    data: List[int],
-    operations: Dict[str, Callable[[List[int]], float]]
+    data: Iterable[int],
+    operations: Dict[str, Callable[[List[int]], float]] = STATISTICAL_OPERATIONS
 ) -> Dict[str, float]:
     """
     Executa um conjunto de operações estatísticas sobre uma amostra de dados.
@@ -49,25 +487,304 @@ def generate_statistical_report(
     ao dicionário de operações sem que nenhuma linha de código deste motor
     precise ser alterada.
 
+    As operações do tipo `StreamingMetric` são calculadas a partir de um
+    único `StatisticsAccumulator`, alimentado em uma só passagem pelos dados;
+    se todas as operações forem desse tipo, `data` pode ser qualquer
+    iterável (inclusive um gerador maior que a memória). As demais operações
+    recebem os dados materializados em uma lista, uma única vez. Sem
+    nenhuma `StreamingMetric`, o acumulador não é construído, e os dados
+    não precisam ser numéricos.
+
+    Com o NumPy instalado, um `np.ndarray` ou um objeto com o protocolo de
+    buffer (`array.array`, `memoryview`) é acumulado por operações
+    vetorizadas, e as operações comuns recebem os próprios dados originais,
+    sem conversão para lista. Os sketches declarados pelas métricas são criados
+    uma única vez por especificação e alimentados na mesma passagem.
+
     Args:
-        data (List[int]): A amostra de dados numéricos a ser analisada.
-        operations (Dict[str, Callable[[List[int]], float]]): Um dicionãrio
+        data (Iterable[int]): A amostra de dados numéricos a ser analisada.
+        operations (Dict[str, Callable[[List[int]], float]]): Um dicionãrio
             em que as chaves são os nomes das métricas estatísticas e os valores
-            são as funções `Callable` que as implementam.
+            são as funções `Callable` que as implementam. O padrão é
+            `STATISTICAL_OPERATIONS`.
 
     Returns:
         Dict[str, float]: Um dicionário contendo o relatório final, em que cada
                           chave é o nome de uma métrica e cada valor é o seu
                           resultado calculado.
     """
+    vector = _as_array(data)
+    if vector is None and not all(isinstance(operation, StreamingMetric) for operation in operations.values()):
+        data = data if isinstance(data, list) else list(data)
+
+    accumulator = None
+    if any(isinstance(operation, StreamingMetric) for operation in operations.values()):
+        sketches = _required_sketches(operations)
+        if vector is not None:
+            accumulator = StatisticsAccumulator.from_array(vector, sketches=sketches)
+        else:
+            accumulator = StatisticsAccumulator.from_iterable(data, sketches=sketches)
+
     report = {}
 
     for stat_name, operation in operations.items():
-        result = operation(data)
+        if isinstance(operation, StreamingMetric):
+            result = operation.evaluate(accumulator)
+        else:
+            result = operation(data)
         report[stat_name] = result
 
     return report
 
+def generate_report_from_accumulator(
+    accumulator: StatisticsAccumulator,
+    operations: Dict[str, StreamingMetric] = STATISTICAL_OPERATIONS
+) -> Dict[str, float]:
+    """
+    Monta o relatório a partir de um acumulador já preenchido.
+
+    Útil quando os dados foram acumulados em blocos (e combinados por
+    `StatisticsAccumulator.merge`), por exemplo em processos diferentes.
+
+    Args:
+        accumulator (StatisticsAccumulator): O acumulador de toda a amostra.
+        operations (Dict[str, StreamingMetric], Optional): As métricas.
+
+    Returns:
+        Dict[str, float]: O relatório, como em `generate_statistical_report`.
+
+    Raises:
+        TypeError: Se alguma operação não for uma `StreamingMetric`.
+        ValueError: Se o acumulador não tiver o sketch de alguma métrica.
+    """
+    report = {}
+    for stat_name, operation in operations.items():
+        if not isinstance(operation, StreamingMetric):
+            raise TypeError(f'A operação "{stat_name}" exige os dados, não apenas o acumulador.')
+        report[stat_name] = operation.evaluate(accumulator)
+    return report
+
+def benchmark_statistical_report(size: int = 10_000_000, seed: int = 42) -> Dict[str, float]:
+    """
+    Compara o relatório padrão sobre uma lista e sobre um vetor do NumPy.
+
+    Args:
+        size (int, Optional): A quantidade de valores. Padrão é 10.000.000.
+        seed (int, Optional): A semente dos dados aleatórios.
+
+    Returns:
+        Dict[str, float]: Os valores por segundo de cada caminho.
+
+    Raises:
+        ValueError: Se o NumPy não estiver instalado.
+    """
+    if np is None:
+        raise ValueError('O benchmark vetorizado requer o NumPy.')
+
+    array = np.random.default_rng(seed).normal(100.0, 15.0, size)
+    values = array.tolist()
+
+    results = {}
+    for label, data in (('lista', values), ('numpy', array)):
+        start = time.perf_counter()
+        generate_statistical_report(data)
+        results[label] = size / (time.perf_counter() - start)
+    return results
+
+def _line_ranges(buffer: mmap.mmap, start: int, end: int, chunk_bytes: int) -> List[Tuple[int, int]]:
+    """
+    Divide `[start, end)` em fatias de ~`chunk_bytes` alinhadas a linhas.
+
+    Cada fronteira provisória é avançada até depois da quebra de linha
+    seguinte, de modo que nenhum número seja partido entre duas fatias.
+    """
+    boundaries = [start]
+    position = start + chunk_bytes
+    while position < end:
+        newline = buffer.find(b'\n', position, end)
+        if newline < 0:
+            break
+        boundaries.append(newline + 1)
+        position = newline + 1 + chunk_bytes
+    if boundaries[-1] < end:
+        boundaries.append(end)
+    return list(zip(boundaries, boundaries[1:]))
+
+def _update_from_csv(accumulator: StatisticsAccumulator, text: bytes) -> None:
+    """
+    Converte um bloco de texto CSV em números e os acumula.
+
+    Vírgulas, espaços e quebras de linha separam os valores, lidos como
+    `float` (com o NumPy, diretamente em um vetor float64).
+
+    Raises:
+        ValueError: Se algum campo não for numérico.
+    """
+    fields = text.replace(b',', b' ').split()
+    try:
+        values = list(map(float, fields)) if np is None else np.array(fields, dtype=np.float64)
+    except ValueError as error:
+        raise ValueError(f'O arquivo CSV contém um valor não numérico ({error}).') from None
+    if np is None:
+        accumulator.update_many(values)
+    else:
+        accumulator.update_array(values)
+
+def _accumulate_file_range(task: Tuple[str, int, int, str, str, List[SketchSpec]]) -> StatisticsAccumulator:
+    """
+    Acumula uma fatia de um arquivo numérico (executado nos processos do pool).
+
+    Args:
+        task: Uma tupla `(arquivo, início, fim, formato, código de tipo,
+            sketches)`, facilmente serializada para o processo trabalhador.
+
+    Returns:
+        StatisticsAccumulator: O acumulador da fatia.
+    """
+    path, start, end, file_format, typecode, sketches = task
+    accumulator = StatisticsAccumulator(sketches)
+    with open(path, 'rb') as binary_pointer, \
+            mmap.mmap(binary_pointer.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        if file_format == 'binary':
+            # Os valores são lidos diretamente das páginas mapeadas, sem cópia.
+            with memoryview(buffer) as view, view[start:end] as window, window.cast(typecode) as values:
+                accumulator.update_array(values)
+        else:
+            for block_start, block_end in _line_ranges(buffer, start, end, _CSV_BLOCK_BYTES):
+                _update_from_csv(accumulator, buffer[block_start:block_end])
+    return accumulator
+
+def accumulate_numeric_file(
+    path: str | os.PathLike[str],
+    *,
+    file_format: Optional[str] = None,
+    typecode: str = 'd',
+    skip_header: bool = False,
+    sketches: Iterable[SketchSpec] = (),
+    workers: int = 1,
+    chunk_bytes: int = DEFAULT_FILE_CHUNK_BYTES
+) -> StatisticsAccumulator:
+    """
+    Acumula todos os valores de um arquivo numérico, opcionalmente em paralelo.
+
+    O arquivo é mapeado em memória e dividido em fatias de ~`chunk_bytes`:
+    no CSV, alinhadas a quebras de linha; no binário, a múltiplos do tamanho
+    do elemento. Cada fatia é acumulada de forma independente — em um
+    `ProcessPoolExecutor` quando `workers > 1` — e os acumuladores parciais
+    são combinados na ordem do arquivo.
+
+    Args:
+        path (str | os.PathLike[str]): O caminho do arquivo.
+        file_format (Optional[str], Optional): 'csv' (valores separados por
+            vírgulas, espaços ou linhas) ou 'binary' (valores contíguos na
+            ordem de bytes da máquina). Padrão: 'csv' para as extensões
+            .csv e .txt, 'binary' para as demais.
+        typecode (str, Optional): O código de tipo do módulo `array` dos
+            valores binários (ex: 'd' para float64, 'i' para int32). Padrão é 'd'.
+        skip_header (bool, Optional): Ignora a primeira linha do CSV.
+        sketches (Iterable[SketchSpec], Optional): Os sketches alimentados.
+        workers (int, Optional): O número de processos. Padrão é 1 (serial).
+        chunk_bytes (int, Optional): O tamanho alvo de cada fatia.
+
+    Returns:
+        StatisticsAccumulator: O acumulador combinado de todo o arquivo.
+
+    Raises:
+        ValueError: Se o formato, o código de tipo ou o tamanho da fatia
+            forem inválidos, se o tamanho do arquivo binário não for múltiplo
+            do tamanho do elemento ou se o CSV tiver valores não numéricos.
+    """
+    path = os.fspath(path)
+    if file_format is None:
+        file_format = 'csv' if path.lower().endswith(_CSV_SUFFIXES) else 'binary'
+    if file_format not in ('csv', 'binary'):
+        raise ValueError(f'Formato de arquivo desconhecido: {file_format}')
+    if chunk_bytes <= 0:
+        raise ValueError('O tamanho da fatia deve ser um inteiro positivo.')
+
+    sketches = list(sketches)
+    result = StatisticsAccumulator(sketches)
+    size = os.path.getsize(path)
+    if file_format == 'binary':
+        itemsize = array(typecode).itemsize
+        if size % itemsize:
+            raise ValueError('O tamanho do arquivo binário não é múltiplo do tamanho do elemento.')
+        step = max(itemsize, chunk_bytes - chunk_bytes % itemsize)
+        ranges = [(start, min(start + step, size)) for start in range(0, size, step)]
+    elif size:
+        with open(path, 'rb') as binary_pointer, \
+                mmap.mmap(binary_pointer.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            start = 0
+            if skip_header:
+                newline = buffer.find(b'\n')
+                start = size if newline < 0 else newline + 1
+            ranges = _line_ranges(buffer, start, size, chunk_bytes)
+    else:
+        ranges = []
+
+    tasks = [(path, start, end, file_format, typecode, sketches) for start, end in ranges]
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for partial in executor.map(_accumulate_file_range, tasks):
+                result.merge(partial)
+    else:
+        for task in tasks:
+            result.merge(_accumulate_file_range(task))
+    return result
+
+def generate_file_report(
+    path: str | os.PathLike[str],
+    operations: Dict[str, StreamingMetric] = STATISTICAL_OPERATIONS,
+    **options: Any
+) -> Dict[str, float]:
+    """
+    Gera o relatório estatístico de um arquivo numérico grande.
+
+    Os sketches exigidos pelas métricas são acumulados junto com os
+    momentos, fatia a fatia, e o relatório é montado pelo acumulador
+    combinado, como em `generate_report_from_accumulator`.
+
+    Args:
+        path (str | os.PathLike[str]): O caminho do arquivo.
+        operations (Dict[str, StreamingMetric], Optional): As métricas.
+        **options: Opções repassadas para `accumulate_numeric_file` (ex:
+            `workers=4`, `file_format='binary'`, `typecode='i'`).
+
+    Returns:
+        Dict[str, float]: O relatório, como em `generate_statistical_report`.
+
+    Raises:
+        TypeError: Se alguma operação não for uma `StreamingMetric`.
+    """
+    if not all(isinstance(operation, StreamingMetric) for operation in operations.values()):
+        raise TypeError('O relatório de arquivos aceita apenas operações do tipo StreamingMetric.')
+    accumulator = accumulate_numeric_file(path, sketches=_required_sketches(operations), **options)
+    return generate_report_from_accumulator(accumulator, operations)
+
+def benchmark_file_report(
+    path: str | os.PathLike[str],
+    workers: Sequence[int] = (1, 2, 4),
+    **options: Any
+) -> Dict[int, float]:
+    """
+    Mede a vazão de `generate_file_report` (MB/s) para diferentes números de processos.
+
+    Args:
+        path (str | os.PathLike[str]): O caminho do arquivo numérico.
+        workers (Sequence[int], Optional): As configurações de processos.
+        **options: Opções repassadas para `generate_file_report`.
+
+    Returns:
+        Dict[int, float]: A vazão, em MB/s, para cada número de processos.
+    """
+    size_in_bytes = os.path.getsize(path)
+    throughput: Dict[int, float] = {}
+    for worker_count in workers:
+        start = time.perf_counter()
+        generate_file_report(path, workers=worker_count, **options)
+        throughput[worker_count] = size_in_bytes / (time.perf_counter() - start) / 1e6
+    return throughput
+
 def collect_numeric_data_with_sentinel() -> Optional[List[int]]:
     """
     Coleta uma série de dados numéricos inteiros a partir da entrada do usuário.
@@ -109,6 +826,41 @@ def collect_numeric_data_with_sentinel() -> Optional[List[int]]:
     # print(f'DEBUG: {user_input_values}')
     return user_input_values 
 
+def print_statistical_report(report: Dict[str, float]) -> None:
+    """
+    Exibe um relatório estatístico em uma tabela com bordas.
+
+    Inteiros são exibidos sem casas decimais; os demais valores, com duas.
+
+    Args:
+        report (Dict[str, float]): O relatório, de métrica para valor.
+    """
+    title_stat_name_column = 'MÉTRICA ESTATÍSTICA'
+    title_stat_value_column = 'VALOR CALCULADO'
+
+    col_stat_name_width = 25
+    col_stat_value_width = 20
+
+    top_border = f"┌{'─' * (col_stat_name_width + 2)}┬{'─' * (col_stat_value_width + 2)}┐"
+    header_line = f"│ {title_stat_name_column:^{col_stat_name_width}} │ {title_stat_value_column:^{col_stat_value_width}} │"
+    middle_border = f"├{'─' * (col_stat_name_width + 2)}┼{'─' * (col_stat_value_width + 2)}┤"
+    bottom_border = f"└{'─' * (col_stat_name_width + 2)}┴{'─' * (col_stat_value_width + 2)}┘"
+
+    print(top_border)
+    print(header_line)
+    print(middle_border)
+
+    for stat_name, stat_value in report.items():
+        if isinstance(stat_value, int):
+            formatted_value = f'{stat_value}'
+        else:
+            formatted_value = f'{stat_value:.2f}'
+
+        data_row = f'│ {stat_name:<{col_stat_name_width}} │ {formatted_value:>{col_stat_value_width}} │'
+        print(data_row)
+
+    print(bottom_border)
+
 def demonstrate_aggregated_stats_with_sentinel() -> None:
     """
     Orquestra e demonstra o fluxo completo de uma análise estatística.
@@ -122,7 +874,8 @@ def demonstrate_aggregated_stats_with_sentinel() -> None:
     O procedimento segue um fluxo de trabalho de três etapas:
     1.  Invoca `collect_numeric_data_with_sentinel` para a aquisição da amostra.
     2.  Entrega a amostra coletada e a "caixa de ferramentas" de operações
-        (`STATISTICAL_OPERATIONS`) ao motor `generate_statistical_report`.
+        (`STATISTICAL_OPERATIONS` e `SKETCH_OPERATIONS`) ao motor
+        `generate_statistical_report`.
     3.  Recebe o dicionário de resultados e itera sobre ele para construir e
         exibir um relatórip formatado para o usuário final.
     """
@@ -132,7 +885,7 @@ def demonstrate_aggregated_stats_with_sentinel() -> None:
         print('\nOperação cancelada pelo usuário.')
         return
 
-    final_report = generate_statistical_report(numeric_data, STATISTICAL_OPERATIONS)
+    final_report = generate_statistical_report(numeric_data, {**STATISTICAL_OPERATIONS, **SKETCH_OPERATIONS})
 
     print('\n─ ─ ─ Relatório Estatístico Final ─ ─ ─')
 
@@ -140,37 +893,42 @@ def demonstrate_aggregated_stats_with_sentinel() -> None:
         print('Nenhuma amostra foi inserida para análise.')
         return 
 
-    title_stat_name_column = 'MÉTRICA ESTATÍSTICA'
-    title_stat_value_column = 'VALOR CALCULADO'
-
-    col_stat_name_width = 25
-    col_stat_value_width = 20
-
-    top_border = f"┌{'─' * (col_stat_name_width + 2)}┬{'─' * (col_stat_value_width + 2)}┐"
-    header_line = f"│ {title_stat_name_column:^{col_stat_name_width}} │ {title_stat_value_column:^{col_stat_value_width}} │"
-    middle_border = f"├{'─' * (col_stat_name_width + 2)}┼{'─' * (col_stat_value_width + 2)}┤"
-    bottom_border = f"└{'─' * (col_stat_name_width + 2)}┴{'─' * (col_stat_value_width + 2)}┘"
-
-    print(top_border)
-    print(header_line)
-    print(middle_border)
+    print_statistical_report(final_report)
 
-    for stat_name, stat_value in final_report.items():
-        if isinstance(stat_value, int):
-            formatted_value = f'{stat_value}'
-        else:
-            formatted_value = f'{stat_value:.2f}'
-
-        data_row = f'│ {stat_name:<{col_stat_name_width}} │ {formatted_value:>{col_stat_value_width}} │'
-        print(data_row)
+def demonstrate_file_report(path: str | os.PathLike[str], workers: int = 1) -> None:
+    """
+    Analisa um arquivo numérico e exibe o mesmo relatório da entrada interativa.
 
-    print(bottom_border)
+    Args:
+        path (str | os.PathLike[str]): O caminho do arquivo CSV ou binário.
+        workers (int, Optional): O número de processos. Padrão é 1.
+    """
+    print(f"\n─ ─ ─ Análise do arquivo '{path}' com {workers} processo(s) ─ ─ ─")
+    start = time.perf_counter()
+    report = generate_file_report(path, {**STATISTICAL_OPERATIONS, **SKETCH_OPERATIONS}, workers=workers)
+    elapsed = time.perf_counter() - start
+    print(f'{os.path.getsize(path) / 1e6:,.1f} MB em {elapsed:.2f} s '
+          f'({os.path.getsize(path) / elapsed / 1e6:,.1f} MB/s)\n')
+    print_statistical_report(report)
 
 def main() -> None:
     """
     Ponto de entrada principal para a execução do módulo.
+
+    Sem argumentos, coleta a amostra interativamente. Com argumentos
+    (`arquivo [processos]`), analisa o arquivo numérico indicado.
     """
-    demonstrate_aggregated_stats_with_sentinel()
+    args = sys.argv[1:]
+    if not args:
+        demonstrate_aggregated_stats_with_sentinel()
+        return
+
+    try:
+        workers = int(args[1]) if len(args) >= 2 else os.cpu_count() or 1
+    except ValueError:
+        print('ERRO: O número de processos deve ser um inteiro.')
+        sys.exit(1)
+    demonstrate_file_report(args[0], workers)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,756 @@
+"""
+Motor de Análise de Frequência de Palavras e N-gramas.
+
+Este módulo complementa o analisador de Markov com a contagem de unigramas,
+bigramas e n-gramas de ordem arbitrária sobre corpora grandes. O projeto
+se apoia em três ideias:
+
+1.  **Contadores combináveis (mergeable):** `NGramCounter` guarda, além das
+    contagens, as primeiras e as últimas `n - 1` palavras do trecho que
+    processou. Com essas "bordas", dois contadores de trechos consecutivos
+    podem ser combinados contando apenas os n-gramas que atravessam a
+    fronteira entre eles, sem perda nem duplicação.
+2.  **Processamento em fatias:** o arquivo é dividido em fatias de bytes
+    alinhadas a quebras de linha; cada fatia é contada de forma
+    independente (opcionalmente em um pool de processos) e os resultados
+    são combinados na ordem original.
+3.  **Memória limitada:** em vez de um `collections.Counter` exato, o
+    contador pode usar um sketch de "heavy hitters" — `SpaceSaving` ou
+    `CountMinSketch` — que mantém apenas os itens mais frequentes com
+    garantias de erro conhecidas.
+"""
+
+from __future__ import annotations
+import heapq
+import io
+import os
+import random
+import time
+import zlib
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from math import ceil, e, log
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union
+)
+from python_sessions.natural_language_processing.text_utils import (
+    locate_gutenberg_body,
+    tokenize
+)
+
+__author__ = 'Enock Silos'
+__email__ = 'init.caucasian722@passfwd.com'
+__status__ = 'Development'
+
+# Tamanho alvo (em bytes) de cada fatia entregue a um processo.
+DEFAULT_CHUNK_BYTES: int = 16 << 20
+# Quantidade de palavras tokenizadas acumuladas antes de cada atualização.
+_TOKEN_BATCH_SIZE: int = 1 << 16
+# Semente dos coeficientes de hash das linhas do `CountMinSketch`.
+_ROW_SALT_SEED: int = 0x5EED
+_MASK_64: int = (1 << 64) - 1
+
+NGram = Union[str, Tuple[str, ...]]
+
+def _stable_key(item: Hashable) -> int:
+    """
+    Calcula uma chave inteira de 32 bits estável entre processos.
+
+    O `hash()` nativo de strings é aleatorizado por processo
+    (PYTHONHASHSEED), o que tornaria sketches de processos diferentes
+    incompatíveis. Usa-se, por isso, o CRC-32 (implementado em C) da forma
+    textual do item; cada linha do sketch espalha a chave com os seus
+    próprios coeficientes (`_row_salts`).
+
+    Args:
+        item (Hashable): Uma palavra ou uma tupla de palavras.
+
+    Returns:
+        int: A chave do item.
+    """
+    text = '\x1f'.join(item) if isinstance(item, tuple) else str(item)
+    return zlib.crc32(text.encode('utf-8'))
+
+def _row_salts(depth: int) -> List[Tuple[int, int]]:
+    """
+    Gera os coeficientes de hashing multiplicativo de cada linha.
+
+    Os coeficientes vêm de uma semente fixa, de modo que sketches de mesmas
+    dimensões, em qualquer processo, usam as mesmas funções de hash.
+    """
+    rng = random.Random(_ROW_SALT_SEED)
+    return [(rng.getrandbits(64) | 1, rng.getrandbits(64)) for _ in range(depth)]
+
+class SpaceSaving:
+    """
+    Sketch Space-Saving para os itens mais frequentes com memória limitada.
+
+    Mantém no máximo `capacity` contadores. Quando um item desconhecido chega
+    e não há espaço, o item com a menor contagem é substituído e o novo item
+    herda essa contagem mínima (registrada como `error`). Toda contagem
+    reportada é, portanto, uma sobrestimativa de no máximo N / capacity,
+    sendo N o total de ocorrências processadas, e qualquer item com
+    frequência real superior a N / capacity está garantidamente presente.
+
+    O menor contador é localizado com um heap "preguiçoso": entradas
+    desatualizadas são descartadas ao serem retiradas do topo.
+
+    Atributos:
+        capacity (int): O número máximo de contadores mantidos.
+        counts (Dict[Hashable, int]): As contagens (sobrestimadas) por item.
+        errors (Dict[Hashable, int]): A sobrestimativa máxima de cada item.
+        total (int): O total de ocorrências processadas.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Inicializa um sketch vazio.
+
+        Args:
+            capacity (int): O número máximo de contadores.
+
+        Raises:
+            ValueError: Se `capacity` não for positivo.
+        """
+        if capacity <= 0:
+            raise ValueError('A capacidade do sketch deve ser positiva.')
+        self.capacity = capacity
+        self.counts: Dict[Hashable, int] = {}
+        self.errors: Dict[Hashable, int] = {}
+        self.total = 0
+        self._heap: List[Tuple[int, int, Hashable]] = []
+        self._sequence = 0
+
+    def _push(self, item: Hashable, count: int) -> None:
+        """
+        Registra a contagem atual de um item no heap de mínimos.
+        """
+        self._sequence += 1
+        heapq.heappush(self._heap, (count, self._sequence, item))
+        if len(self._heap) > 4 * self.capacity:
+            self._heap = [(c, i, key) for i, (key, c) in enumerate(self.counts.items())]
+            heapq.heapify(self._heap)
+
+    def _pop_minimum(self) -> Tuple[Hashable, int]:
+        """
+        Remove e retorna o item com a menor contagem vigente.
+        """
+        while True:
+            count, _, item = heapq.heappop(self._heap)
+            if self.counts.get(item) == count:
+                return item, count
+
+    def add(self, item: Hashable, count: int = 1) -> None:
+        """
+        Contabiliza `count` ocorrências de um item.
+
+        Args:
+            item (Hashable): O item observado.
+            count (int, Optional): O número de ocorrências. Padrão é 1.
+        """
+        self.total += count
+        counts = self.counts
+        current = counts.get(item)
+        if current is not None:
+            counts[item] = current + count
+            self._push(item, current + count)
+            return
+
+        if len(counts) < self.capacity:
+            counts[item] = count
+            self.errors[item] = 0
+            self._push(item, count)
+            return
+
+        evicted, minimum = self._pop_minimum()
+        del counts[evicted]
+        del self.errors[evicted]
+        counts[item] = minimum + count
+        self.errors[item] = minimum
+        self._push(item, minimum + count)
+
+    def update(self, items: Iterable[Hashable]) -> None:
+        """
+        Contabiliza uma ocorrência de cada item do iterável.
+
+        Os itens são pré-agregados em lote com `Counter` (implementado em C)
+        antes de alimentar o sketch, o que reduz drasticamente o número de
+        operações no heap para fluxos com muitas repetições.
+
+        Args:
+            items (Iterable[Hashable]): Os itens observados.
+        """
+        iterator = iter(items)
+        while True:
+            batch = Counter(islice(iterator, _TOKEN_BATCH_SIZE))
+            if not batch:
+                return
+            for item, count in batch.items():
+                self.add(item, count)
+
+    def merge(self, other: SpaceSaving) -> SpaceSaving:
+        """
+        Combina outro sketch a este (operação in-place).
+
+        Segue a combinação de Agarwal et al. (2012): as contagens são somadas
+        e apenas os `capacity` maiores contadores são mantidos, preservando a
+        garantia de erro de N / capacity sobre o total combinado.
+
+        Args:
+            other (SpaceSaving): O sketch a ser incorporado.
+
+        Returns:
+            SpaceSaving: Este próprio sketch, para encadeamento.
+        """
+        combined: Dict[Hashable, int] = dict(self.counts)
+        errors: Dict[Hashable, int] = dict(self.errors)
+        self_floor = min(self.counts.values()) if len(self.counts) >= self.capacity else 0
+        other_floor = min(other.counts.values()) if len(other.counts) >= other.capacity else 0
+
+        for item in combined:
+            if item not in other.counts:
+                combined[item] += other_floor
+                errors[item] += other_floor
+        for item, count in other.counts.items():
+            if item in combined:
+                combined[item] += count
+                errors[item] += other.errors[item]
+            else:
+                combined[item] = count + self_floor
+                errors[item] = other.errors[item] + self_floor
+
+        survivors = heapq.nlargest(self.capacity, combined.items(), key=lambda pair: pair[1])
+        self.counts = dict(survivors)
+        self.errors = {item: errors[item] for item in self.counts}
+        self.total += other.total
+        self._heap = [(c, i, key) for i, (key, c) in enumerate(self.counts.items())]
+        heapq.heapify(self._heap)
+        return self
+
+    def most_common(self, k: Optional[int] = None) -> List[Tuple[Hashable, int]]:
+        """
+        Retorna os `k` itens de maior contagem, em ordem decrescente.
+
+        Args:
+            k (Optional[int], Optional): Quantos itens retornar. Todos, se None.
+
+        Returns:
+            List[Tuple[Hashable, int]]: Pares (item, contagem estimada).
+        """
+        ranked = sorted(self.counts.items(), key=lambda pair: pair[1], reverse=True)
+        return ranked if k is None else ranked[:k]
+
+class CountMinSketch:
+    """
+    Sketch Count-Min para estimar frequências com memória fixa.
+
+    Uma matriz de `depth` linhas por `width` colunas de contadores; cada item
+    incrementa uma célula por linha, escolhida por hashing multiplicativo
+    de uma chave CRC-32 com coeficientes próprios da linha. A estimativa
+    de um item é o mínimo das suas células: nunca subestima e, com
+    probabilidade 1 - δ, superestima em no máximo ε·N, para
+    `width = ⌈e / ε⌉` e `depth = ⌈ln(1 / δ)⌉`.
+
+    Opcionalmente (`track_top > 0`), mantém um pequeno conjunto de
+    candidatos a "heavy hitters" com as maiores estimativas, permitindo
+    consultas de top-k. O candidato mais fraco é localizado com um heap
+    "preguiçoso", como em `SpaceSaving`.
+
+    Atributos:
+        width (int): O número de colunas.
+        depth (int): O número de linhas.
+        track_top (int): O número de candidatos a top-k mantidos.
+        total (int): O total de ocorrências processadas.
+    """
+
+    def __init__(self, width: int = 1 << 14, depth: int = 5, track_top: int = 0) -> None:
+        """
+        Inicializa um sketch zerado.
+
+        Args:
+            width (int, Optional): As colunas da matriz. Padrão é 16384.
+            depth (int, Optional): As linhas da matriz. Padrão é 5.
+            track_top (int, Optional): Candidatos a top-k mantidos. Padrão é 0.
+
+        Raises:
+            ValueError: Se `width` ou `depth` não forem positivos.
+        """
+        if width <= 0 or depth <= 0:
+            raise ValueError('A largura e a profundidade do sketch devem ser positivas.')
+        self.width = width
+        self.depth = depth
+        self.track_top = track_top
+        self.total = 0
+        self._table: List[List[int]] = [[0] * width for _ in range(depth)]
+        self._salts = _row_salts(depth)
+        self._candidates: Dict[Hashable, int] = {}
+        self._heap: List[Tuple[int, int, Hashable]] = []
+        self._sequence = 0
+
+    @classmethod
+    def from_error_bounds(cls, epsilon: float, delta: float, track_top: int = 0) -> CountMinSketch:
+        """
+        Dimensiona o sketch a partir das garantias de erro desejadas.
+
+        Args:
+            epsilon (float): O erro aditivo relativo ao total (ex: 0.001).
+            delta (float): A probabilidade de a garantia falhar (ex: 0.01).
+            track_top (int, Optional): Candidatos a top-k mantidos.
+
+        Returns:
+            CountMinSketch: Um sketch com `width = ⌈e / ε⌉` e `depth = ⌈ln(1 / δ)⌉`.
+        """
+        return cls(width=ceil(e / epsilon), depth=max(1, ceil(log(1 / delta))), track_top=track_top)
+
+    def _cells(self, item: Hashable) -> List[int]:
+        """
+        Calcula a coluna de cada linha para o item (hashing multiplicativo).
+        """
+        key = _stable_key(item)
+        width = self.width
+        return [(((multiplier * key + increment) & _MASK_64) >> 32) % width for multiplier, increment in self._salts]
+
+    def add(self, item: Hashable, count: int = 1) -> None:
+        """
+        Contabiliza `count` ocorrências de um item.
+
+        Args:
+            item (Hashable): O item observado.
+            count (int, Optional): O número de ocorrências. Padrão é 1.
+        """
+        self.total += count
+        estimate = self.total
+        for row, column in zip(self._table, self._cells(item)):
+            row[column] = cell = row[column] + count
+            if cell < estimate:
+                estimate = cell
+        if self.track_top:
+            self._track(item, estimate)
+
+    def _push(self, item: Hashable, estimate: int) -> None:
+        """
+        Registra a estimativa atual de um candidato no heap de mínimos.
+        """
+        self._sequence += 1
+        heapq.heappush(self._heap, (estimate, self._sequence, item))
+        if len(self._heap) > 4 * self.track_top:
+            self._rebuild_heap()
+
+    def _rebuild_heap(self) -> None:
+        """
+        Reconstrói o heap apenas com as estimativas vigentes dos candidatos.
+        """
+        self._heap = [(estimate, i, item) for i, (item, estimate) in enumerate(self._candidates.items())]
+        heapq.heapify(self._heap)
+
+    def _track(self, item: Hashable, estimate: int) -> None:
+        """
+        Atualiza o conjunto de candidatos a top-k com uma nova estimativa.
+        """
+        candidates = self._candidates
+        if item in candidates or len(candidates) < self.track_top:
+            candidates[item] = estimate
+            self._push(item, estimate)
+            return
+
+        heap = self._heap
+        # Descarta do topo as entradas desatualizadas ou de itens removidos.
+        while candidates.get(heap[0][2]) != heap[0][0]:
+            heapq.heappop(heap)
+        if estimate > heap[0][0]:
+            _, _, weakest = heapq.heappop(heap)
+            del candidates[weakest]
+            candidates[item] = estimate
+            self._push(item, estimate)
+
+    def update(self, items: Iterable[Hashable]) -> None:
+        """
+        Contabiliza uma ocorrência de cada item do iterável (pré-agregado em lote).
+
+        Args:
+            items (Iterable[Hashable]): Os itens observados.
+        """
+        iterator = iter(items)
+        while True:
+            batch = Counter(islice(iterator, _TOKEN_BATCH_SIZE))
+            if not batch:
+                return
+            for item, count in batch.items():
+                self.add(item, count)
+
+    def estimate(self, item: Hashable) -> int:
+        """
+        Estima a frequência de um item (nunca a subestima).
+
+        Args:
+            item (Hashable): O item consultado.
+
+        Returns:
+            int: A menor das contagens nas células do item.
+        """
+        return min(row[column] for row, column in zip(self._table, self._cells(item)))
+
+    def merge(self, other: CountMinSketch) -> CountMinSketch:
+        """
+        Combina outro sketch de mesmas dimensões a este (operação in-place).
+
+        Args:
+            other (CountMinSketch): O sketch a ser incorporado.
+
+        Returns:
+            CountMinSketch: Este próprio sketch, para encadeamento.
+
+        Raises:
+            ValueError: Se as dimensões dos sketches forem diferentes.
+        """
+        if (self.width, self.depth) != (other.width, other.depth):
+            raise ValueError('Apenas sketches de mesmas dimensões podem ser combinados.')
+        for row, other_row in zip(self._table, other._table):
+            for column, value in enumerate(other_row):
+                if value:
+                    row[column] += value
+        self.total += other.total
+
+        if self.track_top:
+            pool = set(self._candidates) | set(other._candidates)
+            estimates = {item: self.estimate(item) for item in pool}
+            best = heapq.nlargest(self.track_top, estimates.items(), key=lambda pair: pair[1])
+            self._candidates = dict(best)
+            self._rebuild_heap()
+        return self
+
+    def most_common(self, k: Optional[int] = None) -> List[Tuple[Hashable, int]]:
+        """
+        Retorna os candidatos de maior estimativa, em ordem decrescente.
+
+        Args:
+            k (Optional[int], Optional): Quantos itens retornar. Todos, se None.
+
+        Returns:
+            List[Tuple[Hashable, int]]: Pares (item, contagem estimada).
+        """
+        ranked = sorted(
+            ((item, self.estimate(item)) for item in self._candidates),
+            key=lambda pair: pair[1],
+            reverse=True
+        )
+        return ranked if k is None else ranked[:k]
+
+CountBackend = Union[Counter, SpaceSaving, CountMinSketch]
+
+class NGramCounter:
+    """
+    Contador combinável de n-gramas sobre um fluxo de palavras.
+
+    Para `n == 1`, as chaves são as próprias palavras; para `n > 1`, tuplas de
+    `n` palavras. A estrutura de contagem (backend) é plugável: um `Counter`
+    exato (padrão) ou um dos sketches de memória limitada deste módulo, pois
+    todos oferecem `update`, `merge` e `most_common`.
+
+    As bordas (`head` e `tail`, com até `n - 1` palavras cada) tornam o
+    contador um monoide: `a.merge(b)` produz exatamente as contagens do
+    texto de `a` seguido pelo texto de `b`.
+
+    Atributos:
+        n (int): A ordem dos n-gramas.
+        counts (CountBackend): A estrutura de contagem.
+        head (List[str]): As primeiras `n - 1` palavras processadas.
+        tail (List[str]): As últimas `n - 1` palavras processadas.
+        total_tokens (int): O total de palavras processadas.
+    """
+
+    def __init__(self, n: int = 1, counts: Optional[CountBackend] = None) -> None:
+        """
+        Inicializa um contador vazio.
+
+        Args:
+            n (int, Optional): A ordem dos n-gramas. Padrão é 1 (unigramas).
+            counts (Optional[CountBackend], Optional): O backend de contagem.
+                Se None, um `Counter` exato é utilizado.
+
+        Raises:
+            ValueError: Se `n` não for positivo.
+        """
+        if n < 1:
+            raise ValueError('A ordem dos n-gramas deve ser positiva.')
+        self.n = n
+        self.counts: CountBackend = Counter() if counts is None else counts
+        self.head: List[str] = []
+        self.tail: List[str] = []
+        self.total_tokens = 0
+
+    def _count_sequence(self, words: Sequence[str]) -> None:
+        """
+        Conta todos os n-gramas completos de uma sequência contígua.
+        """
+        if self.n == 1:
+            self.counts.update(words)
+        elif len(words) >= self.n:
+            self.counts.update(zip(*(islice(words, i, None) for i in range(self.n))))
+
+    def update(self, tokens: Iterable[str]) -> None:
+        """
+        Processa mais palavras, continuando a partir do fim do fluxo anterior.
+
+        As palavras são consumidas em lotes; cada lote é precedido pela
+        cauda (`tail`) do lote anterior, de modo que os n-gramas que cruzam
+        a fronteira entre lotes também sejam contados.
+
+        Args:
+            tokens (Iterable[str]): As próximas palavras do texto.
+        """
+        keep = self.n - 1
+        iterator = iter(tokens)
+        while True:
+            batch = list(islice(iterator, _TOKEN_BATCH_SIZE))
+            if not batch:
+                return
+            self.total_tokens += len(batch)
+            if len(self.head) < keep:
+                self.head.extend(batch[:keep - len(self.head)])
+            window = self.tail + batch if keep else batch
+            self._count_sequence(window)
+            if keep:
+                self.tail = window[-keep:]
+
+    def merge(self, other: NGramCounter) -> NGramCounter:
+        """
+        Incorpora o contador do trecho de texto imediatamente seguinte.
+
+        Args:
+            other (NGramCounter): O contador do trecho seguinte (mesma ordem).
+
+        Returns:
+            NGramCounter: Este próprio contador, para encadeamento.
+
+        Raises:
+            ValueError: Se as ordens dos contadores forem diferentes.
+        """
+        if other.n != self.n:
+            raise ValueError('Apenas contadores de mesma ordem podem ser combinados.')
+        keep = self.n - 1
+
+        if isinstance(self.counts, Counter):
+            self.counts.update(other.counts)
+        else:
+            self.counts.merge(other.counts)  # type: ignore[arg-type]
+
+        if keep:
+            self._count_sequence(self.tail + other.head)
+            self.head = (self.head + other.head)[:keep]
+            self.tail = (self.tail + other.tail)[-keep:]
+        self.total_tokens += other.total_tokens
+        return self
+
+    def most_common(self, k: Optional[int] = None) -> List[Tuple[Any, int]]:
+        """
+        Retorna os `k` n-gramas mais frequentes.
+
+        Args:
+            k (Optional[int], Optional): Quantos n-gramas retornar. Todos, se None.
+
+        Returns:
+            List[Tuple[Any, int]]: Pares (n-grama, contagem).
+        """
+        return self.counts.most_common(k)
+
+def _make_counter(n: int, sketch: Optional[str], capacity: Optional[int]) -> NGramCounter:
+    """
+    Constrói um `NGramCounter` com o backend solicitado.
+
+    Args:
+        n (int): A ordem dos n-gramas.
+        sketch (Optional[str]): 'space-saving', 'count-min' ou None (exato).
+        capacity (Optional[int]): Os contadores mantidos pelo sketch.
+
+    Returns:
+        NGramCounter: O contador configurado.
+
+    Raises:
+        ValueError: Se o nome do sketch for desconhecido.
+    """
+    if sketch is None:
+        return NGramCounter(n)
+    if sketch == 'space-saving':
+        return NGramCounter(n, SpaceSaving(capacity or 1000))
+    if sketch == 'count-min':
+        return NGramCounter(n, CountMinSketch(track_top=capacity or 1000))
+    raise ValueError(f'Sketch desconhecido: {sketch}')
+
+def split_into_chunks(
+    filename: str | os.PathLike[str],
+    start: int,
+    end: int,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES
+) -> List[Tuple[int, int]]:
+    """
+    Divide o intervalo `[start, end)` de um arquivo em fatias alinhadas a linhas.
+
+    Cada fronteira provisória (múltiplo de `chunk_bytes`) é avançada até o
+    início da linha seguinte, garantindo que nenhuma palavra nem caractere
+    UTF-8 de vários bytes seja partido entre duas fatias.
+
+    Args:
+        filename (str | os.PathLike[str]): O caminho do arquivo.
+        start (int): O deslocamento inicial, em bytes.
+        end (int): O deslocamento final (exclusivo), em bytes.
+        chunk_bytes (int, Optional): O tamanho alvo de cada fatia.
+
+    Returns:
+        List[Tuple[int, int]]: Os intervalos `(início, fim)` de cada fatia.
+
+    Raises:
+        ValueError: Se `chunk_bytes` não for positivo.
+    """
+    if chunk_bytes <= 0:
+        raise ValueError('O tamanho da fatia deve ser um inteiro positivo.')
+
+    boundaries = [start]
+    with open(filename, 'rb') as binary_pointer:
+        position = start + chunk_bytes
+        while position < end:
+            binary_pointer.seek(position)
+            binary_pointer.readline()
+            aligned = min(binary_pointer.tell(), end)
+            if aligned > boundaries[-1]:
+                boundaries.append(aligned)
+            position = max(aligned, position) + chunk_bytes
+    if boundaries[-1] < end:
+        boundaries.append(end)
+
+    return list(zip(boundaries, boundaries[1:]))
+
+def _count_chunk(task: Tuple[str, int, int, int, Optional[str], Optional[int], Dict[str, Any]]) -> NGramCounter:
+    """
+    Conta os n-gramas de uma fatia de arquivo (executado nos processos do pool).
+
+    Args:
+        task: Uma tupla `(arquivo, início, fim, n, sketch, capacidade,
+            opções do tokenizador)`. Uma única tupla é usada para que a tarefa
+            seja facilmente serializada (pickle) para o processo trabalhador.
+
+    Returns:
+        NGramCounter: O contador da fatia, com as suas bordas.
+    """
+    filename, start, end, n, sketch, capacity, tokenizer_options = task
+    with open(filename, 'rb') as binary_pointer:
+        binary_pointer.seek(start)
+        text = binary_pointer.read(end - start).decode('utf-8', errors='replace')
+
+    counter = _make_counter(n, sketch, capacity)
+    counter.update(tokenize(io.StringIO(text), skip_gutenberg=False, **tokenizer_options))
+    return counter
+
+def count_ngrams(
+    filename: str | os.PathLike[str],
+    n: int = 1,
+    *,
+    workers: int = 1,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    sketch: Optional[str] = None,
+    capacity: Optional[int] = None,
+    skip_gutenberg: bool = True,
+    **tokenizer_options: Any
+) -> NGramCounter:
+    """
+    Conta os n-gramas de um arquivo de texto, opcionalmente em paralelo.
+
+    O corpo do texto (sem o cabeçalho e o rodapé do Projeto Gutenberg) é
+    dividido em fatias alinhadas a linhas. Cada fatia é tokenizada e contada
+    de forma independente — em um `ProcessPoolExecutor` quando
+    `workers > 1` — e os contadores parciais são combinados na ordem do
+    texto, recuperando os n-gramas que atravessam as fronteiras.
+
+    Args:
+        filename (str | os.PathLike[str]): O caminho do arquivo de texto.
+        n (int, Optional): A ordem dos n-gramas. Padrão é 1.
+        workers (int, Optional): O número de processos. Padrão é 1 (serial).
+        chunk_bytes (int, Optional): O tamanho alvo de cada fatia.
+        sketch (Optional[str], Optional): 'space-saving' ou 'count-min' para
+            memória limitada; None (padrão) para contagem exata.
+        capacity (Optional[int], Optional): Os contadores mantidos pelo sketch.
+        skip_gutenberg (bool, Optional): Remove cabeçalho e rodapé do Projeto
+            Gutenberg. Padrão é True.
+        **tokenizer_options: Opções repassadas para `tokenize` (ex:
+            `lowercase=True`, `strip_punctuation=True`).
+
+    Returns:
+        NGramCounter: O contador combinado de todo o arquivo.
+    """
+    filename = os.fspath(filename)
+    if skip_gutenberg:
+        start, end = locate_gutenberg_body(filename)
+    else:
+        start, end = 0, os.path.getsize(filename)
+
+    tasks = [
+        (filename, chunk_start, chunk_end, n, sketch, capacity, tokenizer_options)
+        for chunk_start, chunk_end in split_into_chunks(filename, start, end, chunk_bytes)
+    ]
+
+    result = _make_counter(n, sketch, capacity)
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for partial in executor.map(_count_chunk, tasks):
+                result.merge(partial)
+    else:
+        for task in tasks:
+            result.merge(_count_chunk(task))
+    return result
+
+def benchmark_ngram_counting(
+    filename: str | os.PathLike[str],
+    n: int = 2,
+    workers: Sequence[int] = (1, 2, 4),
+    **options: Any
+) -> Dict[int, float]:
+    """
+    Mede a vazão de `count_ngrams` (MB/s) para diferentes números de processos.
+
+    Args:
+        filename (str | os.PathLike[str]): O caminho do arquivo de texto.
+        n (int, Optional): A ordem dos n-gramas. Padrão é 2.
+        workers (Sequence[int], Optional): As configurações de processos.
+        **options: Opções repassadas para `count_ngrams`.
+
+    Returns:
+        Dict[int, float]: A vazão, em MB/s, para cada número de processos.
+    """
+    size_in_bytes = os.path.getsize(filename)
+    throughput: Dict[int, float] = {}
+    for worker_count in workers:
+        start = time.perf_counter()
+        count_ngrams(filename, n, workers=worker_count, **options)
+        throughput[worker_count] = size_in_bytes / (time.perf_counter() - start) / 1e6
+    return throughput
+
+if __name__ == '__main__':
+    from pathlib import Path
+
+    sample_file = Path(__file__).parent / 'emma.txt'
+
+    print(f"Bigramas mais frequentes em '{sample_file.name}' (contagem exata):")
+    exact = count_ngrams(sample_file, 2, lowercase=True, strip_punctuation=True)
+    for ngram, count in exact.most_common(5):
+        print(f'  {" ".join(ngram):<20} {count:>6}')
+
+    print('\nOs mesmos bigramas com Space-Saving (4096 contadores):')
+    approximate = count_ngrams(
+        sample_file, 2, sketch='space-saving', capacity=4096,
+        lowercase=True, strip_punctuation=True, chunk_bytes=1 << 18
+    )
+    for ngram, count in approximate.most_common(5):
+        print(f'  {" ".join(ngram):<20} {count:>6}')
+
+    print('\nVazão (MB/s) por número de processos:')
+    for worker_count, rate in benchmark_ngram_counting(sample_file, chunk_bytes=1 << 18).items():
+        print(f'  {worker_count} processo(s): {rate:8.2f} MB/s')
@@ -9,8 +9,12 @@ pseudoaleatório que imita o estilo do original.
 from __future__ import print_function, division
 import sys
 import random
-from typing import Dict, List, Tuple 
-from text_utils import skip_gutenberg_header, shift
+from typing import Dict, List, Optional
+from python_sessions.natural_language_processing.text_utils import (
+    RollingWindow,
+    TokenVocabulary,
+    tokenize
+)
 from pathlib import Path
 
 __author__ = 'Enock Silos'
@@ -26,21 +30,29 @@ class Markov:
     caso "estados" são sequências de palavras, ou "prefixos"). Após a análise
     de um texto-fonte, a classe pode usar este mapa para gerar um novo texto
     que imita as características estatísticas do original.
+
+    Internamente, as palavras são convertidas em IDs inteiros por um
+    `TokenVocabulary` e cada prefixo é representado por uma única chave
+    inteira produzida por uma `RollingWindow`, evitando a criação de uma
+    nova tupla a cada palavra processada.
     """
 
     def __init__(self):
         """
         Inicializa o analisador de Markov.
 
-        O construtor prepara o objeto para a análise, criando os dois atributos
+        O construtor prepara o objeto para a análise, criando os atributos
         de estado essenciais: `suffix_map`, que armazenará o conhecimento 
-        aprendido do texto, e `prefix`, que atuará como a "memória" de curto
-        prazo do analisador enquanto ele lê o texto.
+        aprendido do texto, `vocabulary`, que traduz palavras em IDs, e
+        `window`, que atuará como a "memória" de curto prazo do analisador
+        enquanto ele lê o texto.
         """
-        # Mapeia um prefixo (tupla de palavras) para uma lista de sufixos possíveis.
-        self.suffix_map: Dict[Tuple[str, ...], List[str]] = {}
-        # A janela "deslizante" atual de palavras.        
-        self.prefix: Tuple[str, ...] = ()   
+        # Mapeia a chave de um prefixo para a lista de IDs dos sufixos possíveis.
+        self.suffix_map: Dict[int, List[int]] = {}
+        # Tradução entre palavras e IDs inteiros.
+        self.vocabulary = TokenVocabulary()
+        # A janela "deslizante" atual de palavras (criada no primeiro uso).
+        self.window: Optional[RollingWindow] = None
 
     def process_file(self, filename: str, order: int = 2) -> None:
         """
@@ -52,6 +64,10 @@ class Markov:
         A utilização de um gestor de contexto (`with open(...)`) garante que o arquivo
         seja fechado corretamente, mesmo em caso de erros.
 
+        A leitura é delegada ao pipeline `tokenize` do módulo `text_utils`, que
+        processa o arquivo em grandes blocos e remove automaticamente o
+        cabeçalho e o rodapé do Projeto Gutenberg.
+
         Args:
             filename (str): O caminho para o arquivo de texto a ser analisado.
             order (int, Optional): A ordem da Cadeia de Markov, ou seja, o número
@@ -60,11 +76,14 @@ class Markov:
         """
         try:
             with open(filename, 'r', encoding='utf-8') as file_pointer:
-                skip_gutenberg_header(file_pointer)        
-                for line in file_pointer:
-
-                    for word in line.rstrip().split():
-                        self.process_word(word, order)
+                window = self._get_window(order)
+                suffix_map = self.suffix_map
+                token_ids = self.vocabulary.encode_all(tokenize(file_pointer))
+                for key, token_id in window.slide(token_ids):
+                    try:
+                        suffix_map[key].append(token_id)
+                    except KeyError:
+                        suffix_map[key] = [token_id]
         except FileNotFoundError:
             print(f"ERRO: O arquivo '{filename}' não foi encontrado.")
         except Exception as e:
@@ -87,22 +106,47 @@ class Markov:
             order (int, Optional): A ordem da análise, necessária para determinar
                 o fim da fase de "aquecimento".
         """
+        window = self._get_window(order)
+        token_id = self.vocabulary.encode(word)
+
         # Fase de "aquecimento": apenas acumula o primeiro prefixo
-        if len(self.prefix) < order:
-            self.prefix += (word,)
+        if not window.is_full:
+            window.push(token_id)
             return
-        
+
         # Tenta adicionar o sufixo à lista existente. Esta abordagem de
         # "tentar primeiro e tratar o erro depois (EAFP)" é comum e eficiente
         # em Python para popular dicionários.
         try:
-            self.suffix_map[self.prefix].append(word)
+            self.suffix_map[window.key].append(token_id)
         except KeyError:
             # Se o prefixo é novo, cria uma nova entrada no mapa.
-            self.suffix_map[self.prefix] = [word]
+            self.suffix_map[window.key] = [token_id]
 
         # Move a "janela deslizante" uma palavra para a frente.
-        self.prefix = shift(self.prefix, word)        
+        window.push(token_id)
+
+    def _get_window(self, order: int) -> RollingWindow:
+        """
+        Retorna a janela deslizante, criando-a no primeiro uso.
+
+        Args:
+            order (int): A ordem da análise.
+
+        Returns:
+            RollingWindow: A janela associada a este analisador.
+
+        Raises:
+            ValueError: Se a ordem divergir da usada nas chamadas anteriores,
+                pois chaves de ordens diferentes não são comparáveis.
+        """
+        if self.window is None:
+            self.window = RollingWindow(order)
+        elif self.window.order != order:
+            raise ValueError(
+                f'A ordem {order} difere da ordem {self.window.order} já utilizada.'
+            )
+        return self.window
 
     def random_text(self, n: int = 100) -> str:
         """
@@ -121,29 +165,33 @@ class Markov:
             str: Uma string contendo o texto gerado. Se o mapa de sufixos 
                 estiver vazio, retorna uma mensagem de erro.
         """
-        if not self.suffix_map:
+        if not self.suffix_map or self.window is None:
             return 'ERRO: O mapa de sufixos está vazio. Processe um arquivo primeiro.'
-        
+
+        prefixes = list(self.suffix_map.keys())
+        generator = RollingWindow(self.window.order, self.window.bits)
+
         # Escolhe um prefixo aleatoriamente para começar.
-        start = random.choice(list(self.suffix_map.keys()))
-        generated_words = list(start)
+        start = random.choice(prefixes)
+        generated_ids = list(generator.decode(start))
+        generator.key, generator.filled = start, generator.order
 
-        for _ in range(n - len(start)):
-            suffixes = self.suffix_map.get(start)
+        for _ in range(n - len(generated_ids)):
+            suffixes = self.suffix_map.get(generator.key)
             if not suffixes:
                 # Se chegamos a um "beco sem saída" (um prefixo que estava no
                 # final do texto original), recomeçamos com um novo prefixo
                 # aleatório para evitar parar a geração.
-                start = random.choice(list(self.suffix_map.keys()))
+                generator.key = random.choice(prefixes)
                 continue 
 
             # A escolha aleatória de um sufixo imita a probabilidade
             # estatística do texto original.
-            word = random.choice(suffixes)
-            generated_words.append(word)
-            start = shift(start, word)
+            token_id = random.choice(suffixes)
+            generated_ids.append(token_id)
+            generator.push(token_id)
 
-        return ' '.join(generated_words)
+        return ' '.join(self.vocabulary.decode(token_id) for token_id in generated_ids)
 
 def main() -> None:
     """
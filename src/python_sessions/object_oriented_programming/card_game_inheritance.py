@@ -10,7 +10,8 @@ herdar e especializar o comportamento de uma superclasse (`Deck`).
 
 from __future__ import annotations
 import random
-from typing import List, Optional, Type
+import time
+from typing import Dict, List, Optional, Tuple, Type
 
 __author__ = 'Enock Silos'
 __email__ = 'init.caucasian722@passfwd.com'
@@ -20,22 +21,73 @@ class Card:
     """
     Representa uma carta de baralho padrão.
 
+    Existem apenas 52 cartas distintas, então cada uma é criada uma única vez
+    e compartilhada: `Card(2, 12)` sempre retorna o mesmo objeto (a Dama de
+    Copas). Por isso as cartas são imutáveis e usam `__slots__`, sem um
+    `__dict__` por instância.
+
     Atributos:
         suit (int): Naipe da carta, representado por um inteiro de 0 a 3.
         rank (int): Valor da carta, representado por um inteiro de 1 a 13.
+        code (int): A codificação inteira da carta, `suit * 13 + rank - 1`
+            (de 0 a 51, na ordem em que `Deck` cria as cartas).
     """
+    __slots__ = ('suit', 'rank', 'code')
+
     suit_names: List[str] = ["Clubs", "Diamonds", "Hearts", "Spades"]
     rank_names: List[Optional[str]] = [
     None, "Ace", "2", "3", "4", "5", "6", "7", 
     "8", "9", "10", "Jack", "Queen", "King"
     ]
 
-    def __init__(self, suit: int = 0, rank: int = 2) -> None:
+    # As 52 instâncias compartilhadas, indexadas pelo código.
+    _interned: List[Card] = []
+
+    def __new__(cls, suit: int = 0, rank: int = 2) -> Card:
+        """
+        Retorna a instância compartilhada da carta, criando-a na primeira vez.
+
+        Raises:
+            ValueError: Se o naipe não estiver entre 0 e 3 ou o valor entre 1 e 13.
         """
-        Inicializa uma instância de `Card`
+        if not (0 <= suit <= 3 and 1 <= rank <= 13):
+            raise ValueError(f'Carta inválida: naipe {suit}, valor {rank}.')
+        code = suit * 13 + rank - 1
+        if len(Card._interned) > code:
+            return Card._interned[code]
+        card = super().__new__(cls)
+        object.__setattr__(card, 'suit', suit)
+        object.__setattr__(card, 'rank', rank)
+        object.__setattr__(card, 'code', code)
+        return card
+
+    @classmethod
+    def from_code(cls, code: int) -> Card:
         """
-        self.suit = suit
-        self.rank = rank
+        Retorna a carta de um código de 0 a 51.
+        """
+        return Card._interned[code]
+
+    def __setattr__(self, name: str, value: object) -> None:
+        """
+        Impede a alteração de uma carta compartilhada.
+
+        Raises:
+            AttributeError: Sempre.
+        """
+        raise AttributeError('Cartas são imutáveis.')
+
+    def __reduce__(self) -> tuple:
+        """
+        Preserva a instância compartilhada em `pickle` e `copy`.
+        """
+        return (Card, (self.suit, self.rank))
+
+    def __hash__(self) -> int:
+        """
+        Retorna o código da carta como hash.
+        """
+        return self.code
 
     def __str__(self) -> str:
         """
@@ -48,7 +100,7 @@ class Card:
         Compara esta carta (self) com outra (other), primeiro por naipe, depois por valor.
 
         Este método especial sobrecarrega o operador `<`, permitindo que objetos
-        `Card` sejam ordenados.
+        `Card` sejam ordenados. A ordem (naipe, valor) é a mesma dos códigos.
 
         Args:
             other (Card): O outro objeto Card a ser comparado com este.
@@ -56,9 +108,11 @@ class Card:
         Returns:
             bool: True se `self` for menor que `other`, False, caso contrário.
         """
-        t1 = (self.suit, self.rank)
-        t2 = (other.suit, other.rank)
-        return t1 < t2
+        return self.code < other.code
+
+Card._interned = [Card(suit, rank) for suit in range(4) for rank in range(1, 14)]
+# As 52 cartas na ordem de um baralho novo, reutilizadas por todo `Deck`.
+_FULL_DECK: Tuple[Card, ...] = tuple(Card._interned)
 
 class Deck:
     """
@@ -71,12 +125,11 @@ class Deck:
     def __init__(self) -> None:
         """
         Inicializa o Deck com 52 cartas padrão.
+
+        As cartas são as instâncias compartilhadas de `Card`; apenas a lista
+        é nova.
         """
-        self.cards = []
-        for suit in range(4):
-            for rank in range(1, 14):
-                card = Card(suit, rank)
-                self.cards.append(card)
+        self.cards = list(_FULL_DECK)
 
     def __str__(self) -> str:
         """
@@ -127,12 +180,23 @@ class Deck:
         """
         Move um número de cartas deste baralho para uma mão.
 
+        As cartas chegam à mão na mesma ordem de `num` chamadas a
+        `pop_card` (a do topo primeiro), mas são movidas por fatiamento, em
+        uma única operação.
+
         Args:
             hand (Hand): O objeto Hand de destino para onde as cartas serão movidas.
             num (int): O número de cartas a serem movidas.
+
+        Raises:
+            IndexError: Se o baralho não tiver `num` cartas.
         """
-        for _ in range(num):
-            hand.add_card(self.pop_card())
+        if num > len(self.cards):
+            raise IndexError(f'O baralho tem apenas {len(self.cards)} cartas.')
+        if num <= 0:
+            return
+        hand.cards.extend(self.cards[:-num - 1:-1])
+        del self.cards[-num:]
 
     def deal_hands(
             self, num_hands: int,
@@ -146,6 +210,12 @@ class Deck:
         mãos do tipo especificado em `hand_class`. Se nenhuma classe for
         fornecida, ele usa a classe `Hand` como padrão.
 
+        As cartas são distribuídas uma por vez para cada mão, a partir do
+        topo: a `i`-ésima carta da mão `h` é a carta `i * num_hands + h`
+        contando do topo. Em vez de uma chamada a `pop_card` por carta, cada
+        mão recebe a sua fatia alternada do topo (`cards[-1 - h::-num_hands]`)
+        de uma só vez, e as cartas distribuídas são removidas juntas.
+
         Args:
             num_hands (int): O número de mãos a serem criadas.
             cards_per_hand (int): O número de cartas a serem distribuídas para cada mão.
@@ -154,22 +224,40 @@ class Deck:
 
         Returns:
             List[Hand]: Uma lista contendo as instâncias de mão criadas e populadas.
+
+        Raises:
+            IndexError: Se o baralho não tiver cartas suficientes.
         """
         if hand_class is None:
             hand_class = Hand
 
+        dealt = num_hands * cards_per_hand
+        if dealt > len(self.cards):
+            raise IndexError(f'O baralho tem apenas {len(self.cards)} cartas.')
+        top = self.cards[len(self.cards) - dealt:]
+
         hands = []
 
         for i in range(num_hands):
-            hands.append(hand_class(f'Mão do jogador {i+1}'))
-        # Distribui as cartas uma por vez para cada mão
-        for i in range(cards_per_hand):
-            for hand in hands:
-                card = self.pop_card()
-                hand.add_card(card)
+            hand = hand_class(f'Mão do jogador {i+1}')
+            hand.cards.extend(top[dealt - 1 - i::-num_hands])
+            hands.append(hand)
+
+        if dealt:
+            del self.cards[-dealt:]
 
         return hands
 
+    def reset(self) -> None:
+        """
+        Devolve as 52 cartas ao baralho, na ordem de um baralho novo.
+
+        A lista existente é reaproveitada (atribuição de fatia), de modo que
+        um mesmo `Deck` pode ser embaralhado e distribuído repetidamente sem
+        alocar um baralho novo a cada rodada.
+        """
+        self.cards[:] = _FULL_DECK
+
 class Hand(Deck):
     """
     Representa uma mão de cartas de um jogador.
@@ -190,6 +278,37 @@ class Hand(Deck):
         self.cards: List[Card] = []
         self.label = label
 
+def benchmark_deck(iterations: int = 10_000) -> Dict[str, float]:
+    """
+    Mede o custo de criar, embaralhar e distribuir um baralho.
+
+    Args:
+        iterations (int, Optional): As repetições de cada operação.
+
+    Returns:
+        Dict[str, float]: Os microssegundos por operação de 'create' (um
+            `Deck` novo), 'shuffle' e 'deal' (5 mãos de 7 cartas).
+    """
+    results: Dict[str, float] = {}
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        Deck()
+    results['create'] = (time.perf_counter() - start) / iterations * 1e6
+
+    deck = Deck()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        deck.shuffle()
+    results['shuffle'] = (time.perf_counter() - start) / iterations * 1e6
+
+    decks = [Deck() for _ in range(iterations)]
+    start = time.perf_counter()
+    for deck in decks:
+        deck.deal_hands(5, 7)
+    results['deal'] = (time.perf_counter() - start) / iterations * 1e6
+    return results
+
 if __name__ == '__main__':
 
     # 1. Criação e embaralhamento do baralho
@@ -219,4 +338,9 @@ if __name__ == '__main__':
         print(hand)
     # Verificação do estado final do baralho
     print('\n--- Cartas Restantes do Baralho ---')
-    print(f'O baralho agora tem {len(deck.cards)} cartas.')
\ No newline at end of file
+    print(f'O baralho agora tem {len(deck.cards)} cartas.')
+
+    # Custo das operações do baralho
+    print('\n--- Custo por operação ---')
+    for operation, microseconds in benchmark_deck().items():
+        print(f'{operation:<8} {microseconds:8.2f} µs')
@@ -0,0 +1,255 @@
+"""
+Índice de Anagramas e de Sub-palavras sobre o dicionário `words.txt`.
+
+Duas consultas clássicas de jogos de palavras são atendidas:
+
+1.  **Anagramas:** duas palavras são anagramas quando têm a mesma
+    *assinatura* — as suas letras em ordem alfabética ("listen" e "silent"
+    têm a assinatura "eilnst"). Um dicionário assinatura → palavras
+    responde em O(1).
+2.  **Palavras formáveis:** dado um conjunto de letras (ex: as peças de um
+    jogador), quais palavras podem ser formadas usando cada letra no máximo
+    tantas vezes quanto disponível? Trata-se de uma consulta de
+    sub-multiconjunto sobre *vetores de contagem de letras*.
+
+Para a segunda consulta, os vetores de contagem são organizados em uma trie
+"podada": cada nível corresponde a uma letra (das mais raras para as mais
+comuns) e cada ramo a uma contagem daquela letra. A busca só desce pelos
+ramos cuja contagem não excede a disponível, descartando de uma só vez
+subárvores inteiras — por exemplo, sem um "q" disponível, todas as palavras
+com "q" são eliminadas no primeiro nível. Subárvores pequenas são guardadas
+como folhas verificadas linearmente (burst trie), o que mantém a estrutura
+compacta.
+"""
+
+from __future__ import annotations
+import time
+from collections import Counter
+from operator import le
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+from python_sessions.projects.word_index import WordIndex, load_word_index
+
+__author__ = 'Enock Silos'
+__email__ = 'init.caucasian722@passfwd.com'
+__status__ = 'Development'
+
+# Número máximo de assinaturas guardadas em uma folha da trie.
+LEAF_SIZE: int = 24
+
+# Uma entrada da trie: o vetor de contagens (um byte por letra, na ordem dos
+# níveis) e a assinatura correspondente.
+_Entry = Tuple[bytes, str]
+# Um nó da trie: um dicionário contagem → filho, ou uma folha (lista de entradas).
+_Node = Union[Dict[int, '_Node'], List[_Entry]]
+
+def signature(word: str) -> str:
+    """
+    Calcula a assinatura de anagrama de uma palavra (letras ordenadas).
+
+    Args:
+        word (str): A palavra.
+
+    Returns:
+        str: As letras da palavra em ordem alfabética.
+    """
+    return ''.join(sorted(word.lower()))
+
+class AnagramIndex:
+    """
+    Índice de anagramas e de palavras formáveis a partir de um conjunto de letras.
+
+    Atributos:
+        alphabet (str): As letras consideradas, na ordem dos níveis da trie
+            (da menos frequente para a mais frequente).
+        leaf_size (int): O número máximo de assinaturas por folha da trie.
+    """
+
+    def __init__(self, words: Iterable[str], leaf_size: int = LEAF_SIZE) -> None:
+        """
+        Constrói o índice.
+
+        Args:
+            words (Iterable[str]): As palavras do dicionário.
+            leaf_size (int, Optional): O número máximo de assinaturas por
+                folha da trie. Padrão é `LEAF_SIZE`.
+        """
+        self.leaf_size = leaf_size
+        self._by_signature: Dict[str, List[str]] = {}
+        for word in sorted({word.strip().lower() for word in words} - {''}):
+            self._by_signature.setdefault(signature(word), []).append(word)
+
+        presence = Counter(letter for sig in self._by_signature for letter in set(sig))
+        self.alphabet = ''.join(sorted(presence, key=lambda letter: (presence[letter], letter)))
+        self._level_of = {letter: level for level, letter in enumerate(self.alphabet)}
+
+        entries = [(self._count_vector(sig), sig) for sig in self._by_signature]
+        self._root: _Node = self._build(entries, 0)
+
+    @classmethod
+    def from_word_index(cls, index: Optional[WordIndex] = None) -> AnagramIndex:
+        """
+        Constrói o índice a partir de um `WordIndex` (por padrão, `words.txt`).
+
+        Args:
+            index (Optional[WordIndex], Optional): O dicionário de origem.
+
+        Returns:
+            AnagramIndex: O índice construído.
+        """
+        return cls(index if index is not None else load_word_index())
+
+    def _count_vector(self, letters: str) -> bytes:
+        """
+        Converte letras em um vetor de contagens, na ordem dos níveis.
+
+        Letras fora do alfabeto do dicionário são ignoradas, e contagens são
+        saturadas em 255 (o limite de um byte).
+        """
+        counts = [0] * len(self.alphabet)
+        for letter in letters:
+            level = self._level_of.get(letter)
+            if level is not None and counts[level] < 255:
+                counts[level] += 1
+        return bytes(counts)
+
+    def _build(self, entries: List[_Entry], level: int) -> _Node:
+        """
+        Constrói recursivamente a trie de vetores de contagem.
+
+        Args:
+            entries (List[_Entry]): As entradas desta subárvore.
+            level (int): O nível (letra) a ser ramificado.
+
+        Returns:
+            _Node: Uma folha, se a subárvore for pequena, ou um nó interno.
+        """
+        if len(entries) <= self.leaf_size or level >= len(self.alphabet):
+            return entries
+
+        groups: Dict[int, List[_Entry]] = {}
+        for entry in entries:
+            groups.setdefault(entry[0][level], []).append(entry)
+        return {count: self._build(group, level + 1) for count, group in groups.items()}
+
+    def anagrams(self, word: str) -> List[str]:
+        """
+        Retorna as palavras do dicionário que são anagramas de `word`.
+
+        Args:
+            word (str): A palavra (ou as letras) de referência.
+
+        Returns:
+            List[str]: Os anagramas encontrados (incluindo a própria palavra,
+                se ela pertencer ao dicionário), em ordem lexicográfica.
+        """
+        return list(self._by_signature.get(signature(word), ()))
+
+    def formable(self, letters: str, min_length: int = 1) -> List[str]:
+        """
+        Retorna as palavras que podem ser formadas com as letras fornecidas.
+
+        Cada letra pode ser usada no máximo tantas vezes quanto aparece em
+        `letters`.
+
+        Args:
+            letters (str): As letras disponíveis (ex: "retains").
+            min_length (int, Optional): O comprimento mínimo das palavras.
+
+        Returns:
+            List[str]: As palavras formáveis, da mais longa para a mais curta
+                e, em seguida, em ordem lexicográfica.
+        """
+        available = self._count_vector(letters.lower())
+        found: List[str] = []
+
+        stack: List[Tuple[_Node, int]] = [(self._root, 0)]
+        while stack:
+            node, level = stack.pop()
+            if isinstance(node, list):
+                for counts, sig in node:
+                    if len(sig) >= min_length and all(map(le, counts, available)):
+                        found.extend(self._by_signature[sig])
+                continue
+            limit = available[level]
+            for count, child in node.items():
+                if count <= limit:
+                    stack.append((child, level + 1))
+
+        found.sort(key=lambda word: (-len(word), word))
+        return found
+
+    def anagrams_many(self, words: Iterable[str]) -> Dict[str, List[str]]:
+        """
+        Consulta os anagramas de várias palavras de uma só vez.
+
+        Args:
+            words (Iterable[str]): As palavras de referência.
+
+        Returns:
+            Dict[str, List[str]]: Os anagramas de cada palavra consultada.
+        """
+        return {word: self.anagrams(word) for word in words}
+
+    def formable_many(self, racks: Iterable[str], min_length: int = 1) -> Dict[str, List[str]]:
+        """
+        Consulta as palavras formáveis para vários conjuntos de letras.
+
+        Conjuntos com as mesmas letras (em qualquer ordem) compartilham uma
+        única busca na trie.
+
+        Args:
+            racks (Iterable[str]): Os conjuntos de letras.
+            min_length (int, Optional): O comprimento mínimo das palavras.
+
+        Returns:
+            Dict[str, List[str]]: As palavras formáveis de cada conjunto.
+        """
+        by_signature: Dict[str, List[str]] = {}
+        results: Dict[str, List[str]] = {}
+        for rack in racks:
+            key = signature(rack)
+            if key not in by_signature:
+                by_signature[key] = self.formable(rack, min_length)
+            results[rack] = by_signature[key]
+        return results
+
+def benchmark_anagram_index(index: AnagramIndex, racks: Sequence[str]) -> Dict[str, float]:
+    """
+    Mede a vazão das consultas do índice, em consultas por segundo.
+
+    Args:
+        index (AnagramIndex): O índice a ser medido.
+        racks (Sequence[str]): Os conjuntos de letras consultados.
+
+    Returns:
+        Dict[str, float]: As vazões de 'anagrams' e 'formable'.
+    """
+    start = time.perf_counter()
+    for rack in racks:
+        index.anagrams(rack)
+    anagram_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for rack in racks:
+        index.formable(rack)
+    formable_elapsed = time.perf_counter() - start
+
+    return {
+        'anagrams': len(racks) / anagram_elapsed,
+        'formable': len(racks) / formable_elapsed,
+    }
+
+if __name__ == '__main__':
+    import random
+
+    start = time.perf_counter()
+    anagram_index = AnagramIndex.from_word_index()
+    print(f'Índice construído em {(time.perf_counter() - start) * 1000:.0f} ms')
+
+    print(f"Anagramas de 'listen': {anagram_index.anagrams('listen')}")
+    print(f"Palavras com 'retains' (mín. 6 letras): {anagram_index.formable('retains', 6)}")
+
+    rng = random.Random(42)
+    sample_racks = [''.join(rng.choices('aaabcdeeeefghiiijklmnoooprrsssttuuvwxyz', k=7)) for _ in range(2000)]
+    for query, rate in benchmark_anagram_index(anagram_index, sample_racks).items():
+        print(f'  {query:<10} {rate:10.0f} consultas/s')
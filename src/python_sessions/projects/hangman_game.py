@@ -6,11 +6,12 @@ __author__ = 'Enock Silos'
 __email__ = 'init.caucasian722@passfwd.com'
 __status__ = 'Release'
 
-import random as r 
 import time as t
-from typing import List 
+from typing import List, Optional
+from python_sessions.projects.word_index import load_word_index
+from python_sessions.projects.hangman_solver import HangmanSolver, build_mask
 
-def run_hangman_game(secret_word: str) -> None:
+def run_hangman_game(secret_word: str, solver: Optional[HangmanSolver] = None) -> None:
     '''
     Executa a lógica principal do jogo da forca.
 
@@ -20,6 +21,9 @@ def run_hangman_game(secret_word: str) -> None:
 
     Args:
         secret_word (str): A palavra a ser advinhada.
+        solver (Optional[HangmanSolver], Optional): Se informado, exibe a
+            cada rodada quantas palavras do dicionário ainda são compatíveis
+            com o estado da partida (modo de análise).
     '''
     for _ in range(100):
         print()
@@ -37,6 +41,11 @@ def run_hangman_game(secret_word: str) -> None:
             current_display += f' {letter} ' if letter in correct_letters else ' _ ' 
         print(f'Palavra: {current_display}\n')
 
+        if solver is not None:
+            mask = build_mask(secret_word, correct_letters)
+            remaining = solver.count_candidates(mask, guessed_letters)
+            print(f'Palavras possíveis: {remaining}\n')
+
         if ' _ ' not in current_display:
             print('Parabéns, você acertou a palavra!')
             break
@@ -103,17 +112,21 @@ def main() -> None:
         """
         Ponto de entrada principal. Carrega as palavras, seleciona uma
         e inicia o jogo.
+
+        As palavras vêm do índice compartilhado (`load_word_index`), que é
+        carregado uma única vez por processo e reaproveita o binário
+        pré-construído `words.idx` entre execuções. O mesmo índice alimenta
+        o `HangmanSolver`, que acompanha a partida.
         """
         try:
-            with open('words.txt', 'r', encoding='utf-8') as file_handle:
-                 words_list = file_handle.read().split()
-
-                 if not words_list:
-                      print('ERRO: O arquivo "words.txt" está vazio ou não pôde ser lido.')
-                      return 
-                 
-                 secret_word = r.choice(words_list).lower()
-                 run_hangman_game(secret_word)
+            words_index = load_word_index()
+
+            if not len(words_index):
+                print('ERRO: O arquivo "words.txt" está vazio ou não pôde ser lido.')
+                return 
+
+            secret_word = words_index.random_word()
+            run_hangman_game(secret_word, HangmanSolver(words_index))
 
         except FileNotFoundError:
              print('ERRO: O arquivo "words.txt" não foi encontrado no diretório.')
@@ -0,0 +1,301 @@
+"""
+Motor de Simulação do Jogo da Forca sem interface (headless).
+
+`run_hangman_game` é interativo: lê do teclado, pausa com `time.sleep` e
+reconstrói a palavra exibida a cada rodada. Para avaliar estratégias de
+jogo em larga escala, este módulo separa as regras do jogo da interface:
+
+-   `play_game` joga uma partida completa contra uma palavra secreta,
+    mantendo a máscara e o conjunto de candidatas incrementalmente (via
+    `HangmanSolver.refine`), sem E/S nem pausas.
+-   `GuessStrategy` define o contrato das estratégias de palpite (Padrão
+    Strategy, como as políticas da `ServiceQueue`); `LetterFrequencyStrategy`
+    escolhe a letra presente no maior número de candidatas restantes.
+-   `simulate_games` distribui milhões de partidas por um pool de processos,
+    com sementes derivadas de forma determinística por lote, e reporta a
+    taxa de vitórias e a vazão em partidas por segundo.
+"""
+
+from __future__ import annotations
+import os
+import random
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
+from python_sessions.projects.hangman_solver import BLANK, HangmanSolver
+from python_sessions.projects.word_index import DEFAULT_WORDS_PATH, load_word_index
+
+__author__ = 'Enock Silos'
+__email__ = 'init.caucasian722@passfwd.com'
+__status__ = 'Development'
+
+MAX_ERRORS: int = 6
+# Ordem aproximada de frequência das letras em textos da língua inglesa.
+ENGLISH_LETTER_ORDER: str = 'etaoinshrdlcumwfgypbvkjxqz'
+DEFAULT_GAMES_PER_TASK: int = 10_000
+
+class GuessStrategy(ABC):
+    """
+    Define o contrato de todas as estratégias de palpite.
+
+    Uma classe base abstrata que garante que qualquer estratégia saiba
+    escolher a próxima letra a partir do estado da partida.
+    """
+
+    @abstractmethod
+    def choose(
+        self,
+        mask: str,
+        guessed: Set[str],
+        candidates: int,
+        solver: HangmanSolver
+    ) -> str:
+        """
+        Escolhe a próxima letra a ser tentada.
+
+        Args:
+            mask (str): A máscara atual da partida (ex: `_a__a_`).
+            guessed (Set[str]): As letras já tentadas.
+            candidates (int): O mapa de bits das palavras ainda compatíveis.
+            solver (HangmanSolver): O solucionador, para consultas adicionais.
+
+        Returns:
+            str: Uma letra ainda não tentada.
+        """
+        pass
+
+class StaticOrderStrategy(GuessStrategy):
+    """
+    Tenta as letras em uma ordem fixa (por padrão, a frequência do inglês).
+
+    Serve como linha de base: ignora completamente o dicionário.
+    """
+
+    def __init__(self, order: str = ENGLISH_LETTER_ORDER) -> None:
+        """
+        Inicializa a estratégia com a ordem de tentativas.
+        """
+        self.order = order
+
+    def choose(self, mask: str, guessed: Set[str], candidates: int, solver: HangmanSolver) -> str:
+        """
+        Retorna a primeira letra da ordem fixa ainda não tentada.
+        """
+        for letter in self.order:
+            if letter not in guessed:
+                return letter
+        raise ValueError('Não há mais letras disponíveis para tentar.')
+
+class LetterFrequencyStrategy(GuessStrategy):
+    """
+    Escolhe a letra contida no maior número de candidatas restantes.
+
+    Maximizar a quantidade de candidatas que contêm a letra maximiza a
+    probabilidade de acerto da próxima tentativa. Como muitas partidas
+    passam pelos mesmos estados (a primeira jogada de cada comprimento, por
+    exemplo, é sempre a mesma), as decisões são memorizadas por
+    (máscara, letras tentadas), até `cache_size` estados.
+    """
+
+    def __init__(self, cache_size: int = 1 << 16) -> None:
+        """
+        Inicializa a estratégia com um cache de decisões vazio.
+        """
+        self.cache_size = cache_size
+        self._fallback = StaticOrderStrategy()
+        self._decisions: Dict[Tuple[str, str], str] = {}
+
+    def choose(self, mask: str, guessed: Set[str], candidates: int, solver: HangmanSolver) -> str:
+        """
+        Retorna a letra não tentada mais frequente entre as candidatas.
+
+        Sem candidatas (palavra fora do dicionário), recorre à ordem fixa.
+        """
+        key = (mask, ''.join(sorted(guessed)))
+        decision = self._decisions.get(key)
+        if decision is not None:
+            return decision
+
+        counts = solver.letter_counts(candidates, len(mask))
+        best_letter, best_count = '', 0
+        for letter in sorted(counts):
+            if letter not in guessed and counts[letter] > best_count:
+                best_letter, best_count = letter, counts[letter]
+        if not best_letter:
+            best_letter = self._fallback.choose(mask, guessed, candidates, solver)
+
+        if len(self._decisions) < self.cache_size:
+            self._decisions[key] = best_letter
+        return best_letter
+
+def play_game(
+    secret_word: str,
+    strategy: GuessStrategy,
+    solver: HangmanSolver,
+    max_errors: int = MAX_ERRORS
+) -> Tuple[bool, int]:
+    """
+    Joga uma partida completa da Forca, sem interface.
+
+    As posições de cada letra da palavra secreta são pré-computadas, de modo
+    que cada tentativa revela as suas posições diretamente, sem varrer nem
+    reconstruir a palavra.
+
+    Args:
+        secret_word (str): A palavra secreta.
+        strategy (GuessStrategy): A estratégia de palpites.
+        solver (HangmanSolver): O solucionador que mantém as candidatas.
+        max_errors (int, Optional): Os erros que encerram a partida. Padrão é 6.
+
+    Returns:
+        Tuple[bool, int]: Se a partida foi vencida e quantos erros ocorreram.
+
+    Raises:
+        ValueError: Se a estratégia repetir uma letra já tentada.
+    """
+    length = len(secret_word)
+    letter_positions: Dict[str, List[int]] = {}
+    for position, letter in enumerate(secret_word):
+        letter_positions.setdefault(letter, []).append(position)
+
+    mask = [BLANK] * length
+    hidden = length
+    guessed: Set[str] = set()
+    errors = 0
+    candidates = solver.universe(length)
+
+    while errors < max_errors:
+        letter = strategy.choose(''.join(mask), guessed, candidates, solver)
+        if letter in guessed:
+            raise ValueError(f'A estratégia repetiu a letra "{letter}".')
+        guessed.add(letter)
+
+        revealed = letter_positions.get(letter, ())
+        candidates = solver.refine(candidates, length, letter, revealed)
+        if not revealed:
+            errors += 1
+            continue
+
+        for position in revealed:
+            mask[position] = letter
+        hidden -= len(revealed)
+        if hidden == 0:
+            return True, errors
+
+    return False, errors
+
+# Estado de cada processo trabalhador, inicializado uma única vez por processo.
+_WORKER_SOLVER: Optional[HangmanSolver] = None
+
+def _initialize_worker(words_path: str) -> None:
+    """
+    Carrega o dicionário e o solucionador no processo trabalhador.
+    """
+    global _WORKER_SOLVER
+    _WORKER_SOLVER = HangmanSolver(load_word_index(words_path))
+
+def _play_batch(task: Tuple[int, int, GuessStrategy, int]) -> Tuple[int, int, int]:
+    """
+    Joga um lote de partidas com uma semente própria.
+
+    Args:
+        task: Uma tupla `(semente, partidas, estratégia, erros máximos)`.
+
+    Returns:
+        Tuple[int, int, int]: Partidas jogadas, vitórias e total de erros.
+    """
+    seed, games, strategy, max_errors = task
+    solver = _WORKER_SOLVER
+    if solver is None:
+        raise RuntimeError('O processo trabalhador não foi inicializado.')
+
+    rng = random.Random(seed)
+    words = solver.index.words
+    wins = total_errors = 0
+    for _ in range(games):
+        won, errors = play_game(rng.choice(words), strategy, solver, max_errors)
+        wins += won
+        total_errors += errors
+    return games, wins, total_errors
+
+def simulate_games(
+    num_games: int,
+    strategy: Optional[GuessStrategy] = None,
+    *,
+    workers: int = 1,
+    seed: Optional[int] = None,
+    games_per_task: int = DEFAULT_GAMES_PER_TASK,
+    max_errors: int = MAX_ERRORS,
+    words_path: str | os.PathLike[str] = DEFAULT_WORDS_PATH
+) -> Dict[str, float]:
+    """
+    Simula partidas em larga escala e reporta o desempenho da estratégia.
+
+    As partidas são divididas em lotes de `games_per_task`. Cada lote
+    recebe uma semente derivada de `seed`, de modo que o resultado é
+    reprodutível e independente do número de processos. Com `workers > 1`,
+    os lotes são distribuídos por um `ProcessPoolExecutor`, cujo
+    inicializador carrega o dicionário uma única vez por processo.
+
+    Args:
+        num_games (int): O número total de partidas.
+        strategy (Optional[GuessStrategy], Optional): A estratégia. Se None,
+            usa `LetterFrequencyStrategy`.
+        workers (int, Optional): O número de processos. Padrão é 1.
+        seed (Optional[int], Optional): A semente mestra da simulação.
+        games_per_task (int, Optional): As partidas por lote.
+        max_errors (int, Optional): Os erros que encerram cada partida.
+        words_path (str | os.PathLike[str], Optional): O caminho de `words.txt`.
+
+    Returns:
+        Dict[str, float]: O relatório, com as chaves 'games', 'wins',
+            'win_rate', 'average_errors', 'seconds' e 'games_per_second'.
+    """
+    if strategy is None:
+        strategy = LetterFrequencyStrategy()
+
+    master = random.Random(seed)
+    tasks = []
+    remaining = num_games
+    while remaining > 0:
+        games = min(games_per_task, remaining)
+        tasks.append((master.getrandbits(64), games, strategy, max_errors))
+        remaining -= games
+
+    path = os.fspath(words_path)
+    start = time.perf_counter()
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_initialize_worker,
+            initargs=(path,)
+        ) as executor:
+            results = list(executor.map(_play_batch, tasks))
+    else:
+        _initialize_worker(path)
+        results = [_play_batch(task) for task in tasks]
+    elapsed = time.perf_counter() - start
+
+    played = sum(games for games, _, _ in results)
+    wins = sum(won for _, won, _ in results)
+    total_errors = sum(errors for _, _, errors in results)
+    return {
+        'games': played,
+        'wins': wins,
+        'win_rate': wins / played if played else 0.0,
+        'average_errors': total_errors / played if played else 0.0,
+        'seconds': elapsed,
+        'games_per_second': played / elapsed if elapsed else 0.0,
+    }
+
+if __name__ == '__main__':
+    GAMES = 20_000
+    for name, strategy in (
+        ('Ordem fixa (inglês)', StaticOrderStrategy()),
+        ('Frequência nas candidatas', LetterFrequencyStrategy()),
+    ):
+        report = simulate_games(GAMES, strategy, workers=os.cpu_count() or 1, seed=42)
+        print(f'{name:<26} | vitórias: {report["win_rate"]:7.2%} | '
+              f'erros médios: {report["average_errors"]:4.2f} | '
+              f'{report["games_per_second"]:10.0f} partidas/s')
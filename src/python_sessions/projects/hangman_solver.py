@@ -0,0 +1,347 @@
+"""
+Solucionador de Máscaras do Jogo da Forca baseado em mapas de bits.
+
+Dada uma máscara parcial como `_a__a_` e o conjunto de letras já tentadas,
+o solucionador retorna todas as palavras do dicionário compatíveis com o
+estado da partida. Em vez de varrer a lista de palavras a cada jogada, ele
+pré-computa, para cada comprimento de palavra, um mapa de bits por par
+(posição, letra): o bit `i` está ligado se a i-ésima palavra daquele
+comprimento tem a letra naquela posição. Os inteiros de precisão arbitrária
+do Python servem como vetores de bits, e uma consulta se reduz a algumas
+operações `&` e `~` entre eles — executadas em C, palavra de máquina a
+palavra de máquina.
+
+As regras do jogo definem a consulta:
+
+1.  Cada posição revelada exige a sua letra: `candidatos &= bits[p][letra]`.
+2.  Cada posição oculta não pode conter nenhuma letra já tentada (se
+    contivesse, ela teria sido revelada): `candidatos &= ~bits[p][letra]`.
+"""
+
+from __future__ import annotations
+import time
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from python_sessions.projects.word_index import WordIndex, load_word_index
+
+__author__ = 'Enock Silos'
+__email__ = 'init.caucasian722@passfwd.com'
+__status__ = 'Development'
+
+BLANK: str = '_'
+
+def build_mask(secret_word: str, correct_letters: Iterable[str], blank: str = BLANK) -> str:
+    """
+    Constrói a máscara de uma partida a partir do seu estado.
+
+    Args:
+        secret_word (str): A palavra secreta.
+        correct_letters (Iterable[str]): As letras corretas já reveladas.
+        blank (str, Optional): O caractere das posições ocultas. Padrão é '_'.
+
+    Returns:
+        str: A máscara (ex: `_a__a_`).
+    """
+    revealed = set(correct_letters)
+    return ''.join(letter if letter in revealed else blank for letter in secret_word)
+
+class _LengthTable:
+    """
+    Mapas de bits de todas as palavras de um mesmo comprimento.
+
+    Atributos:
+        words (List[str]): As palavras, na ordem dos bits.
+        universe (int): Um inteiro com um bit ligado para cada palavra.
+        positions (List[Dict[str, int]]): Para cada posição, o mapa de bits
+            de cada letra que ocorre nela.
+        containing (Dict[str, int]): Para cada letra, o mapa de bits das
+            palavras que a contêm em qualquer posição.
+    """
+
+    def __init__(self, words: List[str]) -> None:
+        """
+        Constrói os mapas de bits.
+
+        Cada coluna (as letras de uma posição em todas as palavras) é
+        montada como uma string; para cada letra, `str.translate` converte a
+        coluna em uma string de '0' e '1', que `int(..., 2)` transforma em
+        um mapa de bits — tudo em C, sem laços Python por palavra e letra.
+
+        Args:
+            words (List[str]): As palavras de um mesmo comprimento.
+        """
+        self.words = words
+        self.universe = (1 << len(words)) - 1
+        self.positions: List[Dict[str, int]] = []
+
+        length = len(words[0]) if words else 0
+        for position in range(length):
+            column = ''.join(word[position] for word in words)
+            letters = set(column)
+            zeros = {ord(char): '0' for char in letters}
+            bitmaps: Dict[str, int] = {}
+            for letter in letters:
+                table = dict(zeros)
+                table[ord(letter)] = '1'
+                # O bit menos significativo corresponde à primeira palavra.
+                bitmaps[letter] = int(column.translate(table)[::-1], 2)
+            self.positions.append(bitmaps)
+
+        self.containing: Dict[str, int] = {}
+        for bitmaps in self.positions:
+            for letter, bits in bitmaps.items():
+                self.containing[letter] = self.containing.get(letter, 0) | bits
+
+    def decode(self, bits: int) -> List[str]:
+        """
+        Converte um mapa de bits nas palavras correspondentes.
+
+        Args:
+            bits (int): O mapa de bits.
+
+        Returns:
+            List[str]: As palavras cujos bits estão ligados, em ordem.
+        """
+        binary = bin(bits)[:1:-1]
+        words = self.words
+        found: List[str] = []
+        index = binary.find('1')
+        while index != -1:
+            found.append(words[index])
+            index = binary.find('1', index + 1)
+        return found
+
+class HangmanSolver:
+    """
+    Encontra as palavras compatíveis com uma máscara e as letras tentadas.
+
+    Os mapas de bits de cada comprimento são construídos sob demanda, na
+    primeira consulta àquele comprimento, e reaproveitados em seguida.
+
+    Atributos:
+        index (WordIndex): O dicionário consultado.
+    """
+
+    def __init__(self, index: Optional[WordIndex] = None) -> None:
+        """
+        Inicializa o solucionador.
+
+        Args:
+            index (Optional[WordIndex], Optional): O dicionário. Se None, usa
+                o índice compartilhado de `words.txt` (`load_word_index`).
+        """
+        self.index = index if index is not None else load_word_index()
+        self._tables: Dict[int, _LengthTable] = {}
+
+    def _table(self, length: int) -> _LengthTable:
+        """
+        Retorna (construindo se necessário) os mapas de bits de um comprimento.
+        """
+        table = self._tables.get(length)
+        if table is None:
+            table = _LengthTable(self.index.of_length(length))
+            self._tables[length] = table
+        return table
+
+    def candidate_bits(
+        self,
+        mask: str,
+        guessed_letters: Iterable[str] = (),
+        blank: str = BLANK
+    ) -> int:
+        """
+        Calcula o mapa de bits das palavras compatíveis com a partida.
+
+        As letras reveladas na máscara são consideradas tentadas, mesmo que
+        não constem de `guessed_letters`.
+
+        Args:
+            mask (str): A máscara da partida (ex: `_a__a_`).
+            guessed_letters (Iterable[str], Optional): Todas as letras já
+                tentadas, certas ou erradas.
+            blank (str, Optional): O caractere das posições ocultas.
+
+        Returns:
+            int: O mapa de bits das palavras candidatas do comprimento da máscara.
+        """
+        mask = mask.lower()
+        table = self._table(len(mask))
+        if not table.words:
+            return 0
+        guessed = set(guessed_letters) | (set(mask) - {blank})
+
+        candidates = table.universe
+        for position, letter in enumerate(mask):
+            bitmaps = table.positions[position]
+            if letter == blank:
+                for excluded in guessed:
+                    excluded_bits = bitmaps.get(excluded)
+                    if excluded_bits:
+                        candidates &= ~excluded_bits
+            else:
+                candidates &= bitmaps.get(letter, 0)
+            if not candidates:
+                break
+        return candidates
+
+    def candidates(
+        self,
+        mask: str,
+        guessed_letters: Iterable[str] = (),
+        blank: str = BLANK
+    ) -> List[str]:
+        """
+        Retorna as palavras compatíveis com a partida.
+
+        Args:
+            mask (str): A máscara da partida (ex: `_a__a_`).
+            guessed_letters (Iterable[str], Optional): As letras já tentadas.
+            blank (str, Optional): O caractere das posições ocultas.
+
+        Returns:
+            List[str]: As palavras candidatas, em ordem lexicográfica.
+        """
+        bits = self.candidate_bits(mask, guessed_letters, blank)
+        return self._table(len(mask)).decode(bits)
+
+    def count_candidates(
+        self,
+        mask: str,
+        guessed_letters: Iterable[str] = (),
+        blank: str = BLANK
+    ) -> int:
+        """
+        Conta as palavras compatíveis sem materializá-las (`int.bit_count`).
+
+        Args:
+            mask (str): A máscara da partida (ex: `_a__a_`).
+            guessed_letters (Iterable[str], Optional): As letras já tentadas.
+            blank (str, Optional): O caractere das posições ocultas.
+
+        Returns:
+            int: O número de palavras candidatas.
+        """
+        return self.candidate_bits(mask, guessed_letters, blank).bit_count()
+
+    def universe(self, length: int) -> int:
+        """
+        Retorna o mapa de bits de todas as palavras de um comprimento.
+
+        Args:
+            length (int): O comprimento das palavras.
+
+        Returns:
+            int: O mapa de bits inicial de uma partida (nenhuma letra tentada).
+        """
+        return self._table(length).universe
+
+    def refine(
+        self,
+        candidates: int,
+        length: int,
+        letter: str,
+        revealed_positions: Sequence[int]
+    ) -> int:
+        """
+        Atualiza incrementalmente os candidatos após uma única tentativa.
+
+        Em uma simulação, recalcular `candidate_bits` a partir da máscara a
+        cada jogada repetiria todo o trabalho anterior. Este método aplica
+        apenas o efeito da nova letra: se ela não foi revelada, elimina as
+        palavras que a contêm; se foi, exige a letra nas posições reveladas e
+        a proíbe nas demais.
+
+        Args:
+            candidates (int): O mapa de bits antes da tentativa.
+            length (int): O comprimento da palavra secreta.
+            letter (str): A letra tentada.
+            revealed_positions (Sequence[int]): As posições em que a letra
+                foi revelada (vazia se a tentativa foi um erro).
+
+        Returns:
+            int: O mapa de bits após a tentativa.
+        """
+        table = self._table(length)
+        if not revealed_positions:
+            return candidates & ~table.containing.get(letter, 0)
+
+        revealed = set(revealed_positions)
+        for position, bitmaps in enumerate(table.positions):
+            bits = bitmaps.get(letter, 0)
+            if position in revealed:
+                candidates &= bits
+            elif bits:
+                candidates &= ~bits
+        return candidates
+
+    def letter_counts(self, candidates: int, length: int) -> Dict[str, int]:
+        """
+        Conta, para cada letra, quantas candidatas a contêm.
+
+        Args:
+            candidates (int): O mapa de bits das candidatas.
+            length (int): O comprimento das palavras.
+
+        Returns:
+            Dict[str, int]: O número de candidatas que contêm cada letra.
+        """
+        return {
+            letter: (candidates & bits).bit_count()
+            for letter, bits in self._table(length).containing.items()
+        }
+
+    def candidates_for_game(
+        self,
+        secret_word: str,
+        guessed_letters: Iterable[str],
+        correct_letters: Iterable[str]
+    ) -> List[str]:
+        """
+        Retorna os candidatos diretamente do estado de `run_hangman_game`.
+
+        Args:
+            secret_word (str): A palavra secreta da partida.
+            guessed_letters (Iterable[str]): As letras tentadas.
+            correct_letters (Iterable[str]): As letras corretas.
+
+        Returns:
+            List[str]: As palavras candidatas.
+        """
+        return self.candidates(build_mask(secret_word, correct_letters), guessed_letters)
+
+def benchmark_solver(
+    solver: HangmanSolver,
+    queries: Sequence[Tuple[str, str]],
+    repetitions: int = 100
+) -> float:
+    """
+    Mede o tempo médio de uma consulta `candidate_bits`, em microssegundos.
+
+    Args:
+        solver (HangmanSolver): O solucionador (com os mapas já construídos
+            ou não; a primeira repetição absorve a construção).
+        queries (Sequence[Tuple[str, str]]): Pares (máscara, letras tentadas).
+        repetitions (int, Optional): Quantas vezes repetir as consultas.
+
+    Returns:
+        float: O tempo médio por consulta, em microssegundos.
+    """
+    for mask, guessed in queries:
+        solver.candidate_bits(mask, guessed)
+
+    start = time.perf_counter()
+    for _ in range(repetitions):
+        for mask, guessed in queries:
+            solver.candidate_bits(mask, guessed)
+    elapsed = time.perf_counter() - start
+    return elapsed / (repetitions * len(queries)) * 1e6
+
+if __name__ == '__main__':
+    solver = HangmanSolver()
+
+    start = time.perf_counter()
+    found = solver.candidates('_a__a_', 'aeiou')
+    print(f'Primeira consulta (inclui construção): {(time.perf_counter() - start) * 1000:.2f} ms')
+    print(f"Candidatos para '_a__a_' sem 'eiou': {len(found)} → {found[:8]}...")
+
+    sample_queries = [('_a__a_', 'aeiou'), ('______', 'e'), ('__e__', 'est'), ('s_______', 'sr')]
+    print(f'Tempo médio por consulta: {benchmark_solver(solver, sample_queries):.1f} µs')
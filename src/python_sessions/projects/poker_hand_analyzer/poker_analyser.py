@@ -5,33 +5,23 @@ estimar as probabilidades de cada tipo de mão, conforme proposto no livro `Pens
 O projeto está dividido em duas partes principais:
 1.  A classe `PokerHand`, um "motor" de análise que herda de uma `Hand`
     genérica e adiciona a capacidade de se auto-classificar, identificando
-    padrões como Pares, Sequências e Flushes.
+    padrões como Pares, Sequências e Flushes, e de calcular a sua força
+    (categoria e kickers) para resolver um showdown.
 2.  Uma função de simulação (`simulate_poker`) que utiliza esse motor para
     "jogar" milhares de mãos de Pôquer, recolher estatísticas e calcular 
     as probabilidades de ocorrência de cada tipo de mão.
 """
 from __future__ import annotations
-from typing import Dict
-import sys
-from pathlib import Path
-
-# --- Bloco de Configuração de Caminho (Path Bootstrap) ---
-# Esta é a solução definitiva para resolver erros de importação (ModuleNotFoundError)
-# quando o script é executado de diferentes locais (ex: terminal vs. editor).
-try:
-    # Obtém o caminho absoluto para a pasta raiz do projeto ('python_sessions')
-    # A lógica sobe dois níveis a partir da localização deste arquivo:
-    # .../poker_hand_analyzer/ -> .../projects/ -> .../python_sessions/
-    project_root = Path(__file__).resolve().parent.parent.parent
-    # Adiciona a raiz do projeto ao caminho de busca do Python
-    sys.path.insert(0, str(project_root))
-except (IndexError, NameError):
-    # Fallback caso __file__ não esteja definido (ambientes raros)
-    print("AVISO: Não foi possível determinar o caminho raiz do projeto. As importações podem falhar.")
-    pass
-
-from concepts.object_oriented_programming.card_game_inheritance import Hand, Deck
-
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from python_sessions.object_oriented_programming.card_game_inheritance import Hand, Deck
+from python_sessions.projects.poker_hand_analyzer.poker_evaluator import (
+    HAND_CATEGORIES,
+    category_name,
+    evaluate
+)
 
 __author__ = 'Enock Silos'
 __email__ = 'init.caucasian722@passfwd.com'
@@ -191,14 +181,49 @@ class PokerHand(Hand):
 
         return flush_hand.has_straight()
     
+    def strength(self) -> int:
+        """
+        Calcula a força da mão com o avaliador de cartas codificadas.
+
+        A força é a chave de ordenação total das mãos: a categoria nos bits
+        mais altos, seguida dos valores de desempate (o valor do par, da
+        trinca..., e então os kickers), do mais ao menos relevante. Mãos
+        podem ser ordenadas ou comparadas em lote apenas por esse inteiro
+        (ex: `max(hands, key=PokerHand.strength)`).
+
+        Returns:
+            int: Um inteiro comparável; mãos mais fortes têm forças maiores
+                 e mãos equivalentes (empate no showdown) têm forças iguais.
+
+        Raises:
+            ValueError: Se a mão não tiver de 5 a 7 cartas.
+        """
+        if not 5 <= len(self.cards) <= 7:
+            raise ValueError('Apenas mãos de 5 a 7 cartas podem ser comparadas.')
+        return evaluate([card.code for card in self.cards])
+
     def classify(self):
         """
         Descobre e atribui o rótulo da melhor mão possível.
 
+        Mãos de 5 a 7 cartas são classificadas pelo avaliador de
+        `poker_evaluator`, em uma única passagem pelas cartas codificadas
+        como inteiros. Para outros tamanhos, o método recorre aos métodos de
+        diagnóstico (`has_*`).
+        """
+        if 5 <= len(self.cards) <= 7:
+            self.label = category_name(self.strength())
+        else:
+            self._classify_by_histograms()
+
+    def _classify_by_histograms(self) -> None:
+        """
+        Classifica a mão pelos métodos de diagnóstico (`has_*`).
+
         Este método atua como um "classificador mestre". Ele invoca os métodos 
-        de diagnóstico (`has_*`) numa ordem hierárquica, do padrão mais 
-        valioso para o menos valioso. A estrutura `if/elif` garante que, assim
-        que a primeira (e, portanto, a melhor) combinação for encontrada, a
+        de diagnóstico numa ordem hierárquica, do padrão mais valioso para o
+        menos valioso. A estrutura `if/elif` garante que, assim que a
+        primeira (e, portanto, a melhor) combinação for encontrada, a
         classificação pare e o rótulo seja atribuído.
         """
         if self.has_straight_flush():
@@ -215,12 +240,75 @@ class PokerHand(Hand):
             self.label = 'Three of a Kind'
         elif self.has_twopair():
             self.label = 'Two Pairs'
-        elif self.has_twopair():
+        elif self.has_pair():
             self.label = 'Pair'
         else:
             self.label = 'High Card'
 
-def simulate_poker(num_simulations: int = 10000) -> Dict[str, int]:
+def showdown(hands: Sequence[PokerHand]) -> List[int]:
+    """
+    Resolve um showdown: retorna os índices das mãos vencedoras.
+
+    Cada mão é avaliada uma única vez, e as vencedoras são as de maior
+    força; mais de um índice indica um pote dividido.
+
+    Args:
+        hands (Sequence[PokerHand]): As mãos (de 5 a 7 cartas cada), por
+            exemplo as duas cartas de cada jogador somadas às da mesa.
+
+    Returns:
+        List[int]: Os índices das mãos vencedoras, em ordem crescente.
+
+    Raises:
+        ValueError: Se não houver mãos ou se alguma não tiver de 5 a 7 cartas.
+    """
+    if not hands:
+        raise ValueError('O showdown precisa de ao menos uma mão.')
+    strengths = [hand.strength() for hand in hands]
+    best = max(strengths)
+    return [index for index, strength in enumerate(strengths) if strength == best]
+
+# Simulações por tarefa do pool em `simulate_poker`.
+DEFAULT_SIMULATIONS_PER_TASK: int = 1_000
+
+def _simulate_batch(task: Tuple[int, int, int, int]) -> Dict[str, int]:
+    """
+    Executa um lote de simulações com um gerador próprio.
+
+    Args:
+        task: Uma tupla `(semente, simulações, mãos, cartas por mão)`.
+
+    Returns:
+        Dict[str, int]: A contagem de cada classificação no lote.
+    """
+    seed, simulations, num_hands, cards_per_hand = task
+    rng = random.Random(seed)
+    counts = {label: 0 for label in reversed(HAND_CATEGORIES)}
+
+    # Um único baralho é reaproveitado: `reset` devolve as cartas à mesma lista.
+    deck = Deck()
+    for _ in range(simulations):
+        deck.reset()
+        rng.shuffle(deck.cards)
+
+        hands = deck.deal_hands(num_hands, cards_per_hand, PokerHand)
+
+        for hand in hands:
+            hand.classify()
+            counts[hand.label] += 1
+
+    return counts
+
+def simulate_poker(
+    num_simulations: int = 10000,
+    *,
+    num_hands: int = 5,
+    cards_per_hand: int = 7,
+    workers: int = 1,
+    seed: Optional[int] = None,
+    simulations_per_task: int = DEFAULT_SIMULATIONS_PER_TASK,
+    progress: Optional[Callable[[int, int], None]] = None
+) -> Dict[str, int]:
     """
     Executa múltiplas simulações de jogos de Pôquer para estimar probabilidades.
 
@@ -228,53 +316,93 @@ def simulate_poker(num_simulations: int = 10000) -> Dict[str, int]:
     (embaralhar e distribuir cartas) um grande número de vezes para convergir
     para uma estimativa estatística das probabilidades reais.
 
+    As simulações são divididas em lotes de `simulations_per_task`, e cada
+    lote embaralha com um `random.Random` próprio, semeado a partir de
+    `seed`. Assim, o resultado é reprodutível e independente do número de
+    processos. Com `workers > 1`, os lotes são distribuídos por um
+    `ProcessPoolExecutor` e as contagens são somadas à medida que chegam.
+
     Args:
         num_simulations (int, Optional): O número de vezes que o baralho será 
             embaralhado e distribuído. O padrão é 10000.
+        num_hands (int, Optional): As mãos distribuídas por baralho. Padrão é 5.
+        cards_per_hand (int, Optional): As cartas por mão. Padrão é 7.
+        workers (int, Optional): O número de processos. Padrão é 1.
+        seed (Optional[int], Optional): A semente mestra da simulação.
+        simulations_per_task (int, Optional): As simulações por lote.
+        progress (Optional[Callable[[int, int], None]], Optional): Chamado
+            após cada lote com as simulações concluídas e o total.
 
     Returns:
         Dict[str, int]: Um dicionário com a contagem total de cada classificação
                         de mão encontrada em todas as simulações.
     """
-    
-    hand_labels_list = [
-        'Straight Flush',
-        'Four of a Kind',
-        'Full House',
-        'Flush',
-        'Straight',
-        'Three of a Kind',
-        'Two Pairs',
-        'Pair',
-        'High Card'
-    ]
+    master = random.Random(seed)
+    tasks = []
+    remaining = num_simulations
+    while remaining > 0:
+        simulations = min(simulations_per_task, remaining)
+        tasks.append((master.getrandbits(64), simulations, num_hands, cards_per_hand))
+        remaining -= simulations
+
+    hand_labels_dict = {label: 0 for label in reversed(HAND_CATEGORIES)}
+    completed = 0
+
+    def merge(task: Tuple[int, int, int, int], counts: Dict[str, int]) -> None:
+        nonlocal completed
+        for label, count in counts.items():
+            hand_labels_dict[label] += count
+        completed += task[1]
+        if progress is not None:
+            progress(completed, num_simulations)
+
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for task, counts in zip(tasks, executor.map(_simulate_batch, tasks)):
+                merge(task, counts)
+    else:
+        for task in tasks:
+            merge(task, _simulate_batch(task))
 
-    hand_labels_dict = {key: 0 for key in hand_labels_list}
-
-
-    for i in range(num_simulations):
-        if (i + 1) % 1000 == 0:
-            print(f'Simulação {i+1}/{num_simulations}...')
+    return hand_labels_dict
 
-        deck = Deck()
-        deck.shuffle()
+def benchmark_simulate_poker(num_simulations: int = 10_000, seed: int = 42) -> float:
+    """
+    Mede a vazão de `simulate_poker` em um único processo.
 
-        hands = deck.deal_hands(5, 7, PokerHand)
+    Args:
+        num_simulations (int, Optional): As simulações executadas.
+        seed (int, Optional): A semente da simulação.
 
-        for hand in hands:
-            hand.classify()
-            hand_labels_dict[hand.label] += 1
+    Returns:
+        float: As simulações (baralhos embaralhados e distribuídos) por segundo.
+    """
+    start = time.perf_counter()
+    simulate_poker(num_simulations, seed=seed)
+    return num_simulations / (time.perf_counter() - start)
 
-    return hand_labels_dict
+def _print_progress(completed: int, total: int) -> None:
+    """
+    Exibe o progresso da simulação em uma única linha.
+    """
+    print(f'\rSimulação {completed}/{total}...', end='' if completed < total else '\n', flush=True)
 
 if __name__ == '__main__':
+    import os
+
     # Define os parâmetros da simulação
     SIMULATIONS = 10000
-    HANDS_PER_SIMULATION = 7
+    HANDS_PER_SIMULATION = 5
     num_total_hands = HANDS_PER_SIMULATION * SIMULATIONS
 
     print(f'Executando um total de {num_total_hands} simulações de mãos de Pôquer...')
-    counts = simulate_poker(num_simulations=SIMULATIONS)
+    counts = simulate_poker(
+        num_simulations=SIMULATIONS,
+        num_hands=HANDS_PER_SIMULATION,
+        workers=os.cpu_count() or 1,
+        seed=42,
+        progress=_print_progress
+    )
 
     # Exibe os resultados numa tabela formatada
     print('\n--- Resultados da Simulação ---')
@@ -285,12 +413,4 @@ if __name__ == '__main__':
         probability = (count / num_total_hands) * 100
         print(f'{label:<20} | {count:>10} | {probability:>19.6f}%')
 
-
-
-
-
-
-
-  
-
-        
+    print(f'\nVazão em um processo: {benchmark_simulate_poker():,.0f} simulações/s')
@@ -0,0 +1,168 @@
+"""
+Enumeração Exata das Categorias de Mãos de Pôquer.
+
+As frequências estimadas por `simulate_poker` convergem para valores
+teóricos que podem ser calculados exatamente: basta avaliar todas as
+C(52, 5) = 2.598.960 mãos de 5 cartas, ou todas as C(52, 7) = 133.784.560
+mãos de 7 cartas. Este módulo percorre as combinações sem avaliar cada mão
+do zero:
+
+1.  **Chaves incrementais:** as chaves de valores e de naipes de
+    `poker_evaluator` são somas por carta. Para cada prefixo (todas as
+    cartas menos a última), as chaves são calculadas uma única vez; cada
+    última carta possível apenas soma a sua parcela.
+2.  **Contagem em C:** se nenhum naipe do prefixo tem cartas suficientes
+    para completar um flush com a última carta, a categoria depende só dos
+    valores. As chaves de todas as últimas cartas são então contadas de uma
+    vez por `Counter.update` sobre um `map`, sem laço Python por mão. Apenas
+    os prefixos com um possível flush são avaliados mão a mão.
+3.  **Paralelismo:** as tarefas são os pares das duas primeiras cartas
+    (1.326 tarefas de tamanhos variados), distribuídas por um
+    `ProcessPoolExecutor`; as contagens parciais são somadas ao final.
+"""
+
+from __future__ import annotations
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+from math import comb
+from typing import Dict, List, Tuple
+from python_sessions.projects.poker_hand_analyzer.poker_evaluator import (
+    DECK_SIZE,
+    HAND_CATEGORIES,
+    category_of,
+    evaluate,
+    rank_key,
+    rank_strength,
+    suit_key
+)
+
+__author__ = 'Enock Silos'
+__email__ = 'init.caucasian722@passfwd.com'
+__status__ = 'Development'
+
+# Pares de primeiras cartas enviados de uma vez a cada processo.
+DEFAULT_TASKS_PER_CHUNK = 16
+
+def _build_open_suit_table() -> List[int]:
+    """
+    Tabela do naipe que a última carta pode transformar em flush, ou -1.
+
+    Para cada chave de naipes de um prefixo (até 6 cartas), indica o naipe
+    com pelo menos 4 cartas; com até 6 cartas, há no máximo um.
+    """
+    table = [-1] * (1 << 12)
+    for key in range(1 << 12):
+        for suit in range(4):
+            if key >> 3 * suit & 0b111 >= 4:
+                table[key] = suit
+    return table
+
+_OPEN_SUIT = _build_open_suit_table()
+
+def _count_task(task: Tuple[int, int, int]) -> List[int]:
+    """
+    Conta as categorias de todas as mãos que começam por duas cartas.
+
+    Args:
+        task: Uma tupla `(primeira carta, segunda carta, cartas por mão)`.
+
+    Returns:
+        List[int]: A quantidade de mãos de cada categoria.
+    """
+    first, second, cards_per_hand = task
+    open_suit = _OPEN_SUIT
+    counts = [0] * len(HAND_CATEGORIES)
+    by_rank_key: Counter = Counter()
+
+    base_rank = rank_key(first) + rank_key(second)
+    base_suit = suit_key(first) + suit_key(second)
+    for middle in combinations(range(second + 1, DECK_SIZE - 1), cards_per_hand - 3):
+        rank_prefix = base_rank
+        suit_prefix = base_suit
+        for card in middle:
+            rank_prefix += rank_key(card)
+            suit_prefix += suit_key(card)
+        tail = range(middle[-1] + 1, DECK_SIZE)
+
+        suit = open_suit[suit_prefix]
+        if suit < 0:
+            by_rank_key.update(map(rank_prefix.__add__, map(rank_key, tail)))
+            continue
+        # Com 5 ou mais cartas do naipe no prefixo, toda mão é um flush.
+        flushed = suit_prefix >> 3 * suit & 0b111 >= 5
+        prefix = (first, second, *middle)
+        for card in tail:
+            if flushed or card // 13 == suit:
+                counts[category_of(evaluate((*prefix, card)))] += 1
+            else:
+                by_rank_key[rank_prefix + rank_key(card)] += 1
+
+    for key, count in by_rank_key.items():
+        counts[category_of(rank_strength(key))] += count
+    return counts
+
+def enumerate_hand_categories(
+    cards_per_hand: int = 5,
+    *,
+    workers: int = 1,
+    tasks_per_chunk: int = DEFAULT_TASKS_PER_CHUNK
+) -> Dict[str, int]:
+    """
+    Conta exatamente as mãos de cada categoria entre todas as combinações.
+
+    Args:
+        cards_per_hand (int, Optional): As cartas por mão (5 a 7). Padrão é 5.
+        workers (int, Optional): O número de processos. Padrão é 1.
+        tasks_per_chunk (int, Optional): Os pares de primeiras cartas
+            enviados de uma vez a cada processo.
+
+    Returns:
+        Dict[str, int]: A quantidade de mãos de cada classificação, da mais
+            para a menos valiosa (a mesma ordem de `simulate_poker`); a soma
+            é C(52, `cards_per_hand`).
+
+    Raises:
+        ValueError: Se `cards_per_hand` não estiver entre 5 e 7.
+    """
+    if not 5 <= cards_per_hand <= 7:
+        raise ValueError('Cada mão deve ter de 5 a 7 cartas.')
+
+    tasks = [(first, second, cards_per_hand) for first, second in combinations(range(DECK_SIZE), 2)]
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            partials = list(executor.map(_count_task, tasks, chunksize=tasks_per_chunk))
+    else:
+        partials = [_count_task(task) for task in tasks]
+
+    totals = [sum(column) for column in zip(*partials)]
+    return {label: totals[category] for category, label in reversed(list(enumerate(HAND_CATEGORIES)))}
+
+def exact_probabilities(cards_per_hand: int = 5, *, workers: int = 1) -> Dict[str, float]:
+    """
+    Calcula a probabilidade exata de cada categoria.
+
+    Args:
+        cards_per_hand (int, Optional): As cartas por mão (5 a 7).
+        workers (int, Optional): O número de processos.
+
+    Returns:
+        Dict[str, float]: A probabilidade de cada classificação.
+    """
+    total = comb(DECK_SIZE, cards_per_hand)
+    counts = enumerate_hand_categories(cards_per_hand, workers=workers)
+    return {label: count / total for label, count in counts.items()}
+
+if __name__ == '__main__':
+    import os
+
+    for cards in (5, 7):
+        start = time.perf_counter()
+        table = enumerate_hand_categories(cards, workers=os.cpu_count() or 1)
+        elapsed = time.perf_counter() - start
+        total_hands = comb(DECK_SIZE, cards)
+        print(f'\n--- {total_hands} mãos de {cards} cartas em {elapsed:.1f} s '
+              f'({total_hands / elapsed:,.0f} mãos/s) ---')
+        for label, count in table.items():
+            print(f'{label:<20} | {count:>10} | {count / total_hands * 100:>10.6f}%')
@@ -0,0 +1,330 @@
+"""
+Calculadora de Equidade do Texas Hold'em.
+
+A equidade de um jogador é a fração do pote que ele ganha, em média, ao
+completar a mesa (as cinco cartas comunitárias) de todas as formas
+possíveis; empates dividem o pote. `EquityCalculator` responde a:
+
+-   **Mãos contra mãos** (`equity`): dois ou mais jogadores com cartas
+    conhecidas, em qualquer rua (pré-flop, flop, turn ou river).
+-   **Mão contra faixas** (`range_equity`): as cartas do adversário são
+    desconhecidas, mas pertencem a uma faixa (uma lista de combinações de
+    duas cartas, todas igualmente prováveis).
+
+Quando o número de mesas possíveis é pequeno (flop, turn), todas são
+enumeradas e o resultado é exato; caso contrário, as mesas são sorteadas
+(Monte Carlo). Três otimizações tornam as consultas baratas:
+
+1.  **Mesa compartilhada:** as chaves de valores e de naipes das cartas
+    comunitárias (as mesmas de `poker_evaluator`) são somadas uma única vez
+    por mesa; cada jogador apenas acrescenta as suas duas cartas.
+2.  **Forma canônica:** os naipes são simétricos — A♠K♠ contra Q♥Q♦ tem a
+    mesma equidade que A♥K♥ contra Q♠Q♣. Cada consulta é reescrita com a
+    menor renomeação de naipes, de modo que entradas isomórficas
+    compartilham uma única entrada do cache.
+3.  **Cache de resultados:** consultas repetidas (ou isomórficas) são
+    respondidas pelo cache, sem nova enumeração.
+"""
+
+from __future__ import annotations
+import random
+import time
+from itertools import combinations, permutations, product
+from math import comb
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple
+from python_sessions.projects.poker_hand_analyzer.poker_evaluator import (
+    DECK_SIZE,
+    evaluate_with_board
+)
+
+__author__ = 'Enock Silos'
+__email__ = 'init.caucasian722@passfwd.com'
+__status__ = 'Development'
+
+BOARD_SIZE = 5
+# Mesas sorteadas por consulta quando a enumeração exata é grande demais.
+DEFAULT_TRIALS = 20_000
+# Maior número de mesas (ou de mesas vezes combinações das faixas)
+# enumerado exatamente.
+DEFAULT_EXHAUSTIVE_LIMIT = 100_000
+DEFAULT_CACHE_SIZE = 1 << 12
+
+HoleCards = Tuple[int, int]
+
+# As 24 renomeações possíveis dos naipes, como tabelas carta → carta.
+_SUIT_RELABELINGS: Tuple[Tuple[int, ...], ...] = tuple(
+    tuple(mapping[card // 13] * 13 + card % 13 for card in range(DECK_SIZE))
+    for mapping in permutations(range(4))
+)
+
+def _to_codes(cards: Iterable) -> Tuple[int, ...]:
+    """
+    Converte cartas (códigos inteiros ou objetos `Card`) em códigos.
+    """
+    return tuple(card if isinstance(card, int) else card.suit * 13 + card.rank - 1 for card in cards)
+
+def _validate_cards(groups: Iterable[Sequence[int]]) -> None:
+    """
+    Garante que nenhuma carta aparece duas vezes entre os grupos.
+    """
+    seen = [card for group in groups for card in group]
+    if len(seen) != len(set(seen)):
+        raise ValueError('Uma mesma carta não pode aparecer duas vezes.')
+    if any(not 0 <= card < DECK_SIZE for card in seen):
+        raise ValueError('Os códigos das cartas devem estar entre 0 e 51.')
+
+def _canonical_key(hands: Sequence[Sequence[int]], board: Sequence[int], ranges: Sequence[Sequence[HoleCards]] = ()) -> Hashable:
+    """
+    Calcula a forma canônica de uma consulta sob renomeação de naipes.
+
+    Cada renomeação é aplicada às mãos, à mesa e às faixas (com as cartas e
+    as combinações ordenadas), e a menor das 24 formas resultantes é a chave.
+    """
+    best = None
+    for table in _SUIT_RELABELINGS:
+        key = (
+            tuple(sorted(table[card] for card in board)),
+            tuple(tuple(sorted(table[card] for card in hand)) for hand in hands),
+            tuple(tuple(sorted(tuple(sorted((table[a], table[b]))) for a, b in combos)) for combos in ranges),
+        )
+        if best is None or key < best:
+            best = key
+    return best
+
+def _showdown(board: Sequence[int], holes: Sequence[Sequence[int]]) -> List[float]:
+    """
+    Divide o pote de uma mesa completa entre os jogadores.
+
+    As forças vêm de `evaluate_with_board`, que soma as chaves da mesa uma
+    única vez para todos os jogadores.
+
+    Returns:
+        List[float]: A fração do pote de cada jogador (empates dividem).
+    """
+    strengths = evaluate_with_board(board, holes)
+    best = max(strengths)
+    winners = strengths.count(best)
+    return [1 / winners if strength == best else 0.0 for strength in strengths]
+
+class EquityCalculator:
+    """
+    Calcula equidades do Texas Hold'em com enumeração exata ou Monte Carlo.
+
+    Atributos:
+        trials (int): As mesas sorteadas quando a enumeração é grande demais.
+        exhaustive_limit (int): O maior número de cenários enumerado exatamente.
+        cache_size (int): O número máximo de consultas guardadas no cache.
+    """
+
+    def __init__(
+        self,
+        *,
+        trials: int = DEFAULT_TRIALS,
+        exhaustive_limit: int = DEFAULT_EXHAUSTIVE_LIMIT,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        seed: Optional[int] = None
+    ) -> None:
+        """
+        Inicializa a calculadora com um cache vazio.
+
+        Args:
+            trials (int, Optional): As mesas sorteadas por consulta em Monte Carlo.
+            exhaustive_limit (int, Optional): O maior número de cenários
+                enumerado exatamente.
+            cache_size (int, Optional): O número máximo de consultas em cache.
+            seed (Optional[int], Optional): A semente dos sorteios.
+        """
+        self.trials = trials
+        self.exhaustive_limit = exhaustive_limit
+        self.cache_size = cache_size
+        self._rng = random.Random(seed)
+        self._results: Dict[Hashable, Tuple[float, ...]] = {}
+
+    def _remember(self, key: Hashable, result: Tuple[float, ...]) -> Tuple[float, ...]:
+        """
+        Guarda um resultado no cache, enquanto houver espaço.
+        """
+        if len(self._results) < self.cache_size:
+            self._results[key] = result
+        return result
+
+    def equity(self, hands: Sequence[Iterable], board: Iterable = ()) -> List[float]:
+        """
+        Calcula a equidade de jogadores com cartas conhecidas.
+
+        Args:
+            hands (Sequence[Iterable]): As duas cartas de cada jogador
+                (códigos de 0 a 51 ou objetos `Card`).
+            board (Iterable, Optional): As cartas comunitárias já abertas (0 a 5).
+
+        Returns:
+            List[float]: A equidade de cada jogador, na ordem de `hands`; a
+                soma é 1.
+
+        Raises:
+            ValueError: Se houver menos de dois jogadores, mãos sem exatamente
+                duas cartas, mais de 5 cartas na mesa ou cartas repetidas.
+        """
+        holes = [_to_codes(hand) for hand in hands]
+        board = _to_codes(board)
+        if len(holes) < 2 or any(len(hole) != 2 for hole in holes):
+            raise ValueError('São necessários ao menos dois jogadores com duas cartas cada.')
+        if len(board) > BOARD_SIZE:
+            raise ValueError('A mesa tem no máximo 5 cartas.')
+        _validate_cards([board, *holes])
+
+        key = ('equity', _canonical_key(holes, board))
+        cached = self._results.get(key)
+        if cached is None:
+            cached = self._remember(key, self._compute_equity(holes, board))
+        return list(cached)
+
+    def _compute_equity(self, holes: Sequence[HoleCards], board: Tuple[int, ...]) -> Tuple[float, ...]:
+        """
+        Acumula as frações do pote sobre as mesas enumeradas ou sorteadas.
+        """
+        used = set(board).union(*holes)
+        remaining = [card for card in range(DECK_SIZE) if card not in used]
+        missing = BOARD_SIZE - len(board)
+
+        if comb(len(remaining), missing) <= self.exhaustive_limit:
+            boards: Iterable[Tuple[int, ...]] = combinations(remaining, missing)
+        else:
+            sample = self._rng.sample
+            boards = (sample(remaining, missing) for _ in range(self.trials))
+
+        totals = [0.0] * len(holes)
+        count = 0
+        for runout in boards:
+            shares = _showdown((*board, *runout), holes)
+            for player, share in enumerate(shares):
+                totals[player] += share
+            count += 1
+        return tuple(total / count for total in totals)
+
+    def range_equity(self, hand: Iterable, ranges: Sequence[Iterable[Iterable]], board: Iterable = ()) -> float:
+        """
+        Calcula a equidade de uma mão contra adversários descritos por faixas.
+
+        Cada faixa é uma lista de combinações de duas cartas, igualmente
+        prováveis. Combinações que colidem com as cartas conhecidas (ou entre
+        adversários) são descartadas. Se o número de cenários (combinações
+        das faixas vezes mesas) for pequeno, todos são enumerados; caso
+        contrário, as combinações e a mesa são sorteadas juntas.
+
+        Args:
+            hand (Iterable): As duas cartas do jogador.
+            ranges (Sequence[Iterable[Iterable]]): A faixa de cada adversário.
+            board (Iterable, Optional): As cartas comunitárias já abertas.
+
+        Returns:
+            float: A equidade do jogador, de 0 a 1.
+
+        Raises:
+            ValueError: Se as cartas forem inválidas ou se nenhuma combinação
+                das faixas for compatível com as cartas conhecidas.
+        """
+        hole = _to_codes(hand)
+        board = _to_codes(board)
+        if len(hole) != 2 or len(board) > BOARD_SIZE:
+            raise ValueError('A mão deve ter duas cartas e a mesa no máximo 5.')
+        _validate_cards([board, hole])
+
+        dead = set(board) | set(hole)
+        combos = [
+            sorted({tuple(sorted(combo)) for combo in map(_to_codes, opponent) if not dead.intersection(combo)})
+            for opponent in ranges
+        ]
+        if not combos or any(not opponent for opponent in combos):
+            raise ValueError('Cada faixa deve ter ao menos uma combinação compatível.')
+
+        key = ('range', _canonical_key([hole], board, combos))
+        cached = self._results.get(key)
+        if cached is None:
+            cached = self._remember(key, (self._compute_range_equity(hole, combos, board),))
+        return cached[0]
+
+    def _compute_range_equity(self, hole: HoleCards, combos: List[List[HoleCards]], board: Tuple[int, ...]) -> float:
+        """
+        Enumera (ou sorteia) as combinações das faixas e as mesas.
+        """
+        missing = BOARD_SIZE - len(board)
+        scenarios = comb(DECK_SIZE - len(board) - 2 * (len(combos) + 1), missing)
+        for opponent in combos:
+            scenarios *= len(opponent)
+
+        if scenarios <= self.exhaustive_limit:
+            total = weight = 0.0
+            for assignment in product(*combos):
+                cards = [card for combo in assignment for card in combo]
+                if len(set(cards)) != len(cards):
+                    continue
+                total += self._compute_equity([hole, *assignment], board)[0]
+                weight += 1
+            if not weight:
+                raise ValueError('Nenhuma combinação das faixas é compatível entre si.')
+            return total / weight
+
+        dead = set(board) | set(hole)
+        remaining = [card for card in range(DECK_SIZE) if card not in dead]
+        rng = self._rng
+        total = 0.0
+        trials = 0
+        attempts = 0
+        while trials < self.trials:
+            attempts += 1
+            if attempts > 100 * self.trials:
+                raise ValueError('Nenhuma combinação das faixas é compatível entre si.')
+            assignment = [rng.choice(opponent) for opponent in combos]
+            used = [card for combo in assignment for card in combo]
+            if len(set(used)) != len(used):
+                continue
+            runout = rng.sample([card for card in remaining if card not in used], missing)
+            total += _showdown((*board, *runout), [hole, *assignment])[0]
+            trials += 1
+        return total / trials
+
+    def cache_info(self) -> Dict[str, int]:
+        """
+        Retorna o estado do cache de resultados.
+
+        Returns:
+            Dict[str, int]: O número de entradas ('size') e o limite ('capacity').
+        """
+        return {'size': len(self._results), 'capacity': self.cache_size}
+
+def benchmark_equity(seed: int = 42) -> Dict[str, float]:
+    """
+    Mede o tempo de consultas frias, repetidas e isomórficas, em milissegundos.
+
+    A consulta é A♠K♠ contra Q♥Q♦ em um flop (990 mesas, enumeradas); a
+    isomórfica troca todos os naipes e deve ser respondida pelo cache.
+
+    Args:
+        seed (int, Optional): A semente da calculadora.
+
+    Returns:
+        Dict[str, float]: Os tempos de 'cold', 'repeated' e 'isomorphic'.
+    """
+    calculator = EquityCalculator(seed=seed)
+    spades, hearts, diamonds, clubs = 39, 26, 13, 0
+    query = ([(spades + 0, spades + 12), (hearts + 11, diamonds + 11)], [clubs + 1, hearts + 6, spades + 9])
+    isomorphic = ([(hearts + 0, hearts + 12), (spades + 11, clubs + 11)], [diamonds + 1, spades + 6, hearts + 9])
+
+    results: Dict[str, float] = {}
+    for name, (hands, board) in (('cold', query), ('repeated', query), ('isomorphic', isomorphic)):
+        start = time.perf_counter()
+        calculator.equity(hands, board)
+        results[name] = (time.perf_counter() - start) * 1000
+    return results
+
+if __name__ == '__main__':
+    calculator = EquityCalculator(seed=42)
+    aces = (39, 26)          # A♠ A♥
+    kings = (51, 12 + 13)    # K♠ K♦
+    print(f'AA x KK (pré-flop, Monte Carlo): {calculator.equity([aces, kings])}')
+    print(f'AA x KK (flop 2♣ 7♥ 9♦): {calculator.equity([aces, kings], [1, 32, 21])}')
+    suited_connectors = [(suit * 13 + 9, suit * 13 + 10) for suit in range(4)]
+    print(f'AA x {{T-J do mesmo naipe}}: {calculator.range_equity(aces, [suited_connectors]):.4f}')
+    for name, milliseconds in benchmark_equity().items():
+        print(f'  {name:<11} {milliseconds:8.3f} ms')
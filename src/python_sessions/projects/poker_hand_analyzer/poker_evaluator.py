@@ -0,0 +1,354 @@
+"""
+Avaliador de Mãos de Pôquer com cartas codificadas como inteiros.
+
+`PokerHand.classify` percorre até oito métodos `has_*`, e cada um reconstrói
+histogramas (dicionários) a partir de objetos `Card`. Este módulo avalia mãos
+de 5 a 7 cartas em uma única passagem, sem alocar estruturas por mão:
+
+-   Cada carta é um inteiro de 0 a 51 (`naipe * 13 + valor - 1`, a mesma
+    ordem em que `Deck` cria as cartas).
+-   Durante a passagem, dois inteiros acumulam as contagens de valores e de
+    naipes, empacotadas em campos de 3 bits (`1 << 3 * valor`). O inteiro
+    de valores é uma chave perfeita do multiconjunto de valores da mão.
+-   Tabelas pré-computadas respondem o resto: a força de cada multiconjunto
+    de valores (pares, trincas, sequências...), o naipe com 5 ou mais cartas
+    (se houver) e a força de cada máscara de 13 bits de valores de um mesmo
+    naipe (flushes e straight flushes).
+
+A força é um único inteiro comparável: a categoria nos bits mais altos,
+seguida dos valores que desempatam a mão, do mais ao menos relevante.
+"""
+
+from __future__ import annotations
+import random
+import time
+from itertools import combinations, combinations_with_replacement
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+__author__ = 'Enock Silos'
+__email__ = 'init.caucasian722@passfwd.com'
+__status__ = 'Development'
+
+# Rótulos das categorias, da menos para a mais valiosa (o índice é a categoria).
+HAND_CATEGORIES: Tuple[str, ...] = (
+    'High Card',
+    'Pair',
+    'Two Pairs',
+    'Three of a Kind',
+    'Straight',
+    'Flush',
+    'Full House',
+    'Four of a Kind',
+    'Straight Flush',
+)
+# A categoria ocupa os bits a partir desta posição; abaixo dela ficam até
+# cinco valores de desempate, com 4 bits cada.
+CATEGORY_SHIFT = 20
+DECK_SIZE = 52
+
+HIGH_CARD, PAIR, TWO_PAIRS, THREE_OF_A_KIND, STRAIGHT, FLUSH, FULL_HOUSE, FOUR_OF_A_KIND, STRAIGHT_FLUSH = range(9)
+
+def encode_card(suit: int, rank: int) -> int:
+    """
+    Codifica uma carta como um inteiro de 0 a 51.
+
+    Args:
+        suit (int): O naipe, de 0 a 3 (como em `Card`).
+        rank (int): O valor, de 1 (Ás) a 13 (Rei) (como em `Card`).
+
+    Returns:
+        int: O código da carta, `suit * 13 + rank - 1`.
+    """
+    return suit * 13 + rank - 1
+
+def encode_cards(cards: Iterable) -> List[int]:
+    """
+    Codifica objetos com atributos `suit` e `rank` (ex: `Card`).
+
+    Args:
+        cards (Iterable): As cartas.
+
+    Returns:
+        List[int]: Os códigos das cartas.
+    """
+    return [card.suit * 13 + card.rank - 1 for card in cards]
+
+def _strength_rank(card: int) -> int:
+    """
+    Converte o código em um valor de força: 0 para o 2, ..., 12 para o Ás.
+    """
+    return (card % 13 - 1) % 13
+
+# Tabelas por carta.
+_CARD_SUIT: Tuple[int, ...] = tuple(card // 13 for card in range(DECK_SIZE))
+_CARD_BIT: Tuple[int, ...] = tuple(1 << _strength_rank(card) for card in range(DECK_SIZE))
+# As chaves são listas, e não tuplas, porque `list.__getitem__` é uma função
+# embutida rápida (ver `rank_key` e `suit_key`).
+_RANK_KEY: List[int] = [1 << 3 * _strength_rank(card) for card in range(DECK_SIZE)]
+_SUIT_KEY: List[int] = [1 << 3 * (card // 13) for card in range(DECK_SIZE)]
+
+def _pack(category: int, ranks: Iterable[int]) -> int:
+    """
+    Monta a força a partir da categoria e dos valores de desempate.
+    """
+    value = category
+    count = 0
+    for rank in ranks:
+        value = value << 4 | rank
+        count += 1
+    return value << 4 * (5 - count)
+
+def _straight_top(mask: int) -> int:
+    """
+    Retorna o valor mais alto da maior sequência na máscara, ou -1.
+
+    A sequência mais baixa (Ás, 2, 3, 4, 5) tem o 5 como topo.
+    """
+    for top in range(12, 3, -1):
+        window = 0b11111 << (top - 4)
+        if mask & window == window:
+            return top
+    if mask & 0b1000000001111 == 0b1000000001111:
+        return 3
+    return -1
+
+def _top_ranks(mask: int, count: int) -> List[int]:
+    """
+    Retorna os `count` valores mais altos presentes na máscara.
+    """
+    return [rank for rank in range(12, -1, -1) if mask >> rank & 1][:count]
+
+def _build_straight_table() -> List[int]:
+    """
+    Tabela do topo da sequência de cada máscara de 13 bits.
+    """
+    return [_straight_top(mask) for mask in range(1 << 13)]
+
+_STRAIGHT_TOP: List[int] = _build_straight_table()
+
+def _build_flush_table() -> List[int]:
+    """
+    Tabela da força de flush (ou straight flush) de cada máscara de naipe.
+
+    Máscaras com menos de 5 valores têm força 0.
+    """
+    table = [0] * (1 << 13)
+    for mask in range(1 << 13):
+        if mask.bit_count() < 5:
+            continue
+        top = _STRAIGHT_TOP[mask]
+        if top >= 0:
+            table[mask] = _pack(STRAIGHT_FLUSH, (top,))
+        else:
+            table[mask] = _pack(FLUSH, _top_ranks(mask, 5))
+    return table
+
+def _multiset_strength(counts: Sequence[int]) -> int:
+    """
+    Calcula a força de um multiconjunto de valores, ignorando os naipes.
+
+    Args:
+        counts (Sequence[int]): A contagem de cada valor (índice 0 = 2).
+
+    Returns:
+        int: A força da melhor mão de 5 cartas sem flush.
+    """
+    by_count: Dict[int, List[int]] = {1: [], 2: [], 3: [], 4: []}
+    mask = 0
+    for rank in range(12, -1, -1):
+        if counts[rank]:
+            by_count[counts[rank]].append(rank)
+            mask |= 1 << rank
+
+    def kickers(excluded: Iterable[int], count: int) -> List[int]:
+        excluded = set(excluded)
+        return [rank for rank in _top_ranks(mask, 13) if rank not in excluded][:count]
+
+    quads, trips, pairs = by_count[4], by_count[3], by_count[2]
+    if quads:
+        return _pack(FOUR_OF_A_KIND, [quads[0], *kickers(quads[:1], 1)])
+    if trips and (len(trips) > 1 or pairs):
+        pair = max(trips[1:] + pairs)
+        return _pack(FULL_HOUSE, (trips[0], pair))
+    top = _STRAIGHT_TOP[mask]
+    if top >= 0:
+        return _pack(STRAIGHT, (top,))
+    if trips:
+        return _pack(THREE_OF_A_KIND, [trips[0], *kickers(trips[:1], 2)])
+    if len(pairs) >= 2:
+        return _pack(TWO_PAIRS, [pairs[0], pairs[1], *kickers(pairs[:2], 1)])
+    if pairs:
+        return _pack(PAIR, [pairs[0], *kickers(pairs[:1], 3)])
+    return _pack(HIGH_CARD, kickers((), 5))
+
+def _build_rank_table() -> Dict[int, int]:
+    """
+    Tabela da força de cada multiconjunto de 5 a 7 valores (no máximo 4 de cada).
+
+    A chave é a contagem de cada valor empacotada em campos de 3 bits — a
+    mesma chave acumulada por `evaluate`.
+    """
+    table: Dict[int, int] = {}
+    for size in (5, 6, 7):
+        for ranks in combinations_with_replacement(range(13), size):
+            counts = [0] * 13
+            for rank in ranks:
+                counts[rank] += 1
+            if max(counts) > 4:
+                continue
+            key = sum(count << 3 * rank for rank, count in enumerate(counts))
+            table[key] = _multiset_strength(counts)
+    return table
+
+def _build_flush_suit_table() -> List[int]:
+    """
+    Tabela do naipe com 5 ou mais cartas para cada chave de naipes, ou -1.
+    """
+    table = [-1] * (1 << 12)
+    for key in range(1 << 12):
+        for suit in range(4):
+            if key >> 3 * suit & 0b111 >= 5:
+                table[key] = suit
+    return table
+
+_FLUSH_VALUE: List[int] = _build_flush_table()
+_RANK_VALUE: Dict[int, int] = _build_rank_table()
+_FLUSH_SUIT: List[int] = _build_flush_suit_table()
+
+# Chaves incrementais, para avaliar muitas mãos que compartilham cartas: as
+# chaves de valores e de naipes de uma mão são a soma das chaves das suas
+# cartas. São os métodos `__getitem__` das tabelas, e não funções Python,
+# para que `map(rank_key, cards)` não pague uma chamada Python por carta.
+# `rank_key(card)` e `suit_key(card)`: as parcelas de uma carta.
+rank_key: Callable[[int], int] = _RANK_KEY.__getitem__
+suit_key: Callable[[int], int] = _SUIT_KEY.__getitem__
+# `flush_suit(suit_key)`: o naipe com 5 ou mais cartas, ou -1.
+flush_suit: Callable[[int], int] = _FLUSH_SUIT.__getitem__
+# `rank_strength(rank_key)`: a força de uma mão de 5 a 7 cartas sem flush.
+rank_strength: Callable[[int], int] = _RANK_VALUE.__getitem__
+
+def strength_from_keys(rank_total: int, suit_total: int, cards: Sequence[int]) -> int:
+    """
+    Calcula a força de uma mão a partir das suas chaves já somadas.
+
+    Sem um naipe com 5 ou mais cartas, a força vem apenas da chave de
+    valores; caso contrário, as cartas são avaliadas por `evaluate`.
+
+    Args:
+        rank_total (int): A soma de `rank_key` das cartas da mão.
+        suit_total (int): A soma de `suit_key` das cartas da mão.
+        cards (Sequence[int]): As próprias cartas, lidas apenas se houver flush.
+
+    Returns:
+        int: A mesma força que `evaluate(cards)`.
+    """
+    if _FLUSH_SUIT[suit_total] < 0:
+        return _RANK_VALUE[rank_total]
+    return evaluate(cards)
+
+def evaluate(cards: Sequence[int]) -> int:
+    """
+    Calcula a força da melhor mão de 5 cartas contida em 5 a 7 cartas.
+
+    Uma passagem acumula as chaves de valores e de naipes. Se houver um
+    naipe com 5 ou mais cartas, a força vem da tabela de flushes: com no
+    máximo 7 cartas, sobram apenas 2 de outros naipes, o que impede um full
+    house ou uma quadra de coexistir com o flush. Caso contrário, a força vem
+    da tabela de multiconjuntos de valores.
+
+    Args:
+        cards (Sequence[int]): De 5 a 7 códigos de cartas distintas.
+
+    Returns:
+        int: A força da mão; forças maiores vencem, e forças iguais empatam.
+    """
+    rank_key = suit_key = 0
+    for card in cards:
+        rank_key += _RANK_KEY[card]
+        suit_key += _SUIT_KEY[card]
+
+    flush_suit = _FLUSH_SUIT[suit_key]
+    if flush_suit < 0:
+        return _RANK_VALUE[rank_key]
+    mask = 0
+    for card in cards:
+        if _CARD_SUIT[card] == flush_suit:
+            mask |= _CARD_BIT[card]
+    return _FLUSH_VALUE[mask]
+
+def evaluate_with_board(board: Sequence[int], holes: Iterable[Sequence[int]]) -> List[int]:
+    """
+    Calcula a força de cada mão formada por uma mesa comum e cartas próprias.
+
+    Equivale a `evaluate((*board, *hole))` para cada `hole`, mas as chaves
+    da mesa são somadas uma única vez: cada mão acrescenta apenas as chaves
+    das suas cartas e só recorre a `evaluate` se houver um naipe com 5 ou
+    mais cartas.
+
+    Args:
+        board (Sequence[int]): As cartas comuns.
+        holes (Iterable[Sequence[int]]): As cartas próprias de cada mão; cada
+            mão completa deve ter de 5 a 7 cartas.
+
+    Returns:
+        List[int]: A força de cada mão, na ordem de `holes`.
+    """
+    board_rank = board_suit = 0
+    for card in board:
+        board_rank += _RANK_KEY[card]
+        board_suit += _SUIT_KEY[card]
+
+    strengths = []
+    for hole in holes:
+        rank_total, suit_total = board_rank, board_suit
+        for card in hole:
+            rank_total += _RANK_KEY[card]
+            suit_total += _SUIT_KEY[card]
+        if _FLUSH_SUIT[suit_total] < 0:
+            strengths.append(_RANK_VALUE[rank_total])
+        else:
+            strengths.append(evaluate((*board, *hole)))
+    return strengths
+
+def category_of(strength: int) -> int:
+    """
+    Extrai a categoria (índice de `HAND_CATEGORIES`) de uma força.
+    """
+    return strength >> CATEGORY_SHIFT
+
+def category_name(strength: int) -> str:
+    """
+    Retorna o rótulo da categoria de uma força (ex: 'Full House').
+    """
+    return HAND_CATEGORIES[strength >> CATEGORY_SHIFT]
+
+def benchmark_evaluator(num_hands: int = 100_000, cards_per_hand: int = 7, seed: int = 42) -> float:
+    """
+    Mede a vazão de `evaluate`, em mãos por segundo.
+
+    Args:
+        num_hands (int, Optional): A quantidade de mãos avaliadas.
+        cards_per_hand (int, Optional): As cartas por mão (5 a 7).
+        seed (int, Optional): A semente do gerador das mãos.
+
+    Returns:
+        float: As mãos avaliadas por segundo.
+    """
+    rng = random.Random(seed)
+    deck = range(DECK_SIZE)
+    hands = [rng.sample(deck, cards_per_hand) for _ in range(num_hands)]
+
+    start = time.perf_counter()
+    for hand in hands:
+        evaluate(hand)
+    return num_hands / (time.perf_counter() - start)
+
+if __name__ == '__main__':
+    from collections import Counter
+
+    five_card_counts = Counter(category_of(evaluate(hand)) for hand in combinations(range(DECK_SIZE), 5))
+    print('Frequências exatas das mãos de 5 cartas:')
+    for category, name in enumerate(HAND_CATEGORIES):
+        print(f'  {name:<16} {five_card_counts[category]:>9}')
+    for cards in (5, 7):
+        print(f'Vazão com {cards} cartas: {benchmark_evaluator(cards_per_hand=cards):,.0f} mãos/s')
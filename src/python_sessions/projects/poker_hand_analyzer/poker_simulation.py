@@ -0,0 +1,258 @@
+"""
+Simulação de Monte Carlo do Pôquer vetorizada com NumPy.
+
+`simulate_poker` cria, a cada rodada, um `Deck` com 52 objetos `Card`,
+embaralha, distribui com `pop_card` e classifica cada mão em Python. Este
+módulo simula lotes inteiros de rodadas de uma só vez:
+
+1.  **Baralhos como matrizes:** cada linha de uma matriz `(rodadas, 52)` é
+    uma permutação dos códigos de 0 a 51 (`naipe * 13 + valor - 1`, como em
+    `poker_evaluator`), obtida pelo `argsort` de chaves aleatórias.
+2.  **Distribuição em bloco:** as mãos são fatiadas do topo de cada baralho
+    na mesma ordem alternada de `Deck.deal_hands` (uma carta por mão, por
+    volta), por indexação, sem laço por carta.
+3.  **Classificação vetorizada:** flushes e sequências saem de operações de
+    bits, e pares, trincas e quadras dos valores ordenados de cada mão; as
+    categorias são máscaras booleanas combinadas por `np.select`, na mesma
+    hierarquia de `PokerHand.classify`.
+
+Sem NumPy, a simulação recorre a `poker_evaluator.evaluate` sobre baralhos
+de inteiros embaralhados por `random.Random`, com a mesma distribuição.
+"""
+
+from __future__ import annotations
+import random
+import time
+from typing import Dict, List, Optional
+from python_sessions.projects.poker_hand_analyzer.poker_evaluator import (
+    DECK_SIZE,
+    FLUSH,
+    FOUR_OF_A_KIND,
+    FULL_HOUSE,
+    HAND_CATEGORIES,
+    HIGH_CARD,
+    PAIR,
+    STRAIGHT,
+    STRAIGHT_FLUSH,
+    THREE_OF_A_KIND,
+    TWO_PAIRS,
+    category_of,
+    evaluate
+)
+
+try:
+    import numpy as np
+except ImportError:  # NumPy é opcional: sem ele, usa-se o caminho em Python puro.
+    np = None
+
+__author__ = 'Enock Silos'
+__email__ = 'init.caucasian722@passfwd.com'
+__status__ = 'Development'
+
+# Rodadas (baralhos) processadas por lote vetorizado; limita a memória a
+# poucos MiB por lote.
+DEFAULT_BATCH_SIZE = 1 << 14
+
+def _validate_deal(num_hands: int, cards_per_hand: int) -> None:
+    """
+    Garante que a distribuição cabe em um baralho e pode ser avaliada.
+    """
+    if not 5 <= cards_per_hand <= 7:
+        raise ValueError('Cada mão deve ter de 5 a 7 cartas.')
+    if num_hands < 1 or num_hands * cards_per_hand > DECK_SIZE:
+        raise ValueError('As mãos devem caber em um único baralho de 52 cartas.')
+
+def _empty_counts() -> Dict[str, int]:
+    """
+    Cria o dicionário de contagens, da categoria mais para a menos valiosa
+    (a mesma ordem de `simulate_poker`).
+    """
+    return {label: 0 for label in reversed(HAND_CATEGORIES)}
+
+def deal_decks(num_decks: int, rng: np.random.Generator) -> np.ndarray:
+    """
+    Gera baralhos embaralhados como permutações dos códigos de 0 a 51.
+
+    Args:
+        num_decks (int): A quantidade de baralhos.
+        rng (np.random.Generator): O gerador das chaves aleatórias.
+
+    Returns:
+        np.ndarray: Uma matriz `(num_decks, 52)`; cada linha é um baralho, e
+            a última coluna é o topo (a carta de `pop_card`).
+    """
+    return np.argsort(rng.random((num_decks, DECK_SIZE)), axis=1).astype(np.int8)
+
+def deal_hands(decks: np.ndarray, num_hands: int, cards_per_hand: int) -> np.ndarray:
+    """
+    Distribui as mãos de cada baralho, como `Deck.deal_hands`.
+
+    A `i`-ésima carta da mão `h` é a carta `i * num_hands + h` a partir do
+    topo do baralho: uma carta por mão, a cada volta.
+
+    Args:
+        decks (np.ndarray): Os baralhos, como em `deal_decks`.
+        num_hands (int): As mãos por baralho.
+        cards_per_hand (int): As cartas por mão.
+
+    Returns:
+        np.ndarray: Uma matriz `(num_decks * num_hands, cards_per_hand)`.
+    """
+    positions = DECK_SIZE - 1 - np.arange(num_hands * cards_per_hand)
+    dealt = decks[:, positions].reshape(len(decks), cards_per_hand, num_hands)
+    return dealt.transpose(0, 2, 1).reshape(-1, cards_per_hand)
+
+def _has_straight(rank_bits: np.ndarray) -> np.ndarray:
+    """
+    Detecta sequências em máscaras de 13 bits de valores (bit 0 = 2).
+
+    O Ás (bit 12) é repetido abaixo do 2, para a sequência mais baixa; há
+    sequência quando cinco bits consecutivos estão acesos.
+    """
+    extended = rank_bits << 1 | rank_bits >> 12 & 1
+    return (extended & extended >> 1 & extended >> 2 & extended >> 3 & extended >> 4) != 0
+
+def classify_hands(hands: np.ndarray) -> np.ndarray:
+    """
+    Classifica um lote de mãos de cartas codificadas.
+
+    Flushes e sequências são detectados por operações de bits sobre chaves
+    de naipes (contagens em campos de 3 bits) e máscaras de valores. Pares,
+    trincas e quadras saem dos valores ordenados de cada mão: cartas iguais
+    ficam adjacentes, e comparar cada coluna com a coluna 1, 2 ou 3 posições
+    adiante revela os grupos de 2, 3 ou 4 cartas.
+
+    Args:
+        hands (np.ndarray): Uma matriz `(mãos, cartas)` de códigos de 0 a 51.
+
+    Returns:
+        np.ndarray: A categoria (índice de `HAND_CATEGORIES`) de cada mão.
+    """
+    hands = np.asarray(hands, dtype=np.int16)
+    ranks = (hands % 13 + 12) % 13
+    suits = hands // 13
+    rank_bits = np.int16(1) << ranks
+
+    suit_key = (np.int16(1) << 3 * suits).sum(axis=1, dtype=np.int16)
+    suit_counts = suit_key[:, None] >> np.arange(0, 12, 3, dtype=np.int16) & 7
+    flush = suit_counts.max(axis=1) >= 5
+    in_flush_suit = suits == suit_counts.argmax(axis=1)[:, None]
+    straight_flush = flush & _has_straight(np.bitwise_or.reduce(rank_bits * in_flush_suit, axis=1))
+    straight = _has_straight(np.bitwise_or.reduce(rank_bits, axis=1))
+
+    ordered = np.sort(ranks, axis=1)
+    same = ordered[:, 1:] == ordered[:, :-1]
+    quads = (ordered[:, 3:] == ordered[:, :-3]).any(axis=1)
+    trips = (ordered[:, 2:] == ordered[:, :-2]).sum(axis=1)
+    groups = same[:, 0] + (same[:, 1:] & ~same[:, :-1]).sum(axis=1)
+    pairs = groups - trips
+    full_house = (trips >= 2) | ((trips >= 1) & (pairs >= 1))
+
+    return np.select(
+        (straight_flush, quads, full_house, flush, straight, trips >= 1, pairs >= 2, pairs >= 1),
+        (STRAIGHT_FLUSH, FOUR_OF_A_KIND, FULL_HOUSE, FLUSH, STRAIGHT, THREE_OF_A_KIND, TWO_PAIRS, PAIR),
+        default=HIGH_CARD
+    )
+
+def _simulate_with_evaluator(
+    num_simulations: int,
+    num_hands: int,
+    cards_per_hand: int,
+    seed: Optional[int]
+) -> List[int]:
+    """
+    Simula em Python puro, com baralhos de inteiros e o avaliador por tabelas.
+    """
+    rng = random.Random(seed)
+    deck = list(range(DECK_SIZE))
+    counts = [0] * len(HAND_CATEGORIES)
+    for _ in range(num_simulations):
+        rng.shuffle(deck)
+        for h in range(num_hands):
+            hand = deck[DECK_SIZE - 1 - h::-num_hands][:cards_per_hand]
+            counts[category_of(evaluate(hand))] += 1
+    return counts
+
+def simulate_poker_vectorized(
+    num_simulations: int = 10000,
+    num_hands: int = 5,
+    cards_per_hand: int = 7,
+    *,
+    seed: Optional[int] = None,
+    batch_size: int = DEFAULT_BATCH_SIZE
+) -> Dict[str, int]:
+    """
+    Executa simulações de Pôquer em lotes vetorizados.
+
+    Reproduz a distribuição de rótulos de `simulate_poker`: cada rodada
+    embaralha um baralho completo e distribui `num_hands` mãos de
+    `cards_per_hand` cartas.
+
+    Args:
+        num_simulations (int, Optional): O número de baralhos embaralhados.
+        num_hands (int, Optional): As mãos distribuídas por baralho. Padrão é 5.
+        cards_per_hand (int, Optional): As cartas por mão (5 a 7). Padrão é 7.
+        seed (Optional[int], Optional): A semente do gerador.
+        batch_size (int, Optional): Os baralhos por lote vetorizado.
+
+    Returns:
+        Dict[str, int]: A contagem de cada classificação, da mais para a
+            menos valiosa.
+
+    Raises:
+        ValueError: Se as mãos não couberem em um baralho ou não tiverem de
+            5 a 7 cartas.
+    """
+    _validate_deal(num_hands, cards_per_hand)
+    if np is None:
+        counts = _simulate_with_evaluator(num_simulations, num_hands, cards_per_hand, seed)
+    else:
+        rng = np.random.default_rng(seed)
+        totals = np.zeros(len(HAND_CATEGORIES), dtype=np.int64)
+        for start in range(0, num_simulations, batch_size):
+            decks = deal_decks(min(batch_size, num_simulations - start), rng)
+            categories = classify_hands(deal_hands(decks, num_hands, cards_per_hand))
+            totals += np.bincount(categories, minlength=len(HAND_CATEGORIES))
+        counts = totals.tolist()
+
+    result = _empty_counts()
+    for category, label in enumerate(HAND_CATEGORIES):
+        result[label] = counts[category]
+    return result
+
+def benchmark_poker_simulation(num_simulations: int = 20_000, seed: int = 42) -> Dict[str, float]:
+    """
+    Compara a vazão das simulações, em mãos classificadas por segundo.
+
+    Args:
+        num_simulations (int, Optional): Os baralhos simulados por caminho.
+        seed (int, Optional): A semente das simulações.
+
+    Returns:
+        Dict[str, float]: As vazões de 'python' (avaliador por tabelas) e,
+            se o NumPy estiver instalado, de 'numpy'.
+    """
+    hands = num_simulations * 5
+    start = time.perf_counter()
+    _simulate_with_evaluator(num_simulations, 5, 7, seed)
+    results = {'python': hands / (time.perf_counter() - start)}
+
+    if np is not None:
+        start = time.perf_counter()
+        simulate_poker_vectorized(num_simulations, seed=seed)
+        results['numpy'] = hands / (time.perf_counter() - start)
+    return results
+
+if __name__ == '__main__':
+    SIMULATIONS = 1_000_000
+    HANDS_PER_SIMULATION = 5
+    num_total_hands = SIMULATIONS * HANDS_PER_SIMULATION
+
+    start = time.perf_counter()
+    label_counts = simulate_poker_vectorized(SIMULATIONS, HANDS_PER_SIMULATION, seed=42)
+    print(f'{num_total_hands} mãos de 7 cartas em {time.perf_counter() - start:.2f} s')
+    for label, count in label_counts.items():
+        print(f'{label:<20} | {count:>10} | {count / num_total_hands * 100:>10.4f}%')
+
+    for path, rate in benchmark_poker_simulation().items():
+        print(f'  {path:<8} {rate:12.0f} mãos/s')
@@ -0,0 +1,310 @@
+"""
+Índice de Palavras para consultas rápidas sobre o dicionário `words.txt`.
+
+Este módulo transforma a lista de ~113 mil palavras usada pelo Jogo da Forca
+em um índice imutável e compacto, carregado uma única vez por processo:
+
+-   As palavras são normalizadas (minúsculas, sem duplicatas) e mantidas em
+    um vetor ordenado, o que permite verificar a pertença e listar todas as
+    palavras com um prefixo através de busca binária (`bisect`), em
+    O(log n).
+-   Consultas por comprimento e por padrão de letras (ex: `_a__a_`) usam
+    "blocos" de texto por comprimento, percorridos por uma expressão
+    regular compilada — uma varredura executada inteiramente em C.
+-   O índice pode ser serializado em um arquivo binário pré-construído
+    (`words.idx`), já normalizado e ordenado, que é reaproveitado nas
+    execuções seguintes enquanto estiver mais recente que `words.txt`.
+"""
+
+from __future__ import annotations
+import os
+import random
+import re
+from bisect import bisect_left
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+__author__ = 'Enock Silos'
+__email__ = 'init.caucasian722@passfwd.com'
+__status__ = 'Development'
+
+# Caminho padrão da lista de palavras (relativo ao diretório de trabalho,
+# tal como sempre foi usado pelo Jogo da Forca).
+DEFAULT_WORDS_PATH = Path('words.txt')
+# Assinatura e versão do formato binário pré-construído.
+INDEX_MAGIC: bytes = b'PSWIDX01'
+INDEX_SUFFIX: str = '.idx'
+
+# Índices já carregados neste processo, por caminho absoluto.
+_LOADED_INDEXES: Dict[str, 'WordIndex'] = {}
+
+class WordIndex:
+    """
+    Índice imutável e ordenado de palavras.
+
+    Atributos:
+        words (Tuple[str, ...]): As palavras, normalizadas e em ordem lexicográfica.
+    """
+
+    def __init__(self, words: Iterable[str], *, presorted: bool = False) -> None:
+        """
+        Constrói o índice a partir de um iterável de palavras.
+
+        Args:
+            words (Iterable[str]): As palavras de origem.
+            presorted (bool, Optional): Indica que as palavras já estão
+                normalizadas, únicas e ordenadas (ex: vindas de um arquivo
+                binário), dispensando a normalização. Padrão é False.
+        """
+        if presorted:
+            self.words: Tuple[str, ...] = tuple(words)
+        else:
+            self.words = tuple(sorted({word.strip().lower() for word in words} - {''}))
+        self._length_blocks: Optional[Dict[int, str]] = None
+
+    @classmethod
+    def from_text_file(cls, path: str | os.PathLike[str]) -> WordIndex:
+        """
+        Constrói o índice a partir de um arquivo de texto (uma palavra por linha).
+
+        Args:
+            path (str | os.PathLike[str]): O caminho do arquivo de palavras.
+
+        Returns:
+            WordIndex: O índice construído.
+        """
+        with open(path, 'r', encoding='utf-8') as file_handle:
+            return cls(file_handle.read().split())
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str]) -> WordIndex:
+        """
+        Carrega um índice do formato binário pré-construído.
+
+        Args:
+            path (str | os.PathLike[str]): O caminho do arquivo `.idx`.
+
+        Returns:
+            WordIndex: O índice carregado.
+
+        Raises:
+            ValueError: Se o arquivo não estiver no formato esperado.
+        """
+        with open(path, 'rb') as binary_handle:
+            payload = binary_handle.read()
+        if not payload.startswith(INDEX_MAGIC):
+            raise ValueError(f'Arquivo de índice inválido: {path}')
+
+        header_end = payload.index(b'\n', len(INDEX_MAGIC))
+        expected_count = int(payload[len(INDEX_MAGIC):header_end])
+        body = payload[header_end + 1:].decode('utf-8')
+        words = body.split('\n') if body else []
+        if len(words) != expected_count:
+            raise ValueError(f'Arquivo de índice corrompido: {path}')
+        return cls(words, presorted=True)
+
+    def save(self, path: str | os.PathLike[str]) -> None:
+        """
+        Serializa o índice no formato binário pré-construído.
+
+        O formato é a assinatura `INDEX_MAGIC`, o número de palavras e as
+        palavras ordenadas separadas por quebras de linha, em UTF-8. A
+        escrita é feita em um arquivo temporário renomeado ao final, para que
+        um leitor concorrente nunca encontre um índice pela metade.
+
+        Args:
+            path (str | os.PathLike[str]): O caminho do arquivo `.idx`.
+        """
+        payload = INDEX_MAGIC + f'{len(self.words)}\n'.encode('ascii')
+        payload += '\n'.join(self.words).encode('utf-8')
+        temporary_path = f'{os.fspath(path)}.tmp'
+        with open(temporary_path, 'wb') as binary_handle:
+            binary_handle.write(payload)
+        os.replace(temporary_path, path)
+
+    def __len__(self) -> int:
+        """
+        Retorna o número de palavras do índice.
+        """
+        return len(self.words)
+
+    def __iter__(self) -> Iterator[str]:
+        """
+        Itera sobre as palavras em ordem lexicográfica.
+        """
+        return iter(self.words)
+
+    def __contains__(self, word: object) -> bool:
+        """
+        Verifica a pertença de uma palavra por busca binária, em O(log n).
+        """
+        if not isinstance(word, str):
+            return False
+        position = bisect_left(self.words, word)
+        return position < len(self.words) and self.words[position] == word
+
+    def prefix_range(self, prefix: str) -> Tuple[int, int]:
+        """
+        Localiza o intervalo de posições das palavras com um prefixo.
+
+        Como as palavras estão ordenadas, todas as que começam por `prefix`
+        formam um intervalo contíguo, delimitado por duas buscas binárias.
+
+        Args:
+            prefix (str): O prefixo procurado.
+
+        Returns:
+            Tuple[int, int]: As posições `(início, fim)` do intervalo.
+        """
+        start = bisect_left(self.words, prefix)
+        end = bisect_left(self.words, prefix + '\U0010ffff', start)
+        return start, end
+
+    def with_prefix(self, prefix: str) -> Tuple[str, ...]:
+        """
+        Retorna todas as palavras que começam com um prefixo.
+
+        Args:
+            prefix (str): O prefixo procurado.
+
+        Returns:
+            Tuple[str, ...]: As palavras encontradas, em ordem lexicográfica.
+        """
+        start, end = self.prefix_range(prefix)
+        return self.words[start:end]
+
+    def _blocks(self) -> Dict[int, str]:
+        """
+        Retorna (construindo na primeira chamada) os blocos por comprimento.
+
+        Cada bloco é uma única string com as palavras de um comprimento
+        separadas por quebras de linha, pronta para varreduras com `re`.
+        """
+        if self._length_blocks is None:
+            grouped: Dict[int, List[str]] = {}
+            for word in self.words:
+                grouped.setdefault(len(word), []).append(word)
+            self._length_blocks = {
+                length: '\n'.join(group) for length, group in grouped.items()
+            }
+        return self._length_blocks
+
+    def of_length(self, length: int) -> List[str]:
+        """
+        Retorna todas as palavras com um determinado comprimento.
+
+        Args:
+            length (int): O número de letras.
+
+        Returns:
+            List[str]: As palavras encontradas, em ordem lexicográfica.
+        """
+        block = self._blocks().get(length)
+        return block.split('\n') if block else []
+
+    def matching(self, pattern: str, wildcard: str = '_') -> List[str]:
+        """
+        Retorna as palavras que se encaixam em um padrão de letras.
+
+        Cada `wildcard` do padrão aceita qualquer letra; os demais caracteres
+        devem coincidir exatamente. Por exemplo, `_a_a__` encontra
+        "banana" e "canals".
+
+        Args:
+            pattern (str): O padrão, com o mesmo comprimento das palavras.
+            wildcard (str, Optional): O caractere curinga. Padrão é '_'.
+
+        Returns:
+            List[str]: As palavras encontradas, em ordem lexicográfica.
+        """
+        block = self._blocks().get(len(pattern))
+        if not block:
+            return []
+        regex = ''.join('[^\n]' if char == wildcard else re.escape(char) for char in pattern.lower())
+        return re.findall(f'^{regex}$', block, re.MULTILINE)
+
+    def random_word(self, rng: Optional[random.Random] = None) -> str:
+        """
+        Sorteia uma palavra do índice.
+
+        Args:
+            rng (Optional[random.Random], Optional): O gerador aleatório a ser
+                usado. Se None, usa o gerador global do módulo `random`.
+
+        Returns:
+            str: A palavra sorteada.
+
+        Raises:
+            IndexError: Se o índice estiver vazio.
+        """
+        return (rng or random).choice(self.words)
+
+def load_word_index(
+    path: str | os.PathLike[str] = DEFAULT_WORDS_PATH,
+    *,
+    use_prebuilt: bool = True
+) -> WordIndex:
+    """
+    Carrega o índice de palavras uma única vez por processo.
+
+    A primeira chamada para um caminho procura o arquivo pré-construído
+    (`words.idx`, ao lado de `words.txt`). Se ele existir e for mais recente
+    que a lista de palavras, é carregado diretamente; caso contrário, o
+    índice é construído a partir do texto e o binário é (re)gerado para as
+    próximas execuções. Falhas de escrita (ex: diretório somente leitura) são
+    ignoradas, pois o binário é apenas uma otimização. Chamadas seguintes
+    retornam o mesmo objeto, mantido em memória.
+
+    Args:
+        path (str | os.PathLike[str], Optional): O caminho de `words.txt`.
+        use_prebuilt (bool, Optional): Usa e mantém o arquivo binário
+            pré-construído. Padrão é True.
+
+    Returns:
+        WordIndex: O índice compartilhado.
+
+    Raises:
+        FileNotFoundError: Se a lista de palavras não existir.
+    """
+    source = Path(path).resolve()
+    cache_key = str(source)
+    if cache_key in _LOADED_INDEXES:
+        return _LOADED_INDEXES[cache_key]
+
+    prebuilt = source.with_suffix(INDEX_SUFFIX)
+    index: Optional[WordIndex] = None
+    if use_prebuilt and prebuilt.exists() and prebuilt.stat().st_mtime >= source.stat().st_mtime:
+        try:
+            index = WordIndex.load(prebuilt)
+        except ValueError:
+            index = None
+
+    if index is None:
+        index = WordIndex.from_text_file(source)
+        if use_prebuilt:
+            try:
+                index.save(prebuilt)
+            except OSError:
+                pass
+
+    _LOADED_INDEXES[cache_key] = index
+    return index
+
+if __name__ == '__main__':
+    import time
+
+    start = time.perf_counter()
+    text_index = WordIndex.from_text_file(DEFAULT_WORDS_PATH)
+    text_elapsed = time.perf_counter() - start
+
+    text_index.save(DEFAULT_WORDS_PATH.with_suffix(INDEX_SUFFIX))
+    start = time.perf_counter()
+    binary_index = WordIndex.load(DEFAULT_WORDS_PATH.with_suffix(INDEX_SUFFIX))
+    binary_elapsed = time.perf_counter() - start
+
+    print(f'Palavras indexadas: {len(binary_index)}')
+    print(f'Construção a partir do texto: {text_elapsed * 1000:8.2f} ms')
+    print(f'Carga do binário pré-construído: {binary_elapsed * 1000:8.2f} ms')
+    print(f"'python' pertence ao índice? {'python' in binary_index}")
+    print(f"Palavras com prefixo 'pyth': {binary_index.with_prefix('pyth')}")
+    print(f"Palavras no padrão '_a__a_': {len(binary_index.matching('_a__a_'))}")
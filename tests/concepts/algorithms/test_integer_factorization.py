@@ -0,0 +1,97 @@
+"""
+Artefato de Verificação e Validação para `integer_factorization`.
+
+Esta suíte prova que toda fatoração reconstrói o número original a partir
+de fatores comprovadamente primos, tanto pela tabela de menor fator primo
+quanto pelo rho de Pollard, individualmente ou em lote.
+"""
+
+from __future__ import annotations
+import random
+import unittest
+from math import prod
+from python_sessions.concepts.algorithms.integer_factorization import (
+    SPF_TABLE_MAX_LIMIT,
+    factorize,
+    factorize_many,
+    pollard_rho,
+    prime_factors,
+    smallest_prime_factor_table
+)
+from python_sessions.concepts.algorithms.prime_number_utilities import is_prime
+
+__author__ = 'Enock Silos'
+__email__ = 'init.caucasian722@passfwd.com'
+__status__ = 'Verification'
+
+class TestIntegerFactorization(unittest.TestCase):
+    """
+    Suíte de provas formais para a fatoração de inteiros.
+    """
+
+    def _assert_valid(self, number, factors):
+        """
+        Verifica que os fatores são primos, ordenados e reconstroem o número.
+        """
+        self.assertEqual(prod(p ** exponent for p, exponent in factors.items()), number)
+        self.assertEqual(list(factors), sorted(factors))
+        self.assertTrue(all(is_prime(p) for p in factors))
+
+    def test_smallest_prime_factor_table(self):
+        """
+        Prova [1]: Cada posição da tabela guarda o menor fator primo (ou 0
+        para os primos).
+        """
+        table = smallest_prime_factor_table(2000)
+        for number in range(2, 2000):
+            smallest = next(d for d in range(2, number + 1) if number % d == 0)
+            self.assertEqual(table[number] or number, smallest)
+
+    def test_small_and_large_numbers(self):
+        """
+        Prova [2]: Números pequenos, potências, semiprimos e números de até
+        80 bits são fatorados corretamente.
+        """
+        rng = random.Random(11)
+        numbers = (
+            list(range(1, 1500))
+            + [SPF_TABLE_MAX_LIMIT - 1, SPF_TABLE_MAX_LIMIT, 2 ** 64 - 1, 4099 ** 3 * 7, 65537 ** 2]
+            + [(2 ** 31 - 1) * (2 ** 61 - 1), 1_000_003 * 1_000_033]
+            + [rng.randrange(1, 1 << 80) for _ in range(100)]
+        )
+        for number in numbers:
+            self._assert_valid(number, factorize(number, rng))
+        self.assertEqual(factorize(360), {2: 3, 3: 2, 5: 1})
+        self.assertEqual(prime_factors(360), [2, 2, 2, 3, 3, 5])
+        self.assertEqual(factorize(1), {})
+
+    def test_pollard_rho_finds_proper_factor(self):
+        """
+        Prova [3]: O rho de Pollard retorna um divisor próprio de compostos.
+        """
+        for composite in (8051, 10403, 1_000_003 * 1_000_033, 4099 * 4099):
+            divisor = pollard_rho(composite, random.Random(1))
+            self.assertTrue(1 < divisor < composite)
+            self.assertEqual(composite % divisor, 0)
+
+    def test_batch_matches_single(self):
+        """
+        Prova [4]: O lote, serial ou paralelo, preserva a ordem de entrada.
+        """
+        rng = random.Random(3)
+        values = [rng.randrange(1, 1 << 40) for _ in range(400)] + list(range(1, 200))
+        expected = [factorize(value) for value in values]
+        self.assertEqual(factorize_many(values), expected)
+        self.assertEqual(factorize_many(values, workers=2, values_per_task=100), expected)
+
+    def test_rejects_non_positive(self):
+        """
+        Prova [5]: Zero e negativos não podem ser fatorados.
+        """
+        with self.assertRaises(ValueError):
+            factorize(0)
+        with self.assertRaises(ValueError):
+            factorize_many([3, -4])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,314 @@
+"""
+Artefato de Verificação e Validação para `prime_number_utilities`.
+
+Esta suíte prova que o crivo segmentado produz exatamente os mesmos primos
+que a divisão por tentativa, para qualquer intervalo e tamanho de segmento,
+e que o Miller–Rabin — individual ou em lote, com ou sem NumPy — é exato
+na faixa determinística.
+"""
+
+from __future__ import annotations
+import os
+import random
+import tempfile
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from unittest import mock
+from python_sessions.concepts.algorithms import prime_number_utilities
+from python_sessions.concepts.algorithms.prime_number_utilities import (
+    MILLER_RABIN_THRESHOLD,
+    PrimeTable,
+    count_primes,
+    generate_primes,
+    is_prime,
+    is_prime_many,
+    iter_primes,
+    load_prime_table,
+    miller_rabin,
+    prime_pi,
+    primes_in_range,
+    sieve_of_eratosthenes
+)
+
+__author__ = 'Enock Silos'
+__email__ = 'init.caucasian722@passfwd.com'
+__status__ = 'Verification'
+
+REFERENCE_LIMIT = 5000
+REFERENCE_PRIMES = [
+    number for number in range(REFERENCE_LIMIT)
+    if number > 1 and all(number % divisor for divisor in range(2, int(number ** 0.5) + 1))
+]
+
+class TestPrimeSieves(unittest.TestCase):
+    """
+    Suíte de provas formais para os crivos de primos.
+    """
+
+    def test_sieve_matches_trial_division(self):
+        """
+        Prova [1]: O crivo clássico coincide com `is_prime` para todos os
+        limites pequenos, inclusive os casos de borda 0, 1, 2 e 3.
+        """
+        for limit in range(200):
+            self.assertEqual(
+                sieve_of_eratosthenes(limit),
+                [p for p in REFERENCE_PRIMES if p < limit]
+            )
+
+    def test_segmented_ranges_are_exact(self):
+        """
+        Prova [2]: Qualquer intervalo `[start, stop)` é exato, mesmo com
+        segmentos minúsculos que exigem ampliar os primos-base várias vezes.
+        """
+        for segment_size in (2, 7, 64, 1000):
+            for start, stop in ((0, 100), (2, 3), (3, 3), (89, 1009), (1000, REFERENCE_LIMIT), (-10, 12)):
+                self.assertEqual(
+                    list(iter_primes(start, stop, segment_size=segment_size)),
+                    [p for p in REFERENCE_PRIMES if start <= p < stop]
+                )
+
+    def test_infinite_generator(self):
+        """
+        Prova [3]: `generate_primes` continua infinito e exato.
+        """
+        self.assertEqual(list(islice(generate_primes(), len(REFERENCE_PRIMES))), REFERENCE_PRIMES)
+
+    def test_rejects_degenerate_segment(self):
+        """
+        Prova [4]: Segmentos menores que 2 são rejeitados.
+        """
+        with self.assertRaises(ValueError):
+            next(iter_primes(segment_size=1))
+
+class TestPrimeRanges(unittest.TestCase):
+    """
+    Suíte de provas formais para a geração e a contagem em fatias.
+    """
+
+    def test_ranges_are_exact_for_any_chunking(self):
+        """
+        Prova [1]: Fatias e segmentos de qualquer tamanho (inclusive ímpares
+        e minúsculos) produzem exatamente os primos do intervalo.
+        """
+        for chunk_size, segment_size in ((2, 2), (9, 4), (100, 17), (1 << 24, 1 << 18)):
+            for start, stop in ((0, REFERENCE_LIMIT), (2, 3), (1000, 1000), (997, 1010), (-5, 50)):
+                expected = [p for p in REFERENCE_PRIMES if start <= p < stop]
+                options = {'chunk_size': chunk_size, 'segment_size': segment_size}
+                self.assertEqual(primes_in_range(start, stop, **options), expected)
+                self.assertEqual(count_primes(start, stop, **options), len(expected))
+
+    def test_parallel_matches_serial(self):
+        """
+        Prova [2]: Com múltiplos processos, os resultados chegam em ordem e
+        coincidem com os valores conhecidos de π(n).
+        """
+        self.assertEqual(primes_in_range(0, REFERENCE_LIMIT, workers=2, chunk_size=500), REFERENCE_PRIMES)
+        self.assertEqual(count_primes(0, 10 ** 6 + 1, workers=2, chunk_size=1 << 17), 78_498)
+        self.assertEqual([prime_pi(10 ** k) for k in range(6)], [0, 4, 25, 168, 1229, 9592])
+
+    def test_segments_cover_square_root(self):
+        """
+        Prova [3]: Perto de 10^11, segmentos pequenos são ampliados para
+        oito vezes a raiz quadrada do limite, sem alterar os primos.
+        """
+        self.assertEqual(prime_number_utilities._minimum_segment_size(16, 10 ** 11), 1 << 22)
+        self.assertEqual(prime_number_utilities._minimum_segment_size(1 << 23, 10 ** 11), 1 << 23)
+        self.assertEqual(prime_number_utilities._minimum_segment_size(2, 100), 128)
+        start, stop = 10 ** 11, 10 ** 11 + 20_000
+        expected = [n for n in range(start, stop) if miller_rabin(n)]
+        self.assertEqual(primes_in_range(start, stop, segment_size=64), expected)
+        self.assertEqual(list(iter_primes(start, stop, segment_size=64)), expected)
+
+    def test_concurrent_threads_keep_their_base_primes(self):
+        """
+        Prova [4]: Contagens simultâneas em threads, com limites diferentes,
+        não compartilham os primos-base do caminho serial.
+        """
+        def count(stop):
+            return count_primes(0, stop, chunk_size=1 << 12, segment_size=64)
+
+        stops = [300_000, 100] * 20
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            self.assertEqual(list(executor.map(count, stops)), [25_997, 25] * 20)
+        self.assertEqual(prime_number_utilities._WORKER_BASE_PRIMES, ())
+
+    def test_rejects_degenerate_chunks(self):
+        """
+        Prova [5]: Fatias menores que 2 são rejeitadas.
+        """
+        with self.assertRaises(ValueError):
+            count_primes(0, 100, chunk_size=1)
+
+class TestMillerRabin(unittest.TestCase):
+    """
+    Suíte de provas formais para `miller_rabin` e o despacho de `is_prime`.
+    """
+
+    def test_matches_sieve(self):
+        """
+        Prova [1]: `miller_rabin` e `is_prime` coincidem com o crivo em uma
+        faixa que atravessa `MILLER_RABIN_THRESHOLD` e o limite do pré-filtro.
+        """
+        limit = max(60_000, 4 * MILLER_RABIN_THRESHOLD)
+        primes = set(sieve_of_eratosthenes(limit))
+        for number in range(-2, limit):
+            self.assertEqual(miller_rabin(number), number in primes, number)
+            self.assertEqual(is_prime(number), number in primes, number)
+
+    def test_strong_pseudoprimes_are_rejected(self):
+        """
+        Prova [2]: Os menores pseudoprimos fortes de cada conjunto de bases
+        (os próprios limites da faixa determinística) são rejeitados.
+        """
+        for composite in (
+            2_047, 1_373_653, 25_326_001, 3_215_031_751, 2_152_302_898_747,
+            3_474_749_660_383, 341_550_071_728_321, 3_825_123_056_546_413_051
+        ):
+            self.assertFalse(is_prime(composite), composite)
+
+    def test_large_known_primes(self):
+        """
+        Prova [3]: Primos de Mersenne e o maior primo de 64 bits são
+        reconhecidos, inclusive acima da faixa determinística.
+        """
+        for prime in (2 ** 31 - 1, 2 ** 61 - 1, 2 ** 64 - 59, 2 ** 89 - 1, 2 ** 127 - 1):
+            self.assertTrue(is_prime(prime))
+        self.assertFalse(is_prime((2 ** 61 - 1) * (2 ** 31 - 1)))
+        self.assertFalse(is_prime((2 ** 89 - 1) * (2 ** 61 - 1)))
+
+    def test_rejects_invalid_rounds(self):
+        """
+        Prova [4]: O número de rodadas deve ser positivo.
+        """
+        with self.assertRaises(ValueError):
+            miller_rabin(97, rounds=0)
+
+class TestIsPrimeMany(unittest.TestCase):
+    """
+    Suíte de provas formais para a verificação em lote `is_prime_many`.
+    """
+
+    def setUp(self):
+        """
+        Monta valores densos, esparsos de 32 e 64 bits e casos de borda.
+        """
+        rng = random.Random(7)
+        self.dense = [rng.randrange(-3, 20_000) for _ in range(2_000)]
+        self.sparse = (
+            [rng.randrange(1 << 32) for _ in range(2_000)]
+            + [rng.randrange(1 << 80) for _ in range(200)]
+            + [0, 1, 2, 199, 211, 39_601, 4_294_967_291, 2 ** 64 - 59, 2 ** 64 - 1, 25_326_001]
+        )
+
+    def _check(self):
+        """
+        Compara o lote com `is_prime` valor a valor, nas duas distribuições.
+        """
+        for values in (self.dense, self.sparse):
+            self.assertEqual(is_prime_many(values), [is_prime(value) for value in values])
+        self.assertEqual(is_prime_many(iter(self.dense)), [is_prime(value) for value in self.dense])
+        self.assertEqual(is_prime_many([]), [])
+
+    def test_matches_single_checks(self):
+        """
+        Prova [1]: O lote coincide com `is_prime` (com NumPy, se instalado).
+        """
+        self._check()
+
+    def test_matches_single_checks_without_numpy(self):
+        """
+        Prova [2]: O caminho em Python puro produz o mesmo resultado.
+        """
+        with mock.patch.object(prime_number_utilities, 'np', None):
+            self._check()
+
+class TestPrimeTable(unittest.TestCase):
+    """
+    Suíte de provas formais para a tabela de primos `PrimeTable`.
+    """
+
+    def setUp(self):
+        """
+        Cria um diretório temporário para os arquivos de tabela.
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'primes.bin')
+
+    def tearDown(self):
+        """
+        Remove o diretório temporário.
+        """
+        self.directory.cleanup()
+
+    def test_grows_on_demand(self):
+        """
+        Prova [1]: Consultas além do limite ampliam a tabela (ao menos
+        dobrando-o) sem perder nem repetir primos.
+        """
+        table = PrimeTable(100)
+        self.assertEqual(list(table.primes_below(100)), [p for p in REFERENCE_PRIMES if p < 100])
+        self.assertIn(4999, table)
+        self.assertNotIn(4997, table)
+        self.assertGreaterEqual(table.limit, 5000)
+        self.assertEqual(table.nth(len(REFERENCE_PRIMES) - 1), REFERENCE_PRIMES[-1])
+        self.assertEqual(list(table.primes_below(REFERENCE_LIMIT)), REFERENCE_PRIMES)
+
+    def test_save_and_load(self):
+        """
+        Prova [2]: Uma tabela salva é reaberta idêntica, com ou sem `mmap`,
+        e uma tabela mapeada continua ampliável.
+        """
+        PrimeTable(REFERENCE_LIMIT).save(self.path)
+        for use_mmap in (True, False):
+            table = PrimeTable.load(self.path, use_mmap=use_mmap)
+            self.assertEqual(table.limit, REFERENCE_LIMIT)
+            self.assertEqual(list(table.primes_below(REFERENCE_LIMIT)), REFERENCE_PRIMES)
+            table.extend_to(3 * REFERENCE_LIMIT)
+            self.assertEqual(len(table), len(sieve_of_eratosthenes(table.limit)))
+
+    def test_rejects_corrupted_files(self):
+        """
+        Prova [3]: Arquivos truncados ou de outro formato são rejeitados.
+        """
+        PrimeTable(REFERENCE_LIMIT).save(self.path)
+        with open(self.path, 'r+b') as binary_handle:
+            binary_handle.truncate(100)
+        with self.assertRaises(ValueError):
+            PrimeTable.load(self.path)
+
+    def test_shared_table_is_persisted_and_reused(self):
+        """
+        Prova [4]: `load_prime_table` constrói e salva a tabela na primeira
+        vez, reabre o arquivo em seguida, e `is_prime` e `generate_primes`
+        passam a consultá-la.
+        """
+        with mock.patch.object(prime_number_utilities, '_PRIME_TABLE', PrimeTable()):
+            table = load_prime_table(self.path, minimum_limit=REFERENCE_LIMIT)
+            self.assertTrue(os.path.exists(self.path))
+            self.assertIs(prime_number_utilities.get_prime_table(), table)
+
+            prime_number_utilities._PRIME_TABLE = PrimeTable()
+            reloaded = load_prime_table(self.path, minimum_limit=REFERENCE_LIMIT)
+            self.assertIsNotNone(reloaded._mapping)
+            self.assertEqual([n for n in range(REFERENCE_LIMIT) if is_prime(n)], REFERENCE_PRIMES)
+            count = 2 * len(reloaded)
+            self.assertEqual(list(islice(generate_primes(), count)), list(islice(iter_primes(), count)))
+
+    def test_large_queries_do_not_grow_table(self):
+        """
+        Prova [5]: Números acima de `PRIME_TABLE_MAX_LIMIT` são testados
+        pelo Miller–Rabin, sem ampliar a tabela.
+        """
+        table = PrimeTable(100)
+        self.assertIn(10 ** 12 + 39, table)
+        self.assertNotIn(10 ** 12 + 41, table)
+        self.assertEqual(table.limit, 100)
+        with mock.patch.object(prime_number_utilities, 'PRIME_TABLE_MAX_LIMIT', 1000):
+            self.assertIn(4999, table)
+            self.assertNotIn(4997, table)
+        self.assertEqual(table.limit, 100)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,169 @@
+"""
+Artefato de Verificação e Validação para `statistical_sketches`.
+
+Esta suíte prova que o KLL estima quantis dentro do erro de posto
+anunciado, que o HyperLogLog estima a cardinalidade dentro do erro
+relativo esperado e que ambos são combináveis entre blocos, pelos caminhos
+em Python puro e vetorizado.
+"""
+
+from __future__ import annotations
+import random
+import unittest
+from bisect import bisect_right
+from python_sessions.concepts.algorithms import statistical_sketches
+from python_sessions.concepts.algorithms.statistical_sketches import HyperLogLog, KLLSketch
+
+__author__ = 'Enock Silos'
+__email__ = 'init.caucasian722@passfwd.com'
+__status__ = 'Verification'
+
+FRACTIONS = (0.01, 0.25, 0.5, 0.75, 0.95, 0.99)
+
+class TestKLLSketch(unittest.TestCase):
+    """
+    Suíte de provas formais para `KLLSketch`.
+    """
+
+    def setUp(self):
+        """
+        Prepara uma amostra de 200.000 valores e a sua versão ordenada.
+        """
+        rng = random.Random(11)
+        self.data = [rng.expovariate(1.0) for _ in range(200_000)]
+        self.sorted = sorted(self.data)
+
+    def assertRankErrorBelow(self, sketch, bound):
+        """
+        Verifica que o posto real de cada quantil estimado está a menos de
+        `bound` da fração pedida.
+        """
+        for fraction, value in zip(FRACTIONS, sketch.quantiles(FRACTIONS)):
+            rank = bisect_right(self.sorted, value) / len(self.sorted)
+            self.assertLess(abs(rank - fraction), bound, fraction)
+
+    def test_quantiles_within_rank_error(self):
+        """
+        Prova [1]: Em blocos ou valor a valor, os quantis respeitam o erro
+        de posto, a memória fica limitada e os extremos são exatos.
+        """
+        sketch = KLLSketch(seed=1)
+        for start in range(0, len(self.data), 4096):
+            sketch.update_many(self.data[start:start + 4096])
+        self.assertRankErrorBelow(sketch, 0.0165)
+        self.assertLess(sum(map(len, sketch._levels)), 3 * sketch.k)
+        self.assertEqual((sketch.quantile(0), sketch.quantile(1)), (self.sorted[0], self.sorted[-1]))
+        self.assertAlmostEqual(sketch.rank(sketch.quantile(0.5)), 0.5, delta=0.0165)
+
+        single = KLLSketch(k=64, seed=2)
+        for value in self.data[:20_000]:
+            single.update(value)
+        self.assertEqual(single.count, 20_000)
+
+    def test_merge_of_chunks(self):
+        """
+        Prova [2]: Sketches de blocos combinados preservam a contagem e o
+        erro de posto; capacidades diferentes não se combinam.
+        """
+        merged = KLLSketch(seed=3)
+        for part in range(8):
+            sketch = KLLSketch(seed=part)
+            sketch.update_many(self.data[part::8])
+            merged.merge(sketch)
+        self.assertEqual(merged.count, len(self.data))
+        self.assertRankErrorBelow(merged, 0.0165)
+        with self.assertRaises(ValueError):
+            merged.merge(KLLSketch(k=100))
+
+    @unittest.skipIf(statistical_sketches.np is None, 'NumPy não está instalado.')
+    def test_array_path(self):
+        """
+        Prova [3]: Blocos de vetores, compactados com o NumPy, conservam o
+        peso total e respeitam o erro de posto.
+        """
+        vector = statistical_sketches.np.array(self.data)
+        sketch = KLLSketch(seed=4)
+        for start in range(0, vector.size, 65536):
+            sketch.update_array(vector[start:start + 65536])
+        weight = sum(len(items) << level for level, items in enumerate(sketch._levels))
+        self.assertEqual((sketch.count, weight), (len(self.data), len(self.data)))
+        self.assertRankErrorBelow(sketch, 0.0165)
+
+    def test_sizing_and_validation(self):
+        """
+        Prova [4]: O dimensionamento por erro e as validações de entrada.
+        """
+        self.assertEqual(KLLSketch.from_error_bound(0.01).k, 330)
+        self.assertEqual(KLLSketch().quantile(0.5), 0)
+        with self.assertRaises(ValueError):
+            KLLSketch(k=4)
+        with self.assertRaises(ValueError):
+            KLLSketch().quantiles([1.5])
+
+class TestHyperLogLog(unittest.TestCase):
+    """
+    Suíte de provas formais para `HyperLogLog`.
+    """
+
+    def setUp(self):
+        """
+        Prepara 300.000 valores com cerca de 100.000 distintos.
+        """
+        rng = random.Random(17)
+        self.values = [rng.randrange(100_000) * 0.5 for _ in range(300_000)]
+        self.distinct = len(set(self.values))
+
+    def test_estimate_within_error(self):
+        """
+        Prova [5]: A estimativa fica a menos de 3 erros padrão da
+        cardinalidade real, e cardinalidades pequenas são quase exatas.
+        """
+        sketch = HyperLogLog(12)
+        sketch.update_many(self.values)
+        self.assertAlmostEqual(sketch.estimate(), self.distinct, delta=self.distinct * 3 * 1.04 / 64)
+
+        small = HyperLogLog()
+        small.update_many([1, 1.0, 2, -0.0, 0.0, 3])
+        small.update(3)
+        self.assertEqual(small.estimate(), 4)
+
+    def test_merge_equals_union(self):
+        """
+        Prova [6]: Combinar sketches de blocos equivale a um único sketch
+        da união; precisões diferentes não se combinam.
+        """
+        whole = HyperLogLog(10)
+        whole.update_many(self.values)
+        merged = HyperLogLog(10)
+        for part in range(3):
+            sketch = HyperLogLog(10)
+            sketch.update_many(self.values[part::3])
+            merged.merge(sketch)
+        self.assertEqual(merged._registers, whole._registers)
+        with self.assertRaises(ValueError):
+            merged.merge(HyperLogLog(11))
+        with self.assertRaises(ValueError):
+            HyperLogLog(3)
+        self.assertEqual(HyperLogLog.from_error_bound(0.01).precision, 14)
+
+    @unittest.skipIf(statistical_sketches.np is None, 'NumPy não está instalado.')
+    def test_array_path_matches_python(self):
+        """
+        Prova [7]: O caminho vetorizado produz os mesmos registradores, para
+        vetores de floats e de inteiros.
+        """
+        np = statistical_sketches.np
+        expected = HyperLogLog()
+        expected.update_many(self.values)
+        vectorized = HyperLogLog()
+        vectorized.update_array(np.array(self.values))
+        self.assertEqual(vectorized._registers, expected._registers)
+
+        integers = HyperLogLog()
+        integers.update_array(np.arange(1000, dtype=np.int64))
+        python = HyperLogLog()
+        python.update_many(range(1000))
+        self.assertEqual(integers._registers, python._registers)
+
+if __name__ == '__main__':
+    unittest.main()
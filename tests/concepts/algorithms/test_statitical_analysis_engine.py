@@ -0,0 +1,363 @@
+"""
+Artefato de Verificação e Validação para `statitical_analysis_engine`.
+
+Esta suíte prova que o acumulador de uma passagem reproduz as estatísticas
+do módulo `statistics`, que acumuladores de blocos combinados equivalem a
+um único acumulador, que o relatório aceita qualquer iterável, que o
+caminho vetorizado coincide com o caminho em Python puro e que as métricas
+por sketches compartilham e combinam os seus sketches, inclusive sobre
+arquivos divididos em fatias.
+"""
+
+from __future__ import annotations
+import os
+import random
+import statistics
+import tempfile
+import unittest
+from array import array
+from unittest import mock
+from python_sessions.concepts.algorithms import statitical_analysis_engine
+from python_sessions.concepts.algorithms.statistical_sketches import HyperLogLog, KLLSketch
+from python_sessions.concepts.algorithms.statitical_analysis_engine import (
+    SKETCH_OPERATIONS,
+    STATISTICAL_OPERATIONS,
+    StatisticsAccumulator,
+    accumulate_numeric_file,
+    distinct_count_metric,
+    generate_file_report,
+    generate_report_from_accumulator,
+    generate_statistical_report,
+    quantile_metric
+)
+
+__author__ = 'Enock Silos'
+__email__ = 'init.caucasian722@passfwd.com'
+__status__ = 'Verification'
+
+class TestStatisticsAccumulator(unittest.TestCase):
+    """
+    Suíte de provas formais para `StatisticsAccumulator`.
+    """
+
+    def setUp(self):
+        """
+        Prepara uma amostra com deslocamento grande, que expõe a fórmula
+        ingênua da variância.
+        """
+        rng = random.Random(5)
+        self.data = [1e9 + rng.gauss(0, 3) for _ in range(5000)]
+
+    def assertMatchesStatistics(self, accumulator, data):
+        """
+        Compara o acumulador com o módulo `statistics`.
+        """
+        self.assertEqual(accumulator.count, len(data))
+        self.assertEqual(accumulator.minimum, min(data))
+        self.assertEqual(accumulator.maximum, max(data))
+        self.assertAlmostEqual(accumulator.mean, statistics.fmean(data), delta=1e-6)
+        self.assertAlmostEqual(accumulator.sample_variance, statistics.variance(data), delta=1e-6)
+        self.assertAlmostEqual(accumulator.variance, statistics.pvariance(data), delta=1e-6)
+
+    def test_single_pass_matches_statistics(self):
+        """
+        Prova [1]: Valor a valor (Welford) ou em blocos, o acumulador
+        reproduz média, variâncias, mínimo e máximo.
+        """
+        one_by_one = StatisticsAccumulator()
+        for value in self.data:
+            one_by_one.update(value)
+        self.assertMatchesStatistics(one_by_one, self.data)
+        self.assertMatchesStatistics(StatisticsAccumulator.from_iterable(iter(self.data), chunk_size=77), self.data)
+
+    def test_merge_is_equivalent_to_one_pass(self):
+        """
+        Prova [2]: Acumuladores de blocos desiguais (inclusive vazios),
+        combinados, equivalem a um único acumulador.
+        """
+        bounds = [0, 0, 1, 1200, 1201, 4000, 5000]
+        merged = StatisticsAccumulator()
+        for start, end in zip(bounds, bounds[1:]):
+            merged.merge(StatisticsAccumulator.from_iterable(self.data[start:end]))
+        self.assertMatchesStatistics(merged, self.data)
+
+    def test_empty_and_integer_data(self):
+        """
+        Prova [3]: O acumulador vazio devolve zeros, e a soma de inteiros
+        permanece exata.
+        """
+        empty = StatisticsAccumulator()
+        self.assertEqual((empty.count, empty.mean, empty.sample_variance), (0, 0.0, 0.0))
+        big = StatisticsAccumulator.from_iterable([10**20, 1, -10**20])
+        self.assertEqual(big.total, 1)
+
+class TestGenerateStatisticalReport(unittest.TestCase):
+    """
+    Suíte de provas formais para `generate_statistical_report`.
+    """
+
+    def test_report_from_generator(self):
+        """
+        Prova [4]: Um gerador é consumido uma única vez e produz todas as
+        métricas padrão, na ordem de `STATISTICAL_OPERATIONS`.
+        """
+        data = [4, 8, 15, 16, 23, 42]
+        report = generate_statistical_report(value for value in data)
+        self.assertEqual(list(report), list(STATISTICAL_OPERATIONS))
+        self.assertEqual(report['Contagem'], 6)
+        self.assertEqual(report['Soma'], 108)
+        self.assertEqual((report['Mínimo'], report['Máximo']), (4, 42))
+        self.assertAlmostEqual(report['Média'], 18.0)
+        self.assertAlmostEqual(report['Desvio Padrão'], statistics.stdev(data))
+
+    def test_plain_callables_and_accumulator_report(self):
+        """
+        Prova [5]: Funções comuns recebem os dados materializados, sem
+        acumulador quando nenhuma métrica é incremental, e o relatório de um
+        acumulador recusa operações que precisam dos dados.
+        """
+        operations = {'Soma': STATISTICAL_OPERATIONS['Soma'], 'Mediana': statistics.median}
+        report = generate_statistical_report(iter([3, 1, 2]), operations)
+        self.assertEqual(report, {'Soma': 6, 'Mediana': 2})
+        self.assertEqual(STATISTICAL_OPERATIONS['Média']([1, 2]), 1.5)
+
+        accumulator = StatisticsAccumulator.from_iterable([1, 2, 3])
+        self.assertEqual(generate_report_from_accumulator(accumulator)['Variância'], 1.0)
+        with self.assertRaises(TypeError):
+            generate_report_from_accumulator(accumulator, operations)
+
+        words = iter(['b', 'a', 'c'])
+        with mock.patch.object(StatisticsAccumulator, 'from_iterable') as from_iterable:
+            report = generate_statistical_report(words, {'Primeira': min, 'Quantidade': len})
+        from_iterable.assert_not_called()
+        self.assertEqual(report, {'Primeira': 'a', 'Quantidade': 3})
+
+    def test_empty_report(self):
+        """
+        Prova [6]: Uma amostra vazia produz zeros em vez de erros.
+        """
+        report = generate_statistical_report([])
+        self.assertTrue(all(value == 0 for value in report.values()))
+
+class TestSketchOperations(unittest.TestCase):
+    """
+    Suíte de provas formais para as métricas por sketches.
+    """
+
+    def setUp(self):
+        """
+        Prepara uma amostra de inteiros com muitas repetições.
+        """
+        rng = random.Random(23)
+        self.data = [rng.randrange(5000) for _ in range(50_000)]
+        self.operations = {**STATISTICAL_OPERATIONS, **SKETCH_OPERATIONS}
+
+    def test_sketch_metrics_in_report(self):
+        """
+        Prova [7]: Mediana, percentis e distintos são estimados na mesma
+        passagem de um gerador, com um único KLL para os três quantis.
+        """
+        report = generate_statistical_report((value for value in self.data), self.operations)
+        ordered = sorted(self.data)
+        self.assertEqual(report['Contagem'], len(self.data))
+        self.assertAlmostEqual(report['Mediana'], ordered[len(ordered) // 2], delta=5000 * 0.0165)
+        self.assertAlmostEqual(report['Percentil 99'], ordered[int(len(ordered) * 0.99)], delta=5000 * 0.0165)
+        self.assertAlmostEqual(report['Valores Distintos'], len(set(self.data)), delta=5000 * 0.03)
+
+        accumulator = StatisticsAccumulator.from_iterable(self.data, sketches={op.sketch for op in SKETCH_OPERATIONS.values()})
+        self.assertEqual(set(accumulator.sketches), {(KLLSketch, 200), (HyperLogLog, 14)})
+        self.assertEqual(quantile_metric(1.0)(self.data), max(self.data))
+        with self.assertRaises(ValueError):
+            quantile_metric(2)
+
+    def test_report_from_merged_accumulators(self):
+        """
+        Prova [8]: Acumuladores de blocos com os mesmos sketches se combinam
+        em um relatório completo; sketches diferentes ou ausentes são
+        rejeitados.
+        """
+        specs = [(KLLSketch, 200), (HyperLogLog, 14)]
+        merged = StatisticsAccumulator(specs)
+        for start in range(0, len(self.data), 7000):
+            merged.merge(StatisticsAccumulator.from_iterable(self.data[start:start + 7000], sketches=specs))
+        report = generate_report_from_accumulator(merged, self.operations)
+        self.assertEqual(report['Soma'], sum(self.data))
+        self.assertEqual(report['Valores Distintos'], SKETCH_OPERATIONS['Valores Distintos'](self.data))
+
+        with self.assertRaises(ValueError):
+            merged.merge(StatisticsAccumulator())
+        with self.assertRaises(ValueError):
+            generate_report_from_accumulator(merged, {'Distintos': distinct_count_metric(10)})
+
+@unittest.skipIf(statitical_analysis_engine.np is None, 'NumPy não está instalado.')
+class TestVectorizedReport(unittest.TestCase):
+    """
+    Suíte de provas formais para o caminho vetorizado (NumPy).
+    """
+
+    def setUp(self):
+        """
+        Prepara os mesmos dados como lista, vetor e buffer.
+        """
+        np = statitical_analysis_engine.np
+        self.values = [1e6 + value for value in np.random.default_rng(3).normal(0, 2, 10_000).tolist()]
+        self.vector = np.array(self.values)
+        self.buffer = array('d', self.values)
+
+    def test_array_matches_pure_python(self):
+        """
+        Prova [9]: Vetores e buffers, em blocos de qualquer tamanho,
+        produzem o mesmo relatório que a lista.
+        """
+        expected = generate_statistical_report(self.values)
+        for data in (self.vector, self.buffer, memoryview(self.buffer), self.vector.reshape(100, 100)):
+            report = generate_statistical_report(data)
+            self.assertEqual(report['Contagem'], expected['Contagem'])
+            self.assertEqual((report['Mínimo'], report['Máximo']), (expected['Mínimo'], expected['Máximo']))
+            for name in ('Soma', 'Média', 'Variância', 'Desvio Padrão'):
+                self.assertAlmostEqual(report[name], expected[name], delta=abs(expected[name]) * 1e-12)
+        blocked = StatisticsAccumulator.from_array(self.vector, chunk_size=999)
+        self.assertAlmostEqual(blocked.sample_variance, expected['Variância'], delta=expected['Variância'] * 1e-12)
+
+    def test_integer_arrays_and_plain_callables(self):
+        """
+        Prova [10]: Vetores de inteiros têm soma exata, mesmo além de 64
+        bits, e resultados do tipo `int`; operações comuns recebem o vetor, e
+        vetores de objetos são percorridos em Python puro.
+        """
+        np = statitical_analysis_engine.np
+        integers = np.arange(-5, 1000, dtype=np.int32)
+        report = generate_statistical_report(integers, {**STATISTICAL_OPERATIONS, 'Tipo': type})
+        self.assertEqual(report['Soma'], sum(range(-5, 1000)))
+        self.assertIsInstance(report['Soma'], int)
+        self.assertEqual(report['Mínimo'], -5)
+        self.assertIs(report['Tipo'], np.ndarray)
+        self.assertEqual(generate_statistical_report(np.array([]))['Contagem'], 0)
+
+        for dtype in (np.int64, np.uint64):
+            report = generate_statistical_report(np.full(4, 2 ** 62, dtype=dtype))
+            self.assertEqual((report['Soma'], report['Média']), (2 ** 64, float(2 ** 62)))
+        extremes = np.array([2 ** 63 - 1] * 3 + [-2 ** 63] * 2, dtype=np.int64)
+        self.assertEqual(generate_statistical_report(extremes)['Soma'], 2 ** 63 - 3)
+        self.assertEqual(generate_statistical_report(np.array([True, False, True]))['Soma'], 2)
+
+        huge = generate_statistical_report(np.array([1, 2 ** 70], dtype=object))
+        self.assertEqual((huge['Soma'], huge['Máximo']), (2 ** 70 + 1, 2 ** 70))
+        self.assertEqual(generate_statistical_report(np.array([1.5, 2.5], dtype=object))['Média'], 2.0)
+
+    def test_buffers_reach_plain_callables_unchanged(self):
+        """
+        Prova [11]: Buffers são acumulados como vetores, mas as operações
+        comuns recebem os dados originais.
+        """
+        operations = {
+            **STATISTICAL_OPERATIONS,
+            'Média Simples': lambda data: sum(data) / len(data) if data else 0.0,
+            'Tipo': type
+        }
+        for data in (array('i', [1, 2, 3]), memoryview(array('i', [1, 2, 3]))):
+            report = generate_statistical_report(data, operations)
+            self.assertEqual((report['Soma'], report['Média Simples']), (6, 2.0))
+            self.assertIs(report['Tipo'], type(data))
+
+    def test_fallback_without_numpy(self):
+        """
+        Prova [12]: Sem o NumPy, buffers são percorridos em Python puro.
+        """
+        expected = generate_statistical_report(self.values)
+        with mock.patch.object(statitical_analysis_engine, 'np', None):
+            self.assertEqual(generate_statistical_report(self.buffer), expected)
+
+    def test_vectorized_sketch_metrics(self):
+        """
+        Prova [13]: Em vetores, os sketches são alimentados pelo caminho
+        vetorizado com o mesmo resultado de distintos que a lista.
+        """
+        report = generate_statistical_report(self.vector, SKETCH_OPERATIONS)
+        expected = generate_statistical_report(self.values, SKETCH_OPERATIONS)
+        self.assertEqual(report['Valores Distintos'], expected['Valores Distintos'])
+        self.assertAlmostEqual(report['Mediana'], statistics.median(self.values), delta=0.1)
+
+class TestFileReport(unittest.TestCase):
+    """
+    Suíte de provas formais para o relatório de arquivos numéricos.
+    """
+
+    def setUp(self):
+        """
+        Grava a mesma amostra como CSV (com cabeçalho) e como binário.
+        """
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        rng = random.Random(29)
+        self.values = [round(rng.uniform(-50, 50), 3) for _ in range(3000)]
+        self.csv_path = os.path.join(self.directory.name, 'amostra.csv')
+        with open(self.csv_path, 'w') as file_pointer:
+            file_pointer.write('a,b,c\n')
+            for start in range(0, len(self.values), 3):
+                file_pointer.write(','.join(map(str, self.values[start:start + 3])) + '\n')
+        self.binary_path = os.path.join(self.directory.name, 'amostra.bin')
+        with open(self.binary_path, 'wb') as file_pointer:
+            array('d', self.values).tofile(file_pointer)
+        self.operations = {**STATISTICAL_OPERATIONS, **SKETCH_OPERATIONS}
+
+    def assertMatchesList(self, report):
+        """
+        Compara o relatório do arquivo com o da lista em memória.
+        """
+        expected = generate_statistical_report(self.values, self.operations)
+        for name in ('Contagem', 'Mínimo', 'Máximo', 'Valores Distintos'):
+            self.assertEqual(report[name], expected[name], name)
+        for name in ('Soma', 'Média', 'Variância', 'Desvio Padrão'):
+            self.assertAlmostEqual(report[name], expected[name], delta=1e-9 * max(1.0, abs(expected[name])))
+        self.assertAlmostEqual(report['Mediana'], statistics.median(self.values), delta=100 * 0.0165)
+
+    def test_csv_and_binary_in_chunks(self):
+        """
+        Prova [14]: CSV e binário, em fatias pequenas e em série ou em
+        paralelo, produzem o mesmo relatório que a lista.
+        """
+        for path, options in ((self.csv_path, {'skip_header': True}), (self.binary_path, {})):
+            for workers in (1, 2):
+                report = generate_file_report(path, self.operations, workers=workers, chunk_bytes=4001, **options)
+                self.assertMatchesList(report)
+
+    def test_integer_binary_and_fallback(self):
+        """
+        Prova [15]: Binários de inteiros têm soma exata, e sem o NumPy os
+        arquivos são lidos pelo caminho em Python puro.
+        """
+        path = os.path.join(self.directory.name, 'inteiros.dat')
+        with open(path, 'wb') as file_pointer:
+            array('i', range(-1000, 5000)).tofile(file_pointer)
+        accumulator = accumulate_numeric_file(path, typecode='i', chunk_bytes=1000)
+        self.assertEqual((accumulator.count, accumulator.total), (6000, sum(range(-1000, 5000))))
+
+        with mock.patch.object(statitical_analysis_engine, 'np', None):
+            self.assertMatchesList(generate_file_report(self.csv_path, self.operations, skip_header=True))
+            self.assertMatchesList(generate_file_report(self.binary_path, self.operations, chunk_bytes=800))
+
+    def test_invalid_files(self):
+        """
+        Prova [16]: Arquivos vazios produzem zeros; valores não numéricos,
+        tamanhos desalinhados, formatos desconhecidos e operações que
+        exigem os dados são rejeitados.
+        """
+        empty = os.path.join(self.directory.name, 'vazio.csv')
+        open(empty, 'w').close()
+        self.assertEqual(generate_file_report(empty)['Contagem'], 0)
+
+        with self.assertRaises(ValueError):
+            generate_file_report(self.csv_path)
+        misaligned = os.path.join(self.directory.name, 'desalinhado.bin')
+        with open(misaligned, 'wb') as file_pointer:
+            file_pointer.write(bytes(7))
+        with self.assertRaises(ValueError):
+            accumulate_numeric_file(misaligned)
+        with self.assertRaises(ValueError):
+            accumulate_numeric_file(self.binary_path, file_format='parquet')
+        with self.assertRaises(TypeError):
+            generate_file_report(self.binary_path, {'Mediana': statistics.median})
+
+if __name__ == '__main__':
+    unittest.main()
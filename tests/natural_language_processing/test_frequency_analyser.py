@@ -0,0 +1,150 @@
+"""
+Artefato de Verificação e Validação para `frequency_analyser`.
+
+Esta suíte prova que a contagem de n-gramas é exata independentemente da
+forma como o texto é fatiado (lotes, fatias de arquivo e processos) e que
+os sketches de memória limitada respeitam as suas garantias de erro.
+"""
+
+from __future__ import annotations
+import os
+import tempfile
+import unittest
+from collections import Counter
+from python_sessions.natural_language_processing.frequency_analyser import (
+    CountMinSketch,
+    NGramCounter,
+    SpaceSaving,
+    count_ngrams
+)
+
+__author__ = 'Enock Silos'
+__email__ = 'init.caucasian722@passfwd.com'
+__status__ = 'Verification'
+
+SAMPLE_WORDS = ('the cat sat on the mat and the cat ran to the other mat ' * 40).split()
+
+def _expected_ngrams(words, n):
+    """
+    Calcula as contagens de referência por força bruta.
+    """
+    return Counter(tuple(words[i:i + n]) if n > 1 else words[i] for i in range(len(words) - n + 1))
+
+class TestNGramCounter(unittest.TestCase):
+    """
+    Suíte de provas formais para o contador combinável `NGramCounter`.
+    """
+
+    def test_merge_of_consecutive_segments_is_exact(self):
+        """
+        Prova [1]: Combinar contadores de trechos consecutivos (inclusive
+        trechos menores que `n`) reproduz a contagem do texto inteiro.
+        """
+        for n in (1, 2, 3):
+            merged = NGramCounter(n)
+            for cut in range(0, len(SAMPLE_WORDS), 7):
+                part = NGramCounter(n)
+                part.update(SAMPLE_WORDS[cut:cut + 1] if cut % 2 else SAMPLE_WORDS[cut:cut + 7])
+                if cut % 2:
+                    part.update(SAMPLE_WORDS[cut + 1:cut + 7])
+                merged.merge(part)
+
+            self.assertEqual(merged.counts, _expected_ngrams(SAMPLE_WORDS, n))
+            self.assertEqual(merged.total_tokens, len(SAMPLE_WORDS))
+
+    def test_merge_rejects_different_orders(self):
+        """
+        Prova [2]: Contadores de ordens diferentes não podem ser combinados.
+        """
+        with self.assertRaises(ValueError):
+            NGramCounter(1).merge(NGramCounter(2))
+
+class TestCountNGrams(unittest.TestCase):
+    """
+    Suíte de provas formais para a contagem de arquivos em fatias.
+    """
+
+    def setUp(self):
+        """
+        Cria um arquivo temporário com várias linhas de texto.
+        """
+        handle = tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False, encoding='utf-8')
+        for start in range(0, len(SAMPLE_WORDS), 9):
+            handle.write(' '.join(SAMPLE_WORDS[start:start + 9]) + '\n')
+        handle.close()
+        self.filename = handle.name
+
+    def tearDown(self):
+        """
+        Remove o arquivo temporário.
+        """
+        os.remove(self.filename)
+
+    def test_chunked_and_parallel_counts_are_exact(self):
+        """
+        Prova [1]: Fatias pequenas e múltiplos processos não alteram o resultado.
+        """
+        expected = _expected_ngrams(SAMPLE_WORDS, 2)
+
+        serial = count_ngrams(self.filename, 2, chunk_bytes=50)
+        parallel = count_ngrams(self.filename, 2, chunk_bytes=50, workers=2)
+
+        self.assertEqual(serial.counts, expected)
+        self.assertEqual(parallel.counts, expected)
+
+class TestHeavyHitterSketches(unittest.TestCase):
+    """
+    Suíte de provas formais para `SpaceSaving` e `CountMinSketch`.
+    """
+
+    def test_space_saving_error_bound(self):
+        """
+        Prova [1]: Toda estimativa do Space-Saving fica entre a contagem real
+        e a contagem real mais N / capacidade, mesmo após combinações.
+        """
+        stream = [f'w{i % 50}' for i in range(2000)] + ['frequent'] * 500
+        left, right = SpaceSaving(20), SpaceSaving(20)
+        left.update(stream[::2])
+        right.update(stream[1::2])
+        left.merge(right)
+
+        truth = Counter(stream)
+        bound = len(stream) / 20
+        for item, estimate in left.counts.items():
+            self.assertGreaterEqual(estimate, truth[item])
+            self.assertLessEqual(estimate, truth[item] + bound)
+        self.assertEqual(left.most_common(1)[0][0], 'frequent')
+
+    def test_count_min_never_underestimates(self):
+        """
+        Prova [2]: O Count-Min nunca subestima e combina sketches corretamente.
+        """
+        stream = [f'w{i % 300}' for i in range(3000)]
+        first = CountMinSketch(width=64, depth=4, track_top=5)
+        second = CountMinSketch(width=64, depth=4, track_top=5)
+        first.update(stream[:1500])
+        second.update(stream[1500:])
+        first.merge(second)
+
+        truth = Counter(stream)
+        for item, count in truth.items():
+            self.assertGreaterEqual(first.estimate(item), count)
+        self.assertEqual(first.total, len(stream))
+        self.assertEqual(len(first.most_common(3)), 3)
+
+    def test_count_min_tracks_heavy_hitters(self):
+        """
+        Prova [3]: Os candidatos mantidos pelo heap são os itens de maiores
+        estimativas, mesmo com muitas substituições, e as colunas de cada
+        item são as mesmas em sketches diferentes.
+        """
+        stream = [f'w{i % 997}' for i in range(20_000)] + [f'top{i % 7}' for i in range(3500)]
+        sketch = CountMinSketch(width=4096, depth=4, track_top=7)
+        for item in stream:
+            sketch.add(item)
+        self.assertEqual({item for item, _ in sketch.most_common()}, {f'top{i}' for i in range(7)})
+        self.assertLessEqual(len(sketch._heap), 4 * sketch.track_top)
+        self.assertEqual(CountMinSketch(width=4096, depth=4)._cells('w1'), sketch._cells('w1'))
+
+if __name__ == '__main__':
+    unittest.main()
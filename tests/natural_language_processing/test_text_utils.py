@@ -0,0 +1,236 @@
+"""
+Artefato de Verificação e Validação para `text_utils`.
+
+Esta suíte prova o contrato do pipeline de tokenização em fluxo: a leitura
+em blocos não pode partir palavras ao meio, a remoção do cabeçalho e do
+rodapé do Projeto Gutenberg deve ser genérica e segura, e as opções de
+normalização devem produzir os tokens esperados.
+"""
+
+from __future__ import annotations
+import io
+import os
+import tempfile
+import unittest
+from python_sessions.natural_language_processing.text_utils import (
+    RollingWindow,
+    TokenVocabulary,
+    iter_text_blocks,
+    locate_gutenberg_body,
+    shift,
+    skip_gutenberg_header,
+    strip_gutenberg_boilerplate,
+    tokenize
+)
+
+__author__ = 'Enock Silos'
+__email__ = 'init.caucasian722@passfwd.com'
+__status__ = 'Verification'
+
+MODERN_GUTENBERG_TEXT = (
+    'The Project Gutenberg eBook of Emma\n'
+    'Licença e avisos legais.\n'
+    '*** START OF THE PROJECT GUTENBERG EBOOK EMMA ***\n'
+    'Emma Woodhouse, handsome, clever,\n'
+    'and rich.\n'
+    '*** END OF THE PROJECT GUTENBERG EBOOK EMMA ***\n'
+    'Rodapé com a licença.\n'
+)
+
+LEGACY_GUTENBERG_TEXT = (
+    '******The Project Gutenberg Etext of Emma, by Jane Austen******\n'
+    '***START**THE SMALL PRINT!**FOR PUBLIC DOMAIN ETEXTS**START***\n'
+    'Letras miúdas.\n'
+    '*END*THE SMALL PRINT! FOR PUBLIC DOMAIN ETEXTS*Ver.04.29.93*END*\n'
+    'CHAPTER I\n'
+    '\n'
+    'End of The Project Gutenberg Etext of Emma, by Jane Austen\n'
+)
+
+class TestIterTextBlocks(unittest.TestCase):
+    """
+    Suíte de provas formais para a leitura em blocos `iter_text_blocks`.
+    """
+
+    def test_blocks_never_split_words(self):
+        """
+        Prova [1]: Com blocos minúsculos, nenhuma palavra é partida e a
+        concatenação dos blocos reconstrói o texto original.
+        """
+        text = 'alpha beta\ngamma delta epsilon\nzeta'
+        blocks = list(iter_text_blocks(io.StringIO(text), block_size=4))
+
+        self.assertEqual(''.join(blocks), text)
+        tokens = [token for block in blocks for token in block.split()]
+        self.assertEqual(tokens, text.split())
+
+    def test_invalid_block_size_raises_value_error(self):
+        """
+        Prova [2]: Um tamanho de bloco não positivo é rejeitado.
+        """
+        with self.assertRaises(ValueError):
+            list(iter_text_blocks(io.StringIO('abc'), block_size=0))
+
+class TestGutenbergBoilerplate(unittest.TestCase):
+    """
+    Suíte de provas formais para a detecção genérica de cabeçalho e rodapé.
+    """
+
+    def test_modern_markers_are_stripped(self):
+        """
+        Prova [1]: Os marcadores modernos delimitam o corpo do texto.
+        """
+        body = ''.join(strip_gutenberg_boilerplate([MODERN_GUTENBERG_TEXT]))
+
+        self.assertEqual(body, 'Emma Woodhouse, handsome, clever,\nand rich.\n')
+
+    def test_legacy_markers_are_stripped(self):
+        """
+        Prova [2]: Os marcadores antigos (`*END*THE SMALL PRINT`) também são
+        reconhecidos.
+        """
+        body = ''.join(strip_gutenberg_boilerplate([LEGACY_GUTENBERG_TEXT]))
+
+        self.assertEqual(body.split(), ['CHAPTER', 'I'])
+
+    def test_text_without_header_is_preserved(self):
+        """
+        Prova [3]: Um texto sem cabeçalho não é descartado.
+        """
+        body = ''.join(strip_gutenberg_boilerplate(['linha um\n', 'linha dois\n']))
+
+        self.assertEqual(body, 'linha um\nlinha dois\n')
+
+    def test_skip_gutenberg_header_advances_past_header(self):
+        """
+        Prova [4]: `skip_gutenberg_header` posiciona o arquivo após o cabeçalho.
+        """
+        file_pointer = io.StringIO(LEGACY_GUTENBERG_TEXT)
+        skip_gutenberg_header(file_pointer)
+
+        self.assertEqual(next(file_pointer), 'CHAPTER I\n')
+
+    def test_footer_window_starts_at_a_line(self):
+        """
+        Prova [5]: `locate_gutenberg_body` delimita o corpo em bytes, e a
+        janela final ignora a linha que ela corta ao meio.
+        """
+        text = MODERN_GUTENBERG_TEXT.encode('utf-8')
+        quoted = b'Veja: End of the Project Gutenberg?\n' + b'y' * 40 + b'\n'
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'livro.txt')
+            with open(path, 'wb') as binary_pointer:
+                binary_pointer.write(text)
+            start, end = locate_gutenberg_body(path)
+            self.assertEqual(text[start:end].decode('utf-8'), 'Emma Woodhouse, handsome, clever,\nand rich.\n')
+            for scan_limit in (len(text) - end, len(text) - end + 1):
+                self.assertEqual(locate_gutenberg_body(path, scan_limit=scan_limit)[1], end)
+
+            with open(path, 'wb') as binary_pointer:
+                binary_pointer.write(quoted)
+            for scan_limit in (len(quoted), len(quoted) - 6, len(quoted) - 8):
+                self.assertEqual(locate_gutenberg_body(path, scan_limit=scan_limit), (0, len(quoted)))
+
+class TestTokenize(unittest.TestCase):
+    """
+    Suíte de provas formais para o pipeline `tokenize`.
+    """
+
+    def test_default_matches_whitespace_split(self):
+        """
+        Prova [1]: Com as opções padrão, o resultado coincide com `str.split`.
+        """
+        tokens = list(tokenize(io.StringIO(MODERN_GUTENBERG_TEXT), block_size=7))
+
+        self.assertEqual(tokens, ['Emma', 'Woodhouse,', 'handsome,', 'clever,', 'and', 'rich.'])
+
+    def test_normalization_options(self):
+        """
+        Prova [2]: Minúsculas e remoção de pontuação preservam apóstrofos e
+        hífens internos.
+        """
+        text = "Emma's twenty-one YEARS -- \"Well!\"\n"
+        tokens = list(tokenize(
+            io.StringIO(text),
+            lowercase=True,
+            strip_punctuation=True,
+            skip_gutenberg=False
+        ))
+
+        self.assertEqual(tokens, ["emma's", 'twenty-one', 'years', 'well'])
+
+    def test_unicode_normalization(self):
+        """
+        Prova [3]: A forma NFC une letras e acentos combinantes.
+        """
+        decomposed = 'cafe\u0301\n'
+        tokens = list(tokenize(io.StringIO(decomposed), unicode_form='NFC', skip_gutenberg=False))
+
+        self.assertEqual(tokens, ['café'])
+
+class TestRollingWindow(unittest.TestCase):
+    """
+    Suíte de provas formais para `TokenVocabulary` e `RollingWindow`.
+    """
+
+    def test_slide_is_equivalent_to_shift(self):
+        """
+        Prova [1]: Cada chave inteira corresponde exatamente à tupla que
+        `shift` produziria para a mesma posição.
+        """
+        words = 'a rose is a rose is a rose'.split()
+        vocabulary = TokenVocabulary()
+        window = RollingWindow(order=2)
+
+        expected = []
+        prefix: tuple = tuple(words[:2])
+        for word in words[2:]:
+            expected.append((prefix, word))
+            prefix = shift(prefix, word)
+
+        produced = [
+            (tuple(vocabulary.decode(i) for i in window.decode(key)), vocabulary.decode(token_id))
+            for key, token_id in window.slide(vocabulary.encode_all(words))
+        ]
+
+        self.assertEqual(produced, expected)
+
+    def test_slide_resumes_across_calls(self):
+        """
+        Prova [2]: O estado da janela persiste entre chamadas sucessivas.
+        """
+        single = RollingWindow(order=3)
+        split = RollingWindow(order=3)
+        ids = list(range(10))
+
+        whole = list(single.slide(ids))
+        parts = list(split.slide(ids[:4])) + list(split.slide(ids[4:]))
+
+        self.assertEqual(whole, parts)
+        self.assertEqual(single.key, split.key)
+
+    def test_push_masks_oldest_position(self):
+        """
+        Prova [3]: A posição mais antiga é descartada ao deslizar.
+        """
+        window = RollingWindow(order=2, bits=8)
+        for token_id in (1, 2, 3):
+            window.push(token_id)
+
+        self.assertTrue(window.is_full)
+        self.assertEqual(window.decode(window.key), (2, 3))
+
+    def test_vocabulary_capacity_is_enforced(self):
+        """
+        Prova [4]: O vocabulário rejeita palavras além da sua capacidade.
+        """
+        vocabulary = TokenVocabulary(capacity=2)
+        vocabulary.encode('a')
+        vocabulary.encode('b')
+
+        self.assertEqual(vocabulary.encode('a'), 0)
+        with self.assertRaises(OverflowError):
+            vocabulary.encode('c')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+"""
+Artefato de Verificação e Validação para `card_game_inheritance`.
+
+Esta suíte prova que as cartas são instâncias únicas e imutáveis, com a
+codificação inteira esperada, que `Deck` as reutiliza e que a distribuição
+em bloco preserva a ordem da distribuição carta a carta.
+"""
+
+from __future__ import annotations
+import copy
+import pickle
+import random
+import unittest
+from python_sessions.object_oriented_programming.card_game_inheritance import Card, Deck, Hand
+
+__author__ = 'Enock Silos'
+__email__ = 'init.caucasian722@passfwd.com'
+__status__ = 'Verification'
+
+def _deal_one_at_a_time(deck, num_hands, cards_per_hand):
+    """
+    Referência ingênua: distribui uma carta por vez com `pop_card`.
+    """
+    hands = [Hand() for _ in range(num_hands)]
+    for _ in range(cards_per_hand):
+        for hand in hands:
+            hand.add_card(deck.pop_card())
+    return hands
+
+class TestCard(unittest.TestCase):
+    """
+    Suíte de provas formais para `Card`.
+    """
+
+    def test_interned_instances(self):
+        """
+        Prova [1]: Cada carta existe uma única vez, inclusive após `copy` e
+        `pickle`, e o código segue a ordem (naipe, valor).
+        """
+        queen = Card(2, 12)
+        self.assertIs(Card(2, 12), queen)
+        self.assertIs(copy.deepcopy(queen), queen)
+        self.assertIs(pickle.loads(pickle.dumps(queen)), queen)
+        self.assertIs(Card.from_code(queen.code), queen)
+        self.assertEqual(queen.code, 2 * 13 + 11)
+        self.assertEqual({Card(2, 12), queen}, {queen})
+        self.assertLess(Card(0, 13), Card(1, 1))
+
+    def test_immutable_and_compact(self):
+        """
+        Prova [2]: As cartas não têm `__dict__`, não podem ser alteradas e
+        rejeitam naipes ou valores inválidos.
+        """
+        card = Card(3, 1)
+        self.assertFalse(hasattr(card, '__dict__'))
+        with self.assertRaises(AttributeError):
+            card.rank = 13
+        for suit, rank in ((4, 1), (0, 0), (0, 14)):
+            with self.assertRaises(ValueError):
+                Card(suit, rank)
+
+class TestDeck(unittest.TestCase):
+    """
+    Suíte de provas formais para `Deck`.
+    """
+
+    def test_decks_share_cards(self):
+        """
+        Prova [3]: Baralhos novos contêm as mesmas 52 instâncias, na ordem
+        dos códigos, em listas independentes.
+        """
+        first, second = Deck(), Deck()
+        self.assertEqual([card.code for card in first.cards], list(range(52)))
+        self.assertTrue(all(a is b for a, b in zip(first.cards, second.cards)))
+        first.pop_card()
+        self.assertEqual(len(second.cards), 52)
+
+    def test_bulk_deal_preserves_round_robin(self):
+        """
+        Prova [4]: A distribuição por fatias entrega as mesmas cartas, na
+        mesma ordem, que a distribuição carta a carta, e deixa o mesmo resto.
+        """
+        rng = random.Random(4)
+        for num_hands, cards_per_hand in ((5, 7), (4, 13), (1, 52), (3, 0), (2, 3)):
+            deck = Deck()
+            rng.shuffle(deck.cards)
+            reference = Deck()
+            reference.cards = list(deck.cards)
+
+            hands = deck.deal_hands(num_hands, cards_per_hand)
+            expected = _deal_one_at_a_time(reference, num_hands, cards_per_hand)
+            self.assertEqual([hand.cards for hand in hands], [hand.cards for hand in expected])
+            self.assertEqual(deck.cards, reference.cards)
+            self.assertEqual(hands[0].label, 'Mão do jogador 1')
+
+        with self.assertRaises(IndexError):
+            Deck().deal_hands(8, 7)
+
+    def test_move_cards_and_reset(self):
+        """
+        Prova [5]: `move_cards` entrega as cartas do topo primeiro, e `reset`
+        restaura o baralho na mesma lista.
+        """
+        deck = Deck()
+        hand = Hand()
+        deck.move_cards(hand, 3)
+        deck.move_cards(hand, 0)
+        self.assertEqual([card.code for card in hand.cards], [51, 50, 49])
+        self.assertEqual(len(deck.cards), 49)
+        with self.assertRaises(IndexError):
+            deck.move_cards(hand, 50)
+
+        cards = deck.cards
+        deck.reset()
+        self.assertIs(deck.cards, cards)
+        self.assertEqual(deck.cards, Deck().cards)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+"""
+Artefato de Verificação e Validação para `poker_analyser`.
+
+Esta suíte prova que a simulação de Pôquer é reprodutível pela semente,
+independentemente do número de processos, que o progresso é reportado
+por lote e que a força das mãos resolve showdowns conhecidos.
+"""
+
+from __future__ import annotations
+import unittest
+from python_sessions.object_oriented_programming.card_game_inheritance import Card
+from python_sessions.projects.poker_hand_analyzer.poker_analyser import PokerHand, showdown, simulate_poker
+
+__author__ = 'Enock Silos'
+__email__ = 'init.caucasian722@passfwd.com'
+__status__ = 'Verification'
+
+SUITS = {'c': 0, 'd': 1, 'h': 2, 's': 3}
+RANKS = {'A': 1, 'T': 10, 'J': 11, 'Q': 12, 'K': 13}
+
+def _hand(text):
+    """
+    Monta uma `PokerHand` a partir de uma notação como 'As Kd 9h 9c 2s'.
+    """
+    hand = PokerHand()
+    hand.cards = [Card(SUITS[card[1]], RANKS.get(card[0]) or int(card[0])) for card in text.split()]
+    return hand
+
+class TestSimulatePoker(unittest.TestCase):
+    """
+    Suíte de provas formais para `simulate_poker`.
+    """
+
+    def test_counts_every_hand(self):
+        """
+        Prova [1]: Cada mão distribuída recebe exatamente um rótulo.
+        """
+        counts = simulate_poker(300, num_hands=4, cards_per_hand=5, seed=1)
+        self.assertEqual(sum(counts.values()), 1200)
+        self.assertEqual(next(iter(counts)), 'Straight Flush')
+
+    def test_parallel_matches_serial(self):
+        """
+        Prova [2]: Com a mesma semente, a simulação em paralelo produz as
+        mesmas contagens que a serial.
+        """
+        serial = simulate_poker(400, seed=21, simulations_per_task=100)
+        parallel = simulate_poker(400, seed=21, simulations_per_task=100, workers=2)
+        self.assertEqual(parallel, serial)
+        self.assertEqual(simulate_poker(400, seed=21, simulations_per_task=100), serial)
+
+    def test_progress_per_task(self):
+        """
+        Prova [3]: O progresso é reportado uma vez por lote, até o total.
+        """
+        reports = []
+        simulate_poker(250, seed=3, simulations_per_task=100, progress=lambda done, total: reports.append((done, total)))
+        self.assertEqual(reports, [(100, 250), (200, 250), (250, 250)])
+
+class TestPokerHandOrdering(unittest.TestCase):
+    """
+    Suíte de provas formais para a comparação de `PokerHand`.
+    """
+
+    def test_known_showdowns(self):
+        """
+        Prova [4]: Em cada par (vencedora, perdedora), a vencedora é maior,
+        incluindo desempates por kicker, pela trinca do full house, por
+        todas as cartas do flush e pela sequência mais baixa (Ás, 2, 3, 4, 5).
+        """
+        cases = [
+            ('2h 5h 9h Jh Kh', 'Ts Jd Qc Kh As'),    # flush > sequência
+            ('As Ad Kc 7h 4s', 'Ah Ac Qd Js 9c'),    # par de Ases: kicker K > Q
+            ('Ks Kd 2c 2h 3s', 'Qs Qd Jc Jh As'),    # dois pares: par maior decide
+            ('9s 9d 5c 5h Qs', '9h 9c 5s 5d Js'),    # mesmos dois pares: kicker
+            ('Ks Kd Kc 2h 2s', 'Qs Qd Qc Ah As'),    # full house: trinca maior
+            ('Ah Jh 9h 6h 3h', 'Ad Jd 9d 6d 2d'),    # flush: quinta carta decide
+            ('2s 3d 4c 5h 6s', 'As 2d 3c 4h 5s'),    # sequência até o 6 > roda
+            ('As Ad Ac Ah 2s', 'Ks Kd Kc Kh As'),    # quadra maior, kicker irrelevante
+        ]
+        for winner, loser in cases:
+            self.assertGreater(_hand(winner).strength(), _hand(loser).strength(), winner)
+            self.assertEqual(showdown([_hand(loser), _hand(winner)]), [1])
+
+    def test_seven_card_showdowns(self):
+        """
+        Prova [5]: Com a mesa somada às cartas de cada jogador, a melhor mão
+        de 5 cartas decide; se a mesa joga sozinha, o pote é dividido.
+        """
+        board = 'Ts Jd Qc Kh 2s'
+        broadway = [_hand(f'{board} As 3c'), _hand(f'{board} Ad 4c'), _hand(f'{board} 9s 9d')]
+        self.assertEqual(showdown(broadway), [0, 1])
+        self.assertEqual(broadway[0].strength(), broadway[1].strength())
+
+        board = 'As Ad 7c 7h 3s'
+        third_pair_is_counterfeited = [_hand(f'{board} 5c 5d'), _hand(f'{board} Kc 2d')]
+        self.assertEqual(showdown(third_pair_is_counterfeited), [1])
+
+    def test_sorting_and_validation(self):
+        """
+        Prova [6]: `strength` serve de chave para ordenar e maximizar mãos,
+        mãos fora de 5 a 7 cartas não têm força, e a igualdade e o hash
+        continuam sendo os de identidade, mesmo para mãos parciais.
+        """
+        hands = [_hand('2h 2d 5c 8s Js'), _hand('Ah Kh Qh Jh Th'), _hand('3c 4d 9h Js Ks')]
+        ordered = sorted(hands, key=PokerHand.strength)
+        self.assertEqual([hand.cards for hand in ordered], [hands[2].cards, hands[0].cards, hands[1].cards])
+        self.assertIs(max(hands, key=PokerHand.strength), hands[1])
+        with self.assertRaises(ValueError):
+            _hand('As Ad').strength()
+        with self.assertRaises(ValueError):
+            showdown([])
+
+        partial = [PokerHand('a'), PokerHand('b')]
+        self.assertNotEqual(partial[0], partial[1])
+        self.assertIn(partial[1], partial)
+        self.assertEqual(len({*partial, *hands}), 5)
+
+if __name__ == '__main__':
+    unittest.main()
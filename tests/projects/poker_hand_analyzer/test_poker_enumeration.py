@@ -0,0 +1,69 @@
+"""
+Artefato de Verificação e Validação para `poker_enumeration`.
+
+Esta suíte prova que a contagem por chaves incrementais coincide com a
+avaliação mão a mão e reproduz a tabela exata das mãos de 5 cartas.
+"""
+
+from __future__ import annotations
+import unittest
+from collections import Counter
+from itertools import combinations
+from python_sessions.projects.poker_hand_analyzer import poker_enumeration
+from python_sessions.projects.poker_hand_analyzer.poker_enumeration import enumerate_hand_categories
+from python_sessions.projects.poker_hand_analyzer.poker_evaluator import category_of, evaluate
+
+__author__ = 'Enock Silos'
+__email__ = 'init.caucasian722@passfwd.com'
+__status__ = 'Verification'
+
+EXACT_FIVE_CARD_COUNTS = {
+    'Straight Flush': 40,
+    'Four of a Kind': 624,
+    'Full House': 3744,
+    'Flush': 5108,
+    'Straight': 10200,
+    'Three of a Kind': 54912,
+    'Two Pairs': 123552,
+    'Pair': 1098240,
+    'High Card': 1302540,
+}
+
+class TestPokerEnumeration(unittest.TestCase):
+    """
+    Suíte de provas formais para `enumerate_hand_categories`.
+    """
+
+    def test_tasks_match_direct_evaluation(self):
+        """
+        Prova [1]: Cada tarefa conta as mesmas categorias que a avaliação
+        direta de todas as suas mãos, inclusive prefixos com 5 cartas de um
+        mesmo naipe.
+        """
+        for first, second in ((13, 40), (26, 27), (30, 33), (40, 41)):
+            for cards_per_hand in (5, 6, 7):
+                rest = range(second + 1, 52)
+                expected = Counter(
+                    category_of(evaluate((first, second, *others)))
+                    for others in combinations(rest, cards_per_hand - 2)
+                )
+                counts = poker_enumeration._count_task((first, second, cards_per_hand))
+                self.assertEqual(counts, [expected[category] for category in range(len(counts))])
+
+    def test_exact_five_card_table(self):
+        """
+        Prova [2]: A enumeração das C(52, 5) mãos reproduz a tabela clássica,
+        em série e em paralelo.
+        """
+        self.assertEqual(enumerate_hand_categories(5), EXACT_FIVE_CARD_COUNTS)
+        self.assertEqual(enumerate_hand_categories(5, workers=2, tasks_per_chunk=64), EXACT_FIVE_CARD_COUNTS)
+
+    def test_invalid_hand_size(self):
+        """
+        Prova [3]: Tamanhos de mão fora de 5 a 7 são rejeitados.
+        """
+        with self.assertRaises(ValueError):
+            enumerate_hand_categories(4)
+
+if __name__ == '__main__':
+    unittest.main()
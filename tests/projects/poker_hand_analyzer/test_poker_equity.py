@@ -0,0 +1,125 @@
+"""
+Artefato de Verificação e Validação para `poker_equity`.
+
+Esta suíte prova que a equidade enumerada coincide com uma avaliação
+direta de todas as mesas, que o Monte Carlo converge para ela e que
+consultas isomórficas por naipe compartilham o cache.
+"""
+
+from __future__ import annotations
+import unittest
+from itertools import combinations
+from python_sessions.object_oriented_programming.card_game_inheritance import Card
+from python_sessions.projects.poker_hand_analyzer.poker_equity import EquityCalculator
+from python_sessions.projects.poker_hand_analyzer.poker_evaluator import encode_card, evaluate
+
+__author__ = 'Enock Silos'
+__email__ = 'init.caucasian722@passfwd.com'
+__status__ = 'Verification'
+
+CLUBS, DIAMONDS, HEARTS, SPADES = range(4)
+
+def _card(suit, rank):
+    """
+    Atalho para `encode_card`.
+    """
+    return encode_card(suit, rank)
+
+def _brute_force_equity(holes, board):
+    """
+    Referência ingênua: avalia cada jogador em cada mesa possível.
+    """
+    used = set(board).union(*holes)
+    remaining = [card for card in range(52) if card not in used]
+    totals = [0.0] * len(holes)
+    count = 0
+    for runout in combinations(remaining, 5 - len(board)):
+        strengths = [evaluate([*board, *runout, *hole]) for hole in holes]
+        best = max(strengths)
+        for player, strength in enumerate(strengths):
+            if strength == best:
+                totals[player] += 1 / strengths.count(best)
+        count += 1
+    return [total / count for total in totals]
+
+class TestEquityCalculator(unittest.TestCase):
+    """
+    Suíte de provas formais para `EquityCalculator`.
+    """
+
+    def setUp(self):
+        """
+        Prepara uma calculadora com semente fixa e uma situação de flop.
+        """
+        self.sut = EquityCalculator(seed=7)
+        self.holes = [
+            (_card(SPADES, 1), _card(SPADES, 13)),
+            (_card(HEARTS, 12), _card(DIAMONDS, 12)),
+            (_card(CLUBS, 9), _card(CLUBS, 8)),
+        ]
+        self.flop = (_card(SPADES, 2), _card(SPADES, 7), _card(CLUBS, 10))
+
+    def test_exhaustive_matches_brute_force(self):
+        """
+        Prova [1]: No flop e no turn, a equidade multiway é exata.
+        """
+        for board in (self.flop, self.flop + (_card(HEARTS, 4),)):
+            expected = _brute_force_equity(self.holes, board)
+            for actual, reference in zip(self.sut.equity(self.holes, board), expected):
+                self.assertAlmostEqual(actual, reference, places=12)
+
+    def test_monte_carlo_converges(self):
+        """
+        Prova [2]: Com a enumeração desativada, o Monte Carlo se aproxima
+        da equidade exata.
+        """
+        sampler = EquityCalculator(trials=20_000, exhaustive_limit=0, seed=1)
+        exact = self.sut.equity(self.holes[:2], self.flop)
+        for estimate, reference in zip(sampler.equity(self.holes[:2], self.flop), exact):
+            self.assertAlmostEqual(estimate, reference, delta=0.015)
+
+    def test_split_pot_and_card_objects(self):
+        """
+        Prova [3]: Um straight flush real na mesa divide o pote, e objetos
+        `Card` são aceitos como entrada.
+        """
+        board = [Card(HEARTS, rank) for rank in (1, 13, 12, 11, 10)]
+        hands = [[Card(CLUBS, 2), Card(CLUBS, 3)], [Card(SPADES, 1), Card(SPADES, 13)]]
+        self.assertEqual(self.sut.equity(hands, board), [0.5, 0.5])
+
+    def test_isomorphic_queries_share_cache(self):
+        """
+        Prova [4]: Trocar os naipes (e a ordem das cartas) reutiliza a mesma
+        entrada do cache e o mesmo resultado.
+        """
+        first = self.sut.equity(self.holes[:2], self.flop)
+        swap = {SPADES: HEARTS, HEARTS: SPADES, DIAMONDS: CLUBS, CLUBS: DIAMONDS}
+        relabel = lambda cards: tuple(_card(swap[card // 13], card % 13 + 1) for card in reversed(cards))
+        second = self.sut.equity([relabel(hole) for hole in self.holes[:2]], relabel(self.flop))
+        self.assertEqual(second, first)
+        self.assertEqual(self.sut.cache_info()['size'], 1)
+
+    def test_range_equity(self):
+        """
+        Prova [5]: Contra uma faixa, a equidade é a média sobre as
+        combinações compatíveis (a que colide com a mesa é descartada).
+        """
+        hero = self.holes[0]
+        villains = [self.holes[1], (_card(SPADES, 2), _card(CLUBS, 2)), (_card(CLUBS, 9), _card(CLUBS, 8))]
+        expected = (self.sut.equity([hero, villains[0]], self.flop)[0] + self.sut.equity([hero, villains[2]], self.flop)[0]) / 2
+        self.assertAlmostEqual(self.sut.range_equity(hero, [villains], self.flop), expected, places=12)
+
+        with self.assertRaises(ValueError):
+            self.sut.range_equity(hero, [[(_card(SPADES, 2), _card(CLUBS, 2))]], self.flop)
+
+    def test_invalid_inputs(self):
+        """
+        Prova [6]: Cartas repetidas ou jogadores insuficientes são rejeitados.
+        """
+        with self.assertRaises(ValueError):
+            self.sut.equity([self.holes[0], self.holes[0]])
+        with self.assertRaises(ValueError):
+            self.sut.equity([self.holes[0]])
+
+if __name__ == '__main__':
+    unittest.main()
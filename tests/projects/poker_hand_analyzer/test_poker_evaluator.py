@@ -0,0 +1,128 @@
+"""
+Artefato de Verificação e Validação para `poker_evaluator`.
+
+Esta suíte prova que o avaliador de cartas codificadas classifica as mãos
+como os métodos de diagnóstico de `PokerHand` e que, com 6 ou 7 cartas,
+a força é a da melhor mão de 5 cartas contida nelas.
+"""
+
+from __future__ import annotations
+import random
+import unittest
+from itertools import combinations
+from python_sessions.object_oriented_programming.card_game_inheritance import Card
+from python_sessions.projects.poker_hand_analyzer.poker_analyser import PokerHand
+from python_sessions.projects.poker_hand_analyzer.poker_evaluator import (
+    HAND_CATEGORIES,
+    category_name,
+    encode_card,
+    evaluate,
+    evaluate_with_board,
+    flush_suit,
+    rank_key,
+    rank_strength,
+    strength_from_keys,
+    suit_key
+)
+
+__author__ = 'Enock Silos'
+__email__ = 'init.caucasian722@passfwd.com'
+__status__ = 'Verification'
+
+CLUBS, DIAMONDS, HEARTS, SPADES = range(4)
+
+def _codes(*cards):
+    """
+    Codifica pares (naipe, valor).
+    """
+    return [encode_card(suit, rank) for suit, rank in cards]
+
+class TestPokerEvaluator(unittest.TestCase):
+    """
+    Suíte de provas formais para `evaluate`.
+    """
+
+    def test_matches_histogram_classification(self):
+        """
+        Prova [1]: Em mãos aleatórias de 5 cartas, a categoria coincide com
+        a dos métodos `has_*` de `PokerHand`.
+        """
+        rng = random.Random(5)
+        for _ in range(3000):
+            codes = rng.sample(range(52), 5)
+            hand = PokerHand()
+            hand.cards = [Card(code // 13, code % 13 + 1) for code in codes]
+            hand._classify_by_histograms()
+            self.assertEqual(category_name(evaluate(codes)), hand.label)
+
+    def test_seven_cards_use_best_five(self):
+        """
+        Prova [2]: A força de 6 ou 7 cartas é a maior força entre os seus
+        subconjuntos de 5 cartas.
+        """
+        rng = random.Random(9)
+        for size in (6, 7):
+            for _ in range(500):
+                codes = rng.sample(range(52), size)
+                best = max(evaluate(five) for five in combinations(codes, 5))
+                self.assertEqual(evaluate(codes), best)
+
+    def test_known_hands(self):
+        """
+        Prova [3]: Casos de borda — sequência com Ás baixo, straight flush
+        real e desempate por kicker.
+        """
+        wheel = _codes((CLUBS, 1), (HEARTS, 2), (SPADES, 3), (CLUBS, 4), (DIAMONDS, 5))
+        six_high = _codes((CLUBS, 6), (HEARTS, 2), (SPADES, 3), (CLUBS, 4), (DIAMONDS, 5))
+        self.assertEqual(category_name(evaluate(wheel)), 'Straight')
+        self.assertLess(evaluate(wheel), evaluate(six_high))
+
+        royal = _codes((SPADES, 1), (SPADES, 13), (SPADES, 12), (SPADES, 11), (SPADES, 10))
+        king_high = _codes((HEARTS, 9), (HEARTS, 13), (HEARTS, 12), (HEARTS, 11), (HEARTS, 10))
+        self.assertEqual(category_name(evaluate(royal)), HAND_CATEGORIES[-1])
+        self.assertGreater(evaluate(royal), evaluate(king_high))
+
+        aces_king = _codes((CLUBS, 1), (HEARTS, 1), (SPADES, 13), (CLUBS, 4), (DIAMONDS, 5), (HEARTS, 8), (CLUBS, 9))
+        aces_queen = aces_king[:2] + _codes((SPADES, 12)) + aces_king[3:]
+        self.assertEqual(category_name(evaluate(aces_king)), 'Pair')
+        self.assertGreater(evaluate(aces_king), evaluate(aces_queen))
+
+    def test_poker_hand_classify_uses_evaluator(self):
+        """
+        Prova [4]: `PokerHand.classify` rotula mãos de 7 cartas e ainda
+        classifica mãos de outros tamanhos (incluindo o Par).
+        """
+        hand = PokerHand()
+        hand.cards = [Card(CLUBS, 9), Card(HEARTS, 9), Card(SPADES, 2)]
+        hand.classify()
+        self.assertEqual(hand.label, 'Pair')
+
+        hand.cards += [Card(DIAMONDS, 9), Card(CLUBS, 2), Card(HEARTS, 4), Card(SPADES, 7)]
+        hand.classify()
+        self.assertEqual(hand.label, 'Full House')
+
+    def test_incremental_keys_match_evaluate(self):
+        """
+        Prova [5]: Chaves somadas carta a carta e `evaluate_with_board`
+        reproduzem `evaluate`, com e sem flush.
+        """
+        rng = random.Random(5)
+        flushes = 0
+        for _ in range(3000):
+            cards = rng.sample(range(52), rng.choice((5, 6, 7)))
+            ranks, suits = sum(map(rank_key, cards)), sum(map(suit_key, cards))
+            self.assertEqual(strength_from_keys(ranks, suits, cards), evaluate(cards))
+            if flush_suit(suits) < 0:
+                self.assertEqual(rank_strength(ranks), evaluate(cards))
+            else:
+                flushes += 1
+                self.assertGreaterEqual(sum(card // 13 == flush_suit(suits) for card in cards), 5)
+        self.assertGreater(flushes, 0)
+
+        for _ in range(500):
+            cards = rng.sample(range(52), 11)
+            board, holes = cards[:5], [cards[5:7], cards[7:9], cards[9:]]
+            self.assertEqual(evaluate_with_board(board, holes), [evaluate(board + hole) for hole in holes])
+
+if __name__ == '__main__':
+    unittest.main()
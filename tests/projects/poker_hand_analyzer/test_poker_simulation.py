@@ -0,0 +1,85 @@
+"""
+Artefato de Verificação e Validação para `poker_simulation`.
+
+Esta suíte prova que a classificação vetorizada coincide, mão a mão, com o
+avaliador por tabelas, que a distribuição em bloco segue a ordem de
+`Deck.deal_hands` e que a simulação funciona com e sem NumPy.
+"""
+
+from __future__ import annotations
+import random
+import unittest
+from unittest import mock
+from python_sessions.object_oriented_programming.card_game_inheritance import Deck
+from python_sessions.projects.poker_hand_analyzer import poker_simulation
+from python_sessions.projects.poker_hand_analyzer.poker_evaluator import (
+    HAND_CATEGORIES,
+    category_of,
+    encode_cards,
+    evaluate
+)
+from python_sessions.projects.poker_hand_analyzer.poker_simulation import simulate_poker_vectorized
+
+__author__ = 'Enock Silos'
+__email__ = 'init.caucasian722@passfwd.com'
+__status__ = 'Verification'
+
+np = poker_simulation.np
+
+@unittest.skipIf(np is None, 'NumPy não está instalado.')
+class TestVectorizedClassification(unittest.TestCase):
+    """
+    Suíte de provas formais para `classify_hands` e `deal_hands`.
+    """
+
+    def test_matches_evaluator(self):
+        """
+        Prova [1]: Em mãos aleatórias de 5, 6 e 7 cartas, a categoria
+        vetorizada é a mesma do avaliador por tabelas.
+        """
+        rng = random.Random(3)
+        for size in (5, 6, 7):
+            hands = [rng.sample(range(52), size) for _ in range(20_000)]
+            expected = [category_of(evaluate(hand)) for hand in hands]
+            self.assertEqual(poker_simulation.classify_hands(np.array(hands)).tolist(), expected)
+
+    def test_deal_follows_round_robin(self):
+        """
+        Prova [2]: As mãos fatiadas de um baralho são as mesmas que
+        `Deck.deal_hands` distribui do mesmo baralho.
+        """
+        decks = poker_simulation.deal_decks(3, np.random.default_rng(0))
+        for deck_codes, dealt in zip(decks, poker_simulation.deal_hands(decks, 4, 7).reshape(3, 4, 7)):
+            deck = Deck()
+            deck.cards = [deck.cards[code] for code in deck_codes.tolist()]
+            hands = deck.deal_hands(4, 7)
+            self.assertEqual([encode_cards(hand.cards) for hand in hands], dealt.tolist())
+
+class TestSimulatePokerVectorized(unittest.TestCase):
+    """
+    Suíte de provas formais para `simulate_poker_vectorized`.
+    """
+
+    def test_counts_and_reproducibility(self):
+        """
+        Prova [3]: Cada mão recebe exatamente um rótulo, e a mesma semente
+        reproduz as mesmas contagens, com e sem NumPy.
+        """
+        for numpy_module in {np, None}:
+            with mock.patch.object(poker_simulation, 'np', numpy_module):
+                counts = simulate_poker_vectorized(2000, 5, 7, seed=11, batch_size=300)
+                self.assertEqual(list(counts), list(reversed(HAND_CATEGORIES)))
+                self.assertEqual(sum(counts.values()), 10_000)
+                self.assertEqual(simulate_poker_vectorized(2000, 5, 7, seed=11, batch_size=300), counts)
+
+    def test_invalid_deal(self):
+        """
+        Prova [4]: Distribuições que não cabem no baralho são rejeitadas.
+        """
+        with self.assertRaises(ValueError):
+            simulate_poker_vectorized(10, num_hands=8, cards_per_hand=7)
+        with self.assertRaises(ValueError):
+            simulate_poker_vectorized(10, num_hands=2, cards_per_hand=4)
+
+if __name__ == '__main__':
+    unittest.main()
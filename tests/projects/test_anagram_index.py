@@ -0,0 +1,73 @@
+"""
+Artefato de Verificação e Validação para `anagram_index`.
+
+Esta suíte prova que a trie podada de vetores de contagem encontra
+exatamente as mesmas palavras que uma varredura linear por multiconjuntos.
+"""
+
+from __future__ import annotations
+import unittest
+from collections import Counter
+from python_sessions.projects.anagram_index import AnagramIndex, signature
+
+__author__ = 'Enock Silos'
+__email__ = 'init.caucasian722@passfwd.com'
+__status__ = 'Verification'
+
+SAMPLE_WORDS = [
+    'listen', 'silent', 'enlist', 'tinsel', 'inlets', 'stone', 'tones',
+    'notes', 'onset', 'set', 'ten', 'net', 'nest', 'sent', 'tent', 'test',
+    'quiz', 'zebra', 'a', 'aa', 'aaa', 'letters', 'settle', 'street'
+] * 3
+
+def _linear_scan(words, letters, min_length=1):
+    """
+    Referência ingênua: verifica o multiconjunto de cada palavra.
+    """
+    available = Counter(letters)
+    found = {word for word in words if len(word) >= min_length and not Counter(word) - available}
+    return sorted(found, key=lambda word: (-len(word), word))
+
+class TestAnagramIndex(unittest.TestCase):
+    """
+    Suíte de provas formais para `AnagramIndex`.
+    """
+
+    def setUp(self):
+        """
+        Constrói o índice sobre um dicionário reduzido (com duplicatas).
+        """
+        self.sut = AnagramIndex(SAMPLE_WORDS)
+
+    def test_anagrams_share_signature(self):
+        """
+        Prova [1]: Os anagramas são as palavras com a mesma assinatura,
+        sem duplicatas, independentemente da caixa da consulta.
+        """
+        self.assertEqual(signature('Listen'), 'eilnst')
+        self.assertEqual(self.sut.anagrams('SILENT'), ['enlist', 'inlets', 'listen', 'silent', 'tinsel'])
+        self.assertEqual(self.sut.anagrams('xyz'), [])
+
+    def test_formable_matches_linear_scan(self):
+        """
+        Prova [2]: As palavras formáveis coincidem com a varredura linear,
+        inclusive com letras repetidas, letras desconhecidas, comprimento
+        mínimo e folhas de uma única assinatura.
+        """
+        deep_trie = AnagramIndex(SAMPLE_WORDS, leaf_size=1)
+        for letters in ('listen', 'tteessnlo', 'aa', 'zzquibare', 'street', '', '?!a'):
+            for min_length in (1, 4):
+                expected = _linear_scan(SAMPLE_WORDS, letters, min_length)
+                self.assertEqual(self.sut.formable(letters, min_length), expected)
+                self.assertEqual(deep_trie.formable(letters, min_length), expected)
+
+    def test_batch_queries(self):
+        """
+        Prova [3]: As consultas em lote equivalem às consultas individuais.
+        """
+        racks = ['stone', 'notes', 'quiz']
+        self.assertEqual(self.sut.formable_many(racks), {rack: self.sut.formable(rack) for rack in racks})
+        self.assertEqual(self.sut.anagrams_many(['onset']), {'onset': ['notes', 'onset', 'stone', 'tones']})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+Artefato de Verificação e Validação para `hangman_simulator`.
+
+Esta suíte prova as regras do motor de partidas sem interface e a
+reprodutibilidade da simulação em larga escala, independentemente do
+número de processos.
+"""
+
+from __future__ import annotations
+import os
+import tempfile
+import unittest
+from python_sessions.projects.hangman_simulator import (
+    LetterFrequencyStrategy,
+    StaticOrderStrategy,
+    play_game,
+    simulate_games
+)
+from python_sessions.projects.hangman_solver import HangmanSolver
+from python_sessions.projects.word_index import WordIndex
+
+__author__ = 'Enock Silos'
+__email__ = 'init.caucasian722@passfwd.com'
+__status__ = 'Verification'
+
+SAMPLE_WORDS = ['banana', 'bandana', 'cabana', 'canals', 'mammal', 'pajama', 'zebra', 'quiz']
+
+class TestPlayGame(unittest.TestCase):
+    """
+    Suíte de provas formais para `play_game`.
+    """
+
+    def setUp(self):
+        """
+        Constrói o solucionador sobre um dicionário reduzido.
+        """
+        self.solver = HangmanSolver(WordIndex(SAMPLE_WORDS))
+
+    def test_frequency_strategy_wins_on_small_dictionary(self):
+        """
+        Prova [1]: Com poucas candidatas, a estratégia de frequência vence
+        todas as partidas do dicionário.
+        """
+        strategy = LetterFrequencyStrategy()
+        for word in SAMPLE_WORDS:
+            with self.subTest(word=word):
+                won, errors = play_game(word, strategy, self.solver)
+                self.assertTrue(won)
+                self.assertLess(errors, 6)
+
+    def test_game_is_lost_after_max_errors(self):
+        """
+        Prova [2]: A partida termina derrotada ao atingir o limite de erros.
+        """
+        won, errors = play_game('quiz', StaticOrderStrategy('etaosnrlquiz'), self.solver)
+
+        self.assertFalse(won)
+        self.assertEqual(errors, 6)
+
+class TestSimulateGames(unittest.TestCase):
+    """
+    Suíte de provas formais para `simulate_games`.
+    """
+
+    def test_results_do_not_depend_on_worker_count(self):
+        """
+        Prova [1]: A mesma semente produz o mesmo relatório com 1 ou 2 processos.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            words_path = os.path.join(directory, 'words.txt')
+            with open(words_path, 'w', encoding='utf-8') as handle:
+                handle.write('\n'.join(SAMPLE_WORDS))
+
+            serial = simulate_games(200, seed=7, games_per_task=50, words_path=words_path)
+            parallel = simulate_games(200, seed=7, games_per_task=50, workers=2, words_path=words_path)
+
+        self.assertEqual(serial['games'], 200)
+        self.assertEqual(serial['wins'], parallel['wins'])
+        self.assertEqual(serial['average_errors'], parallel['average_errors'])
+
+if __name__ == '__main__':
+    unittest.main()
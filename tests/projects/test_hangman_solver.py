@@ -0,0 +1,88 @@
+"""
+Artefato de Verificação e Validação para `hangman_solver`.
+
+Esta suíte prova que a interseção de mapas de bits produz exatamente o
+mesmo conjunto de candidatos que uma varredura linear ingênua aplicando
+as regras do Jogo da Forca.
+"""
+
+from __future__ import annotations
+import unittest
+from python_sessions.projects.hangman_solver import HangmanSolver, build_mask
+from python_sessions.projects.word_index import WordIndex
+
+__author__ = 'Enock Silos'
+__email__ = 'init.caucasian722@passfwd.com'
+__status__ = 'Verification'
+
+SAMPLE_WORDS = [
+    'banana', 'bandana', 'cabana', 'canals', 'mammal', 'salsas',
+    'tartan', 'vandal', 'pajama', 'madam', 'apple', 'zebras'
+]
+
+def _linear_scan(words, mask, guessed):
+    """
+    Referência ingênua: aplica as regras do jogo palavra a palavra.
+    """
+    guessed = set(guessed) | (set(mask) - {'_'})
+    return [
+        word for word in sorted(words)
+        if len(word) == len(mask) and all(
+            word[i] == char if char != '_' else word[i] not in guessed
+            for i, char in enumerate(mask)
+        )
+    ]
+
+class TestHangmanSolver(unittest.TestCase):
+    """
+    Suíte de provas formais para `HangmanSolver`.
+    """
+
+    def setUp(self):
+        """
+        Constrói o solucionador sobre um dicionário reduzido.
+        """
+        self.sut = HangmanSolver(WordIndex(SAMPLE_WORDS))
+
+    def test_matches_linear_scan(self):
+        """
+        Prova [1]: Para várias máscaras e letras tentadas, os candidatos
+        coincidem com a varredura linear.
+        """
+        cases = [
+            ('______', ''),
+            ('_a_a__', ''),
+            ('_a_a__', 'n'),
+            ('_a_a_a', 'e'),
+            ('ma__a_', 'z'),
+            ('_____', 'aeiou'),
+        ]
+        for mask, guessed in cases:
+            with self.subTest(mask=mask, guessed=guessed):
+                self.assertEqual(
+                    self.sut.candidates(mask, guessed),
+                    _linear_scan(SAMPLE_WORDS, mask, guessed)
+                )
+                self.assertEqual(
+                    self.sut.count_candidates(mask, guessed),
+                    len(_linear_scan(SAMPLE_WORDS, mask, guessed))
+                )
+
+    def test_unknown_length_has_no_candidates(self):
+        """
+        Prova [2]: Uma máscara sem palavras daquele comprimento retorna vazio.
+        """
+        self.assertEqual(self.sut.candidates('___'), [])
+
+    def test_game_state_integration(self):
+        """
+        Prova [3]: O estado de `run_hangman_game` é convertido em máscara.
+        """
+        self.assertEqual(build_mask('banana', ['a']), '_a_a_a')
+        self.assertEqual(
+            self.sut.candidates_for_game('banana', ['a', 'e'], ['a']),
+            ['banana', 'cabana', 'pajama']
+        )
+
+if __name__ == '__main__':
+    unittest.main()
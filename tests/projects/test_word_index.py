@@ -0,0 +1,103 @@
+"""
+Artefato de Verificação e Validação para `word_index`.
+
+Esta suíte prova que o índice de palavras normaliza a lista de origem,
+responde corretamente às consultas por pertença, prefixo, comprimento e
+padrão de letras, e que o formato binário pré-construído preserva o
+índice integralmente.
+"""
+
+from __future__ import annotations
+import os
+import tempfile
+import unittest
+from python_sessions.projects.word_index import (
+    WordIndex,
+    load_word_index
+)
+
+__author__ = 'Enock Silos'
+__email__ = 'init.caucasian722@passfwd.com'
+__status__ = 'Verification'
+
+SAMPLE_WORDS = ['Banana', 'canals', 'band', 'bandana', 'ban', 'cat', 'banana', 'zebra']
+
+class TestWordIndex(unittest.TestCase):
+    """
+    Suíte de provas formais para as consultas de `WordIndex`.
+    """
+
+    def setUp(self):
+        """
+        Constrói o índice de referência.
+        """
+        self.sut = WordIndex(SAMPLE_WORDS)
+
+    def test_words_are_normalized_sorted_and_unique(self):
+        """
+        Prova [1]: As palavras ficam em minúsculas, ordenadas e sem duplicatas.
+        """
+        self.assertEqual(
+            self.sut.words,
+            ('ban', 'banana', 'band', 'bandana', 'canals', 'cat', 'zebra')
+        )
+
+    def test_membership(self):
+        """
+        Prova [2]: A pertença é exata (sem falsos positivos por prefixo).
+        """
+        self.assertIn('band', self.sut)
+        self.assertNotIn('bandan', self.sut)
+        self.assertNotIn(42, self.sut)
+
+    def test_prefix_lookup(self):
+        """
+        Prova [3]: Todas as palavras com o prefixo são retornadas, e só elas.
+        """
+        self.assertEqual(self.sut.with_prefix('band'), ('band', 'bandana'))
+        self.assertEqual(self.sut.with_prefix('x'), ())
+
+    def test_length_and_pattern_queries(self):
+        """
+        Prova [4]: Consultas por comprimento e por padrão de letras.
+        """
+        self.assertEqual(self.sut.of_length(3), ['ban', 'cat'])
+        self.assertEqual(self.sut.matching('_a_a__'), ['banana', 'canals'])
+        self.assertEqual(self.sut.matching('_____________'), [])
+
+class TestPrebuiltIndex(unittest.TestCase):
+    """
+    Suíte de provas formais para a serialização e o carregamento em cache.
+    """
+
+    def test_save_and_load_round_trip(self):
+        """
+        Prova [1]: O binário salvo reconstrói exatamente o mesmo índice, e
+        `load_word_index` o gera e o reaproveita.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            source = os.path.join(directory, 'words.txt')
+            with open(source, 'w', encoding='utf-8') as handle:
+                handle.write('\n'.join(SAMPLE_WORDS))
+
+            first = load_word_index(source)
+            prebuilt = os.path.join(directory, 'words.idx')
+
+            self.assertTrue(os.path.exists(prebuilt))
+            self.assertIs(load_word_index(source), first)
+            self.assertEqual(WordIndex.load(prebuilt).words, first.words)
+
+    def test_invalid_binary_is_rejected(self):
+        """
+        Prova [2]: Um arquivo sem a assinatura do formato é rejeitado.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            invalid = os.path.join(directory, 'words.idx')
+            with open(invalid, 'wb') as handle:
+                handle.write(b'not an index')
+
+            with self.assertRaises(ValueError):
+                WordIndex.load(invalid)
+
+if __name__ == '__main__':
+    unittest.main()